@@ -15,6 +15,7 @@ import Broadcast from './pages/Broadcast';
 import ActivityLogs from './pages/ActivityLogs';
 import StorageManagement from './pages/StorageManagement';
 import Login from './pages/Login';
+import { logoutSession } from './services/api';
 
 const App = () => {
     const [userToken, setUserToken] = useState(localStorage.getItem('userToken'));
@@ -47,8 +48,10 @@ const App = () => {
         };
     }, [userToken]);
 
-    const handleLogout = () => {
+    const handleLogout = async () => {
+        await logoutSession();
         localStorage.removeItem('userToken');
+        localStorage.removeItem('refreshToken');
         localStorage.removeItem('userInfo');
         setUserToken(null);
         setUserInfo(null);
@@ -20,7 +20,7 @@ const Login = ({ onLoginSuccess }) => {
                 password
             });
 
-            const { token, roles, ...userInfo } = response.data;
+            const { token, refreshToken, roles, ...userInfo } = response.data;
 
             // Check if admin
             if (!roles || !roles.includes('ADMIN')) {
@@ -31,6 +31,7 @@ const Login = ({ onLoginSuccess }) => {
 
             // Save to localStorage
             localStorage.setItem('userToken', token);
+            localStorage.setItem('refreshToken', refreshToken);
             localStorage.setItem('userInfo', JSON.stringify({ ...userInfo, roles }));
 
             // Callback
@@ -1,5 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import adminService from '../services/adminService';
+import { logoutSession } from '../services/api';
 import { useNavigate } from 'react-router-dom';
 
 const Profile = () => {
@@ -34,8 +35,10 @@ const Profile = () => {
         }
     };
 
-    const handleLogout = () => {
+    const handleLogout = async () => {
+        await logoutSession();
         localStorage.removeItem('userToken');
+        localStorage.removeItem('refreshToken');
         localStorage.removeItem('userInfo');
         navigate('/login');
     };
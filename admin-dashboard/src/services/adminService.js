@@ -61,6 +61,12 @@ const adminService = {
     handoverItem: (itemId, handoverData) => api.post(`/admin/items/${itemId}/handover`, handoverData),
     archiveItem: (itemId) => api.post(`/admin/items/${itemId}/archive`),
     disposeItem: (itemId) => api.post(`/admin/items/${itemId}/dispose`),
+    // payload: { action: 'archive' | 'dispose' | 'status' | 'storage', item_ids | filter, status?, storage_location? }
+    bulkItemOperation: (payload) => api.post('/admin/items/bulk', payload),
+    // formData: { file } CSV with category, location, storage_location (+ description, admin_remarks, dateTime, imageUrl)
+    importFoundItems: (formData) => api.post('/admin/items/import', formData, {
+        headers: { 'Content-Type': 'multipart/form-data' }
+    }),
     sendBroadcast: (broadcastData) => api.post('/admin/broadcast', broadcastData),
     getItemContext: (itemId) => api.get(`/admin/items/${itemId}/context`),
     linkItems: (itemId, linkedItemId) => api.put(`/admin/items/${itemId}/link`, { linked_item_id: linkedItemId }),
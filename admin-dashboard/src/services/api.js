@@ -20,21 +20,66 @@ api.interceptors.request.use(
     }
 );
 
+// Access tokens are short-lived; renew them with the stored refresh token.
+// Concurrent 401s share one refresh call so the refresh token is rotated once.
+let refreshPromise = null;
+
+const refreshAccessToken = () => {
+    if (!refreshPromise) {
+        const refreshToken = localStorage.getItem('refreshToken');
+        refreshPromise = (refreshToken
+            ? axios.post(`${API_BASE_URL}/api/auth/refresh`, { refreshToken }).then(({ data }) => {
+                localStorage.setItem('userToken', data.token);
+                localStorage.setItem('refreshToken', data.refreshToken);
+                return data.token;
+            })
+            : Promise.reject(new Error('No refresh token'))
+        ).finally(() => {
+            refreshPromise = null;
+        });
+    }
+    return refreshPromise;
+};
+
 // Response interceptor for handling errors (e.g., 401)
 api.interceptors.response.use(
     (response) => {
         return response;
     },
-    (error) => {
-        if (error.response && error.response.status === 401) {
-            console.log('Unauthorized, logging out...');
-            localStorage.removeItem('userToken');
-            localStorage.removeItem('userInfo');
-            window.location.href = '/login';
+    async (error) => {
+        const original = error.config;
+        if (error.response && error.response.status === 401 && original && !original._retried) {
+            original._retried = true;
+            try {
+                const token = await refreshAccessToken();
+                original.headers.Authorization = `Bearer ${token}`;
+                return api(original);
+            } catch (refreshError) {
+                console.log('Unauthorized, logging out...');
+                localStorage.removeItem('userToken');
+                localStorage.removeItem('refreshToken');
+                localStorage.removeItem('userInfo');
+                window.location.href = '/login';
+            }
         }
         return Promise.reject(error);
     }
 );
 
+// Ends the server-side session before the caller clears its tokens. Plain axios
+// skips the 401 handling above; a failed call (offline, session already gone)
+// is ignored since the refresh session expires on its own.
+const logoutSession = async () => {
+    const refreshToken = localStorage.getItem('refreshToken');
+    if (!refreshToken) {
+        return;
+    }
+    try {
+        await axios.post(`${API_BASE_URL}/api/auth/logout`, { refreshToken }, { timeout: 5000 });
+    } catch (error) {
+        console.log('Logout request failed, clearing the local session anyway', error);
+    }
+};
+
 export default api;
-export { API_BASE_URL };
+export { API_BASE_URL, logoutSession };
@@ -0,0 +1,12 @@
+"""
+Admin API. Every route below is guarded once, at the router level, by
+require_admin instead of a role check inside each handler.
+"""
+from fastapi import APIRouter, Depends
+from app.api.deps import require_admin
+from app.api.admin import stats, items, storage, claims, analytics, notifications, audit, scheduler, export
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+for module in (stats, items, storage, claims, analytics, notifications, audit, scheduler, export):
+    router.include_router(module.router)
@@ -0,0 +1,225 @@
+from fastapi import APIRouter, Depends, Query
+from datetime import datetime, timedelta
+from functools import partial
+from app.core.database import get_database
+from app.core.concurrency import gather_limited
+
+router = APIRouter()
+
+# ============ ISSUE 5: ADVANCED ANALYTICS ============
+
+@router.get("/analytics/trends")
+async def get_analytics_trends(
+    days: int = Query(30, description="Number of days to analyze"),
+    db = Depends(get_database)
+):
+    """Get trend data for items and claims over time"""
+    now = datetime.utcnow()
+    start_date = now - timedelta(days=days)
+    
+    # Daily lost/found item trends
+    days_list = []
+    queries = []
+    for i in range(days):
+        day_start = (start_date + timedelta(days=i)).replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=1)
+        days_list.append(day_start)
+        queries += [
+            partial(db["items"].count_documents, {
+                "type": "LOST",
+                "dateTime": {"$gte": day_start, "$lt": day_end}
+            }),
+            partial(db["items"].count_documents, {
+                "type": "FOUND",
+                "dateTime": {"$gte": day_start, "$lt": day_end}
+            }),
+            partial(db["items"].count_documents, {
+                "status": {"$in": ["RETURNED", "RESOLVED"]},
+                "handed_over_at": {"$gte": day_start, "$lt": day_end}
+            }),
+            partial(db["claims"].count_documents, {
+                "submissionDate": {"$gte": day_start, "$lt": day_end}
+            })
+        ]
+    
+    counts = await gather_limited(*queries)
+    
+    daily_trends = []
+    for i, day_start in enumerate(days_list):
+        lost_count, found_count, resolved_count, claims_count = counts[i * 4:i * 4 + 4]
+        daily_trends.append({
+            "date": day_start.strftime("%Y-%m-%d"),
+            "lost": lost_count,
+            "found": found_count,
+            "resolved": resolved_count,
+            "claims": claims_count
+        })
+    
+    return daily_trends
+
+
+@router.get("/analytics/bottlenecks")
+async def get_bottleneck_analysis(
+    db = Depends(get_database)
+):
+    """Identify bottlenecks in the system"""
+    now = datetime.utcnow()
+    
+    categories = ["DOCUMENTS", "DEVICES", "ACCESSORIES", "PERSONAL_ITEMS", "KEYS", "BOOKS", "JEWELLERY", "OTHERS"]
+    category_queries = []
+    for cat in categories:
+        category_queries += [
+            partial(db["items"].count_documents, {"category": cat, "status": {"$in": ["PENDING", "AVAILABLE"]}}),
+            partial(db["items"].count_documents, {"category": cat}),
+            partial(db["items"].count_documents, {"category": cat, "status": {"$in": ["RETURNED", "RESOLVED"]}})
+        ]
+    
+    (
+        returned_items, processing_stats, stale_items_count,
+        old_pending_claims, unverified_items, *category_counts
+    ) = await gather_limited(
+        # 1. Found items that have been handed over (resolution time)
+        partial(db["items"].find({
+            "type": "FOUND",
+            "status": {"$in": ["RETURNED", "RESOLVED"]},
+            "dateTime": {"$exists": True},
+            "handed_over_at": {"$exists": True}
+        }).to_list, 200),
+        # 2. Claim processing time (stamped on the claim when it is decided)
+        partial(db["claims"].aggregate([
+            {"$match": {
+                "status": {"$in": ["APPROVED", "REJECTED"]},
+                "processing_hours": {"$type": "number"}
+            }},
+            {"$group": {
+                "_id": None,
+                "avg_hours": {"$avg": "$processing_hours"},
+                "count": {"$sum": 1}
+            }}
+        ]).to_list, 1),
+        # 4. Stale items (available but no claims for >7 days)
+        partial(db["items"].count_documents, {
+            "status": "AVAILABLE",
+            "dateTime": {"$lte": now - timedelta(days=7)}
+        }),
+        # 5. Pending claims older than 24 hours
+        partial(db["claims"].count_documents, {
+            "status": "PENDING",
+            "submissionDate": {"$lte": now - timedelta(hours=24)}
+        }),
+        # 6. Unverified items
+        partial(db["items"].count_documents, {"status": "PENDING"}),
+        # 3. Per-category pending / total / resolved counts
+        *category_queries
+    )
+    
+    # 1. Average time from found to returned (resolution time)
+    resolution_times = []
+    for item in returned_items:
+        if item.get("dateTime") and item.get("handed_over_at"):
+            delta = (item["handed_over_at"] - item["dateTime"]).total_seconds() / 3600
+            resolution_times.append(delta)
+    
+    avg_resolution_hours = round(sum(resolution_times) / len(resolution_times), 1) if resolution_times else 0
+    
+    # 2. Average claim processing time
+    avg_claim_hours = round(processing_stats[0]["avg_hours"], 1) if processing_stats else 0
+    claim_sample_size = processing_stats[0]["count"] if processing_stats else 0
+    
+    # 3. Slowest categories (most items still pending)
+    category_bottlenecks = []
+    for i, cat in enumerate(categories):
+        pending, total, resolved = category_counts[i * 3:i * 3 + 3]
+        rate = round((resolved / total * 100), 1) if total > 0 else 0
+        category_bottlenecks.append({
+            "category": cat,
+            "pending_items": pending,
+            "total_items": total,
+            "resolved_items": resolved,
+            "resolution_rate": rate
+        })
+    
+    category_bottlenecks.sort(key=lambda x: x["resolution_rate"])
+    
+    return {
+        "resolution_time": {
+            "avg_hours": avg_resolution_hours,
+            "sample_size": len(resolution_times)
+        },
+        "claim_processing_time": {
+            "avg_hours": avg_claim_hours,
+            "sample_size": claim_sample_size
+        },
+        "category_performance": category_bottlenecks,
+        "stale_available_items": stale_items_count,
+        "overdue_pending_claims": old_pending_claims,
+        "unverified_items": unverified_items,
+        "bottleneck_alerts": [
+            alert for alert in [
+                {"type": "OVERDUE_CLAIMS", "message": f"{old_pending_claims} claims pending > 24h", "severity": "HIGH"} if old_pending_claims > 0 else None,
+                {"type": "STALE_ITEMS", "message": f"{stale_items_count} items available > 7 days with no claims", "severity": "MEDIUM"} if stale_items_count > 0 else None,
+                {"type": "UNVERIFIED", "message": f"{unverified_items} items awaiting verification", "severity": "LOW"} if unverified_items > 0 else None,
+                {"type": "SLOW_RESOLUTION", "message": f"Avg resolution: {avg_resolution_hours}h", "severity": "HIGH"} if avg_resolution_hours > 72 else None,
+            ] if alert is not None
+        ]
+    }
+
+
+@router.get("/analytics/category-performance")
+async def get_category_performance(
+    db = Depends(get_database)
+):
+    """Detailed performance per category"""
+    categories = ["DOCUMENTS", "DEVICES", "ACCESSORIES", "PERSONAL_ITEMS", "KEYS", "BOOKS", "JEWELLERY", "OTHERS"]
+    now = datetime.utcnow()
+    
+    queries = []
+    for cat in categories:
+        queries += [
+            partial(db["items"].count_documents, {"type": "LOST", "category": cat}),
+            partial(db["items"].count_documents, {"type": "FOUND", "category": cat}),
+            partial(db["items"].count_documents, {"category": cat, "status": {"$in": ["RETURNED", "RESOLVED"]}}),
+            partial(db["items"].count_documents, {"category": cat, "status": {"$in": ["PENDING", "AVAILABLE"]}}),
+            # Item ids for the claims stats of this category
+            partial(db["items"].find({"category": cat}, {"_id": 1}).to_list, 500),
+            # Last 7 days activity
+            partial(db["items"].count_documents, {
+                "type": "LOST", "category": cat,
+                "dateTime": {"$gte": now - timedelta(days=7)}
+            }),
+            partial(db["items"].count_documents, {
+                "type": "FOUND", "category": cat,
+                "dateTime": {"$gte": now - timedelta(days=7)}
+            })
+        ]
+    item_stats = await gather_limited(*queries)
+    
+    # Claims stats per category depend on the item ids fetched above
+    claim_queries = []
+    for i in range(len(categories)):
+        item_ids = [str(item["_id"]) for item in item_stats[i * 7 + 4]]
+        claim_queries += [
+            partial(db["claims"].count_documents, {"item_id": {"$in": item_ids}}),
+            partial(db["claims"].count_documents, {"item_id": {"$in": item_ids}, "status": "APPROVED"})
+        ]
+    claim_stats = await gather_limited(*claim_queries)
+    
+    results = []
+    for i, cat in enumerate(categories):
+        total_lost, total_found, returned, pending, _, recent_lost, recent_found = item_stats[i * 7:i * 7 + 7]
+        total_claims, approved_claims = claim_stats[i * 2:i * 2 + 2]
+        
+        results.append({
+            "category": cat,
+            "total_lost": total_lost,
+            "total_found": total_found,
+            "returned": returned,
+            "pending": pending,
+            "recovery_rate": round((returned / max(total_found, 1)) * 100, 1),
+            "total_claims": total_claims,
+            "approval_rate": round((approved_claims / max(total_claims, 1)) * 100, 1),
+            "recent_7d": {"lost": recent_lost, "found": recent_found}
+        })
+    
+    results.sort(key=lambda x: x["total_lost"] + x["total_found"], reverse=True)
+    return results
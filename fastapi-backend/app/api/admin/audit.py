@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from datetime import datetime
+from app.core.database import get_database
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.audit import time_window
+from app.core.revocation import revocation_list
+from app.core.sessions import revoke_user_sessions
+
+router = APIRouter()
+
+# ============ AUDIT LOGS ============
+
+@router.post("/audit-log")
+async def log_action(
+    action: str,
+    target_type: str,
+    target_id: str,
+    details: Optional[dict] = None,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Log admin action for audit trail"""
+    log_entry = {
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": action,
+        "target_type": target_type,
+        "target_id": target_id,
+        "details": details,
+        "timestamp": datetime.utcnow()
+    }
+    
+    result = await db["audit_logs"].insert_one(log_entry)
+    log_entry["_id"] = result.inserted_id
+    
+    return log_entry
+
+@router.get("/audit-logs")
+async def get_audit_logs(
+    limit: int = Query(100, le=500),
+    since: Optional[datetime] = Query(None, description="Defaults to the configured audit query window"),
+    until: Optional[datetime] = Query(None),
+    action: Optional[str] = Query(None),
+    db = Depends(get_database)
+):
+    """Get recent audit logs within a bounded time range"""
+    filter_dict = {"timestamp": time_window(since, until)}
+    if action:
+        filter_dict["action"] = action
+    
+    cursor = db["audit_logs"].find(filter_dict).sort("timestamp", -1).limit(limit)
+    logs = await cursor.to_list(length=limit)
+    
+    # Convert ObjectId for serialization
+    for log in logs:
+        log["_id"] = str(log["_id"])
+    
+    return logs
+
+# ============ ADMIN PROFILE & LOGIN HISTORY ============
+
+@router.get("/profile")
+async def get_admin_profile(
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Get current admin profile"""
+    return {
+        "id": str(current_user.id),
+        "name": current_user.name,
+        "email": current_user.email,
+        "role": current_user.role,
+        "registerNumber": current_user.register_number
+    }
+
+@router.get("/login-history")
+async def get_login_history(
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Get admin login history (from audit logs)"""
+    cursor = db["audit_logs"].find({
+        "admin_id": str(current_user.id),
+        "action": "LOGIN",
+        "timestamp": time_window()
+    }).sort("timestamp", -1).limit(20)
+    
+    history = await cursor.to_list(length=20)
+    for entry in history:
+        entry["_id"] = str(entry["_id"])
+        
+    return history
+
+# ============ TOKEN & SESSION REVOCATION ============
+
+@router.post("/users/{user_id}/revoke-tokens")
+async def revoke_user_tokens(
+    user_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Invalidate a user's access tokens and refresh sessions (e.g. after a role change)"""
+    await revocation_list.revoke_user(db, user_id)
+    sessions_revoked = await revoke_user_sessions(db, user_id)
+
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "REVOKE_TOKENS",
+        "target_type": "USER",
+        "target_id": user_id,
+        "details": {"sessions_revoked": sessions_revoked},
+        "timestamp": datetime.utcnow()
+    })
+
+    return {"message": "Tokens revoked", "user_id": user_id, "sessions_revoked": sessions_revoked}
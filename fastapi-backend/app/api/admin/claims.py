@@ -0,0 +1,396 @@
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from datetime import datetime
+from functools import partial
+from bson import ObjectId
+from pydantic import BaseModel
+from app.core.database import get_database
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.utils import claim_decision_fields, convert_object_ids
+from app.core.lookups import lookup_by_id, lookup_user
+from app.core.concurrency import gather_limited
+from app.core.item_tiering import ARCHIVE_COLLECTION, find_item
+
+router = APIRouter()
+
+class ClaimMessageRequest(BaseModel):
+    message: str
+    require_response: Optional[bool] = False
+
+class ClaimRejectRequest(BaseModel):
+    reason: str
+    remarks: Optional[str] = None
+
+
+# ============ ISSUE 1: CLAIM FULL CONTEXT WITH SIDE-BY-SIDE COMPARISON ============
+
+@router.get("/claims/{claim_id}/full-context")
+async def get_claim_full_context(
+    claim_id: str,
+    db = Depends(get_database)
+):
+    """Get complete context for a claim: found item, matching lost reports, claimant info, and claim proof - all in one view"""
+    try:
+        obj_id = ObjectId(claim_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid claim ID")
+    
+    # Claim, claimed item, reporters, linked lost item, matching lost reports,
+    # claimant history, competing claims and messages in a single round trip
+    found_item_stages = [
+        *lookup_user("user_id", "reporter"),
+        *lookup_by_id("items", "linked_item_id", "linked_lost_item", lookup_user("user_id", "reporter")),
+        {"$lookup": {
+            "from": "items",
+            "let": {"category": "$category"},
+            "pipeline": [
+                {"$match": {
+                    "type": "LOST",
+                    "status": {"$in": ["OPEN", "AVAILABLE"]},
+                    "$expr": {"$eq": ["$category", "$$category"]}
+                }},
+                {"$limit": 5},
+                *lookup_user("user_id", "reporter")
+            ],
+            "as": "matching_lost_reports"
+        }}
+    ]
+    pipeline = [
+        {"$match": {"_id": obj_id}},
+        *lookup_by_id("items", "item_id", "found_item", found_item_stages),
+        *lookup_user("claimant_id", "claimant"),
+        {"$lookup": {
+            "from": "claims",
+            "let": {"claimant_id": "$claimant_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$claimant_id", "$$claimant_id"]}}},
+                {"$limit": 20},
+                {"$project": {"status": 1}}
+            ],
+            "as": "claimant_claims"
+        }},
+        {"$lookup": {
+            "from": "claims",
+            "let": {"item_id": "$item_id", "claim_id": "$_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$item_id", "$$item_id"]},
+                    {"$ne": ["$_id", "$$claim_id"]}
+                ]}}},
+                {"$limit": 10},
+                *lookup_user("claimant_id", "claimant")
+            ],
+            "as": "other_claims_on_item"
+        }},
+        {"$lookup": {
+            "from": "claim_messages",
+            "let": {"claim_id": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$claim_id", "$$claim_id"]}}},
+                {"$sort": {"sent_at": 1}},
+                {"$limit": 50}
+            ],
+            "as": "messages"
+        }}
+    ]
+    results = await db["claims"].aggregate(pipeline).to_list(length=1)
+    if not results:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    
+    claim = results[0]
+    found_item = claim.pop("found_item", None)
+    if found_item is None and ObjectId.is_valid(str(claim.get("item_id"))):
+        # The claimed item may have been tiered to items_archive
+        archived = await db[ARCHIVE_COLLECTION].aggregate([
+            {"$match": {"_id": ObjectId(str(claim["item_id"]))}},
+            *found_item_stages
+        ]).to_list(length=1)
+        found_item = archived[0] if archived else None
+    if found_item and found_item.get("linked_lost_item") is None and ObjectId.is_valid(str(found_item.get("linked_item_id"))):
+        found_item["linked_lost_item"] = await db[ARCHIVE_COLLECTION].find_one({"_id": ObjectId(str(found_item["linked_item_id"]))})
+    claimant = claim.pop("claimant", None)
+    claimant_claims = claim.pop("claimant_claims", [])
+    other_claims = claim.pop("other_claims_on_item", [])
+    messages = claim.pop("messages", [])
+    
+    linked_lost_item = None
+    matching_lost_reports = []
+    if found_item:
+        linked_lost_item = found_item.pop("linked_lost_item", None)
+        matching_lost_reports = found_item.pop("matching_lost_reports", [])
+        f_desc = (found_item.get("description") or "").lower()
+        f_words = set(w for w in f_desc.split() if len(w) > 3)
+        for li in matching_lost_reports:
+            # Calculate similarity score
+            l_desc = (li.get("description") or "").lower()
+            l_words = set(w for w in l_desc.split() if len(w) > 3)
+            common = f_words.intersection(l_words)
+            similarity = len(common) / max(len(f_words | l_words), 1) * 100
+            li["similarity_score"] = round(similarity, 1)
+            li["shared_keywords"] = list(common)
+        matching_lost_reports.sort(key=lambda x: x["similarity_score"], reverse=True)
+    
+    if claimant:
+        claimant["total_claims"] = len(claimant_claims)
+        claimant["approved_claims"] = len([c for c in claimant_claims if c.get("status") == "APPROVED"])
+        claimant["rejected_claims"] = len([c for c in claimant_claims if c.get("status") == "REJECTED"])
+    
+    return convert_object_ids({
+        "claim": claim,
+        "found_item": found_item,
+        "linked_lost_item": linked_lost_item,
+        "matching_lost_reports": matching_lost_reports,
+        "claimant": claimant,
+        "other_claims_on_item": other_claims,
+        "messages": messages
+    })
+
+
+# ============ ISSUE 2: CLAIM PRIORITIZATION ============
+
+@router.get("/claims/prioritized")
+async def get_prioritized_claims(
+    db = Depends(get_database)
+):
+    """Get all pending claims with priority scoring"""
+    cursor = db["claims"].find({"status": "PENDING"}).sort("submissionDate", 1)
+    claims_list = await cursor.to_list(length=200)
+    
+    high_value_categories = ["DEVICES", "KEYS", "JEWELLERY", "DOCUMENTS"]
+    now = datetime.utcnow()
+    
+    async def score_claim(c):
+        c["_id"] = str(c["_id"])
+        c["id"] = c["_id"]
+        
+        # Calculate priority score (0-100)
+        score = 0
+        reasons = []
+        
+        # Factor 1: Age of claim (older = higher priority)
+        submission_date = c.get("submissionDate")
+        if submission_date:
+            if isinstance(submission_date, str):
+                submission_date = datetime.fromisoformat(submission_date)
+            days_pending = (now - submission_date).days
+            hours_pending = (now - submission_date).total_seconds() / 3600
+            c["hours_pending"] = round(hours_pending, 1)
+            c["days_pending"] = days_pending
+            if days_pending >= 3:
+                score += 40
+                reasons.append(f"Pending {days_pending} days")
+            elif days_pending >= 1:
+                score += 25
+                reasons.append(f"Pending {days_pending} day(s)")
+            elif hours_pending >= 6:
+                score += 15
+                reasons.append(f"Pending {round(hours_pending)}h")
+        
+        # Factor 2: Item category value
+        item = None
+        if c.get("item_id"):
+            try:
+                item = await find_item(db, {"_id": ObjectId(c["item_id"])}, include_archive=True)
+                if item:
+                    item["_id"] = str(item["_id"])
+                    c["item"] = item
+                    if item.get("category") in high_value_categories:
+                        score += 20
+                        reasons.append(f"High-value: {item['category']}")
+            except:
+                pass
+        
+        # Factor 3: Multiple claims on same item (contention)
+        if c.get("item_id"):
+            claim_count = await db["claims"].count_documents({"item_id": c["item_id"], "status": "PENDING"})
+            if claim_count > 1:
+                score += 15
+                reasons.append(f"{claim_count} competing claims")
+            c["competing_claims"] = claim_count
+        
+        # Factor 4: Has proof image (faster to verify)
+        if c.get("proofImageUrl"):
+            score += 5
+            reasons.append("Has proof image")
+        
+        # Factor 5: Claimant history (trusted vs new)
+        if c.get("claimant_id"):
+            try:
+                user = await db["users"].find_one({"_id": ObjectId(c["claimant_id"])})
+                if user:
+                    user["_id"] = str(user["_id"])
+                    c["claimant"] = user
+                prev_approved = await db["claims"].count_documents({"claimant_id": c["claimant_id"], "status": "APPROVED"})
+                prev_rejected = await db["claims"].count_documents({"claimant_id": c["claimant_id"], "status": "REJECTED"})
+                if prev_rejected > prev_approved and prev_rejected > 0:
+                    score += 10
+                    reasons.append("History: more rejections")
+                c["claimant_history"] = {"approved": prev_approved, "rejected": prev_rejected}
+            except:
+                pass
+        
+        # Determine priority level
+        if score >= 50:
+            priority = "URGENT"
+        elif score >= 30:
+            priority = "HIGH"
+        elif score >= 15:
+            priority = "MEDIUM"
+        else:
+            priority = "NORMAL"
+        
+        c["priority_score"] = min(score, 100)
+        c["priority_level"] = priority
+        c["priority_reasons"] = reasons
+        
+        return c
+    
+    scored_claims = await gather_limited(*(partial(score_claim, c) for c in claims_list))
+    
+    # Sort by priority score descending
+    scored_claims.sort(key=lambda x: x["priority_score"], reverse=True)
+    
+    return scored_claims
+
+
+# ============ ISSUE 3: ADMIN-CLAIMANT COMMUNICATION ============
+
+@router.post("/claims/{claim_id}/message")
+async def send_claim_message(
+    claim_id: str,
+    msg: ClaimMessageRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Send a message to a claimant about their claim"""
+    try:
+        obj_id = ObjectId(claim_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid claim ID")
+    
+    claim = await db["claims"].find_one({"_id": obj_id})
+    if not claim:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    
+    # Store message
+    message_doc = {
+        "claim_id": claim_id,
+        "sender_id": str(current_user.id),
+        "sender_name": current_user.name,
+        "sender_role": "ADMIN",
+        "message": msg.message,
+        "require_response": msg.require_response,
+        "sent_at": datetime.utcnow(),
+        "read": False
+    }
+    
+    result = await db["claim_messages"].insert_one(message_doc)
+    message_doc["_id"] = str(result.inserted_id)
+    
+    # Send notification to claimant
+    if claim.get("claimant_id"):
+        action_text = " Please respond with additional information." if msg.require_response else ""
+        notification = {
+            "user_id": str(claim["claimant_id"]),
+            "title": "Message from Admin regarding your claim",
+            "message": f"{msg.message}{action_text}",
+            "type": "CLAIM_MESSAGE",
+            "related_id": claim_id,
+            "read": False,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        }
+        await db["notifications"].insert_one(notification)
+    
+    # Audit
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "CLAIM_MESSAGE_SENT",
+        "target_type": "CLAIM",
+        "target_id": claim_id,
+        "details": {"message_preview": msg.message[:100], "require_response": msg.require_response},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return message_doc
+
+
+@router.get("/claims/{claim_id}/messages")
+async def get_claim_messages(
+    claim_id: str,
+    db = Depends(get_database)
+):
+    """Get all messages for a claim"""
+    cursor = db["claim_messages"].find({"claim_id": claim_id}).sort("sent_at", 1)
+    messages = await cursor.to_list(length=100)
+    for m in messages:
+        m["_id"] = str(m["_id"])
+    return messages
+
+
+@router.put("/claims/{claim_id}/reject-with-reason")
+async def reject_claim_with_reason(
+    claim_id: str,
+    rejection: ClaimRejectRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Reject a claim with a mandatory reason that gets sent to the claimant"""
+    try:
+        obj_id = ObjectId(claim_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid claim ID")
+    
+    claim = await db["claims"].find_one({"_id": obj_id})
+    if not claim:
+        raise HTTPException(status_code=404, detail="Claim not found")
+    
+    # Update claim
+    update_data = {
+        "status": "REJECTED",
+        "rejection_reason": rejection.reason,
+        "admin_remarks": rejection.remarks or rejection.reason,
+        "updated_at": datetime.utcnow(),
+        **claim_decision_fields(claim, "REJECTED", str(current_user.id), current_user.name)
+    }
+    
+    await db["claims"].update_one({"_id": obj_id}, {"$set": update_data})
+    
+    # Send rich notification to claimant with reason
+    if claim.get("claimant_id"):
+        item = None
+        if claim.get("item_id"):
+            try:
+                item = await find_item(db, {"_id": ObjectId(claim["item_id"])}, include_archive=True)
+            except:
+                pass
+        
+        notification = {
+            "user_id": str(claim["claimant_id"]),
+            "title": "Claim Update: Not Approved",
+            "message": f"Your claim for {item.get('category', 'an item') if item else 'an item'} was not approved. Reason: {rejection.reason}",
+            "type": "CLAIM_REJECTED",
+            "related_id": claim_id,
+            "read": False,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        }
+        await db["notifications"].insert_one(notification)
+    
+    # Audit log
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "CLAIM_REJECTED_WITH_REASON",
+        "target_type": "CLAIM",
+        "target_id": claim_id,
+        "details": {"reason": rejection.reason, "remarks": rejection.remarks},
+        "timestamp": datetime.utcnow()
+    })
+    
+    updated = await db["claims"].find_one({"_id": obj_id})
+    if updated:
+        updated["_id"] = str(updated["_id"])
+    return updated
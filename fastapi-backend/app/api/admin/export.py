@@ -0,0 +1,152 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from typing import Literal, Optional
+from datetime import datetime
+from app.core.database import get_database
+from app.core.config import settings
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.audit import AUDIT_COLLECTION, PARTITION_PREFIX, time_window
+from app.core.export import FORMATS, projection, stream_rows
+from app.core.item_tiering import ARCHIVE_COLLECTION
+
+router = APIRouter()
+
+ExportFormat = Literal["csv", "jsonl"]
+
+# Index-ordered scans, so mongod never runs a blocking in-memory sort:
+# _id for items and claims, the timestamp index every audit collection has
+ID_ORDER = [("_id", 1)]
+TIMESTAMP_ORDER = [("timestamp", 1)]
+
+
+def _date_range(date_from: Optional[datetime], date_to: Optional[datetime]) -> Optional[dict]:
+    if not (date_from or date_to):
+        return None
+    window = {}
+    if date_from:
+        window["$gte"] = date_from
+    if date_to:
+        window["$lte"] = date_to
+    return window
+
+
+async def _export_response(db, current_user: UserResponse, collection: str, fmt: str, cursors: list, filters: dict):
+    now = datetime.utcnow()
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "DATA_EXPORTED",
+        "target_type": "SYSTEM",
+        "target_id": collection,
+        "details": {"format": fmt, "filters": filters},
+        "timestamp": now
+    })
+    filename = f"{collection}-{now:%Y%m%d-%H%M%S}.{fmt}"
+    return StreamingResponse(
+        stream_rows(cursors, collection, fmt),
+        media_type=FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+# ============ STREAMING EXPORTS ============
+
+@router.get("/export/items")
+async def export_items(
+    format: ExportFormat = Query("csv"),
+    type: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    include_archive: bool = Query(False),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Stream items (optionally followed by items_archive) as CSV or JSONL"""
+    filter_dict = {}
+    if type:
+        filter_dict["type"] = type
+    if status:
+        filter_dict["status"] = status
+    if category:
+        filter_dict["category"] = category
+    if window := _date_range(date_from, date_to):
+        filter_dict["dateTime"] = window
+
+    collections = ["items", ARCHIVE_COLLECTION] if include_archive else ["items"]
+    cursors = [
+        db[name].find(filter_dict, projection("items", format)).sort("_id", 1).hint(ID_ORDER).batch_size(settings.EXPORT_BATCH_SIZE)
+        for name in collections
+    ]
+    return await _export_response(db, current_user, "items", format, cursors, {
+        "type": type, "status": status, "category": category,
+        "date_from": date_from, "date_to": date_to, "include_archive": include_archive
+    })
+
+
+@router.get("/export/claims")
+async def export_claims(
+    format: ExportFormat = Query("csv"),
+    status: Optional[str] = Query(None),
+    item_id: Optional[str] = Query(None),
+    date_from: Optional[datetime] = Query(None),
+    date_to: Optional[datetime] = Query(None),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Stream claims as CSV or JSONL, in creation order"""
+    filter_dict = {}
+    if status:
+        filter_dict["status"] = status
+    if item_id:
+        filter_dict["item_id"] = item_id
+    if window := _date_range(date_from, date_to):
+        filter_dict["submissionDate"] = window
+
+    cursor = (
+        db["claims"].find(filter_dict, projection("claims", format))
+        .sort("_id", 1).hint(ID_ORDER).batch_size(settings.EXPORT_BATCH_SIZE)
+    )
+    return await _export_response(db, current_user, "claims", format, [cursor], {
+        "status": status, "item_id": item_id, "date_from": date_from, "date_to": date_to
+    })
+
+
+@router.get("/export/audit-logs")
+async def export_audit_logs(
+    format: ExportFormat = Query("csv"),
+    since: Optional[datetime] = Query(None, description="Defaults to the configured audit query window"),
+    until: Optional[datetime] = Query(None),
+    action: Optional[str] = Query(None),
+    admin_id: Optional[str] = Query(None),
+    target_id: Optional[str] = Query(None),
+    include_archived: bool = Query(False, description="Also read the monthly audit_logs_YYYY_MM partitions"),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Stream audit entries in a time window as CSV or JSONL, oldest first"""
+    filter_dict = {"timestamp": time_window(since, until)}
+    if action:
+        filter_dict["action"] = action
+    if admin_id:
+        filter_dict["admin_id"] = admin_id
+    if target_id:
+        filter_dict["target_id"] = target_id
+
+    collections = []
+    if include_archived:
+        # Partitions are named by month, so sorting the names orders them in time
+        names = await db.list_collection_names(filter={"name": {"$regex": f"^{PARTITION_PREFIX}\\d{{4}}_\\d{{2}}$"}})
+        collections = sorted(names)
+    collections.append(AUDIT_COLLECTION)
+
+    cursors = [
+        db[name].find(filter_dict, projection("audit_logs", format))
+        .sort("timestamp", 1).hint(TIMESTAMP_ORDER).batch_size(settings.EXPORT_BATCH_SIZE)
+        for name in collections
+    ]
+    return await _export_response(db, current_user, "audit_logs", format, cursors, {
+        "since": filter_dict["timestamp"]["$gte"], "until": until, "action": action,
+        "admin_id": admin_id, "target_id": target_id, "include_archived": include_archived
+    })
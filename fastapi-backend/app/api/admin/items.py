@@ -0,0 +1,702 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Form, UploadFile, File
+from typing import List, Literal, Optional
+from datetime import datetime, timedelta
+from functools import partial
+from bson import ObjectId
+from pydantic import BaseModel, Field
+import csv
+import logging
+from app.core.database import get_database
+from app.models.enums import ItemStatus, ItemType
+from app.models.user_model import UserResponse
+from app.models.item_model import ItemResponse
+from app.api.deps import get_current_user
+from app.core.utils import convert_object_ids
+from app.core.custom_ids import insert_with_custom_id
+from app.core.storage_racks import record_transition, update_item_tracked
+from app.core.config import settings
+from app.core import bulk_items, item_import
+from app.core.item_tiering import ARCHIVE_COLLECTION
+from app.core.lookups import lookup_by_id, lookup_user
+from app.core.matching import find_matches, open_lost_items
+from app.core.concurrency import gather_limited
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+class HandoverRequest(BaseModel):
+    student_id: str
+    admin_name: str
+    remarks: Optional[str] = None
+
+class LinkItemRequest(BaseModel):
+    linked_item_id: str
+
+class BulkItemFilter(BaseModel):
+    type: Optional[ItemType] = None
+    status: Optional[ItemStatus] = None
+    category: Optional[str] = None
+    storage_location: Optional[str] = None
+    older_than_days: Optional[int] = Field(None, ge=0)
+
+class BulkItemRequest(BaseModel):
+    action: Literal["archive", "dispose", "status", "storage"]
+    item_ids: Optional[List[str]] = None
+    filter: Optional[BulkItemFilter] = None
+    status: Optional[ItemStatus] = None
+    storage_location: Optional[str] = None
+    admin_remarks: Optional[str] = None
+
+
+# ============ SEARCH & FILTERS ============
+
+@router.get("/items/search", response_model=List[ItemResponse])
+async def search_items(
+    query: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    item_type: Optional[str] = Query(None),
+    date_from: Optional[str] = Query(None),
+    date_to: Optional[str] = Query(None),
+    include_archive: bool = Query(False),
+    db = Depends(get_database)
+):
+    """Search and filter items with multiple criteria (include_archive also searches items_archive)"""
+    filter_dict = {}
+    
+    # Text search
+    if query:
+        filter_dict["$or"] = [
+            {"description": {"$regex": query, "$options": "i"}},
+            {"category": {"$regex": query, "$options": "i"}},
+            {"location": {"$regex": query, "$options": "i"}}
+        ]
+    
+    # Category filter
+    if category:
+        filter_dict["category"] = category
+    
+    # Status filter
+    if status:
+        filter_dict["status"] = status
+    
+    # Type filter
+    if item_type:
+        filter_dict["type"] = item_type
+    
+    # Date range filter
+    if date_from or date_to:
+        date_filter = {}
+        if date_from:
+            date_filter["$gte"] = datetime.fromisoformat(date_from)
+        if date_to:
+            date_filter["$lte"] = datetime.fromisoformat(date_to)
+        filter_dict["dateTime"] = date_filter
+    
+    if include_archive:
+        hot, cold = await gather_limited(
+            partial(db["items"].find(filter_dict).sort("dateTime", -1).to_list, length=200),
+            partial(db[ARCHIVE_COLLECTION].find(filter_dict).sort("dateTime", -1).to_list, length=200)
+        )
+        items = sorted(hot + cold, key=lambda i: i.get("dateTime") or datetime.min, reverse=True)[:200]
+    else:
+        cursor = db["items"].find(filter_dict).sort("dateTime", -1)
+        items = await cursor.to_list(length=200)
+    
+    # Populate user details
+    results = []
+    for item in items:
+        if "user_id" in item:
+            user = await db["users"].find_one({"_id": ObjectId(item["user_id"])})
+            item["user"] = user
+        results.append(item)
+    
+    return results
+
+@router.post("/items/found", response_model=ItemResponse)
+async def admin_add_found_item(
+    category: str = Form(...),
+    description: str = Form(...),
+    location: str = Form(...),
+    storage_location: str = Form(...),
+    admin_remarks: Optional[str] = Form(None),
+    image: UploadFile = File(None),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Directly add a found item by admin with image upload"""
+    image_url = None
+    if image:
+        from app.core.cloudinary_utils import upload_image
+        uploaded_url = upload_image(image, folder="lostlink/items")
+        if uploaded_url:
+            image_url = uploaded_url
+            logger.debug(f"Image uploaded to Cloudinary: {image_url}")
+        else:
+            logger.warning("Failed to upload image to Cloudinary, continuing without image.")
+    
+    item_dict = {
+        "type": ItemType.FOUND,
+        "category": category,
+        "description": description,
+        "location": location,
+        "storage_location": storage_location,
+        "admin_remarks": admin_remarks,
+        "imageUrl": image_url,
+        "dateTime": datetime.utcnow(),
+        "status": ItemStatus.AVAILABLE,
+        "user_id": str(current_user.id),
+        "verified_by": str(current_user.id),
+        "verified_by_name": current_user.name,
+        "verified_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    }
+    
+    result = await insert_with_custom_id(db, "items", item_dict, "Found_ID", "FND")
+    await record_transition(db, None, item_dict)
+    item_dict["_id"] = str(result.inserted_id)
+    
+    # Audit Log
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "ITEM_CREATED_BY_ADMIN",
+        "target_type": "ITEM",
+        "target_id": str(result.inserted_id),
+        "details": {"category": category, "description": description},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return item_dict
+
+# ============ MATCHING SUPERVISION ============
+@router.get("/items/matches")
+async def get_potential_matches(
+    db = Depends(get_database)
+):
+    """
+    Find potential matches between LOST and FOUND items.
+    """
+    found_cursor = db["items"].find({
+        "type": "FOUND",
+        "status": {"$in": ["PENDING", "AVAILABLE"]}
+    })
+    found_items, lost_items = await gather_limited(
+        partial(found_cursor.to_list, 100),
+        partial(open_lost_items, db, limit=100)
+    )
+    return find_matches(found_items, lost_items)
+
+# ============ PHYSICAL HANDOVER & UNCLAIMED HANDLING ============
+
+@router.post("/items/{item_id}/handover")
+async def process_physical_handover(
+    item_id: str,
+    handover: HandoverRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Mark an item as physically returned and record student details"""
+    try:
+        obj_id = ObjectId(item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+    
+    update_data = {
+        "status": ItemStatus.RETURNED,
+        "handed_over_by": str(current_user.id),
+        "handed_over_by_name": handover.admin_name,
+        "handed_over_to_student_id": handover.student_id,
+        "handed_over_at": datetime.utcnow()
+    }
+    
+    if handover.remarks:
+        update_data["admin_remarks"] = handover.remarks
+
+    previous = await update_item_tracked(db, {"_id": obj_id}, update_data)
+    
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    
+    # Log the action
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "PHYSICAL_HANDOVER",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {
+            "student_id": handover.student_id,
+            "remarks": handover.remarks
+        },
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Handover recorded successfully"}
+
+@router.post("/items/{item_id}/archive")
+async def archive_unclaimed_item(
+    item_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Mark an item as archived"""
+    try:
+        obj_id = ObjectId(item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+        
+    previous = await update_item_tracked(
+        db,
+        {"_id": obj_id},
+        {"status": ItemStatus.ARCHIVED, "archived_at": datetime.utcnow()}
+    )
+    
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+        
+    # Audit Log
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "ITEM_ARCHIVED",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {"status": "ARCHIVED"},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Item archived"}
+
+@router.post("/items/{item_id}/dispose")
+async def dispose_unclaimed_item(
+    item_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Mark an item as disposed"""
+    try:
+        obj_id = ObjectId(item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+        
+    previous = await update_item_tracked(
+        db,
+        {"_id": obj_id},
+        {"status": ItemStatus.DISPOSED, "disposed_at": datetime.utcnow()}
+    )
+    
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+        
+    # Audit Log
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "ITEM_DISPOSED",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {"status": "DISPOSED"},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Item marked as disposed"}
+
+# ============ BULK OPERATIONS & IMPORT ============
+
+BULK_AUDIT_ACTIONS = {
+    "archive": "ITEM_ARCHIVED",
+    "dispose": "ITEM_DISPOSED",
+    "status": "ITEM_STATUS_UPDATED",
+    "storage": "STORAGE_ASSIGNED"
+}
+
+def _bulk_update_data(request: BulkItemRequest, current_user: UserResponse, now: datetime) -> dict:
+    if request.action == "archive":
+        return {"status": ItemStatus.ARCHIVED, "archived_at": now}
+    if request.action == "dispose":
+        return {"status": ItemStatus.DISPOSED, "disposed_at": now}
+    if request.action == "status":
+        if request.status is None:
+            raise HTTPException(status_code=400, detail="status is required for the status action")
+        return {"status": request.status}
+    if not request.storage_location:
+        raise HTTPException(status_code=400, detail="storage_location is required for the storage action")
+    # Same fields as a single storage assignment
+    update_data = {
+        "storage_location": request.storage_location,
+        "verified_by": str(current_user.id),
+        "verified_by_name": current_user.name,
+        "verified_at": now,
+        "status": request.status or ItemStatus.AVAILABLE
+    }
+    if request.admin_remarks:
+        update_data["admin_remarks"] = request.admin_remarks
+    return update_data
+
+def _bulk_filter(item_filter: BulkItemFilter) -> dict:
+    filter_dict = {}
+    if item_filter.type:
+        filter_dict["type"] = item_filter.type
+    if item_filter.status:
+        filter_dict["status"] = item_filter.status
+    if item_filter.category:
+        filter_dict["category"] = item_filter.category
+    if item_filter.storage_location:
+        filter_dict["storage_location"] = item_filter.storage_location
+    if item_filter.older_than_days is not None:
+        filter_dict["dateTime"] = {"$lte": datetime.utcnow() - timedelta(days=item_filter.older_than_days)}
+    return filter_dict
+
+@router.post("/items/bulk")
+async def bulk_item_operation(
+    request: BulkItemRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    Archive, dispose, re-status or re-shelve many items at once.
+    Targets are either `item_ids` or a `filter`; the change is one bulk_write
+    and the audit entries one insert_many. Each item gets its own result.
+    """
+    if bool(request.item_ids) == bool(request.filter):
+        raise HTTPException(status_code=400, detail="Provide either item_ids or filter")
+    
+    max_items = settings.BULK_OPERATION_MAX_ITEMS
+    now = datetime.utcnow()
+    update_data = _bulk_update_data(request, current_user, now)
+    results = {}
+    
+    if request.item_ids:
+        if len(request.item_ids) > max_items:
+            raise HTTPException(status_code=400, detail=f"At most {max_items} items per bulk operation")
+        obj_ids = []
+        for item_id in dict.fromkeys(request.item_ids):
+            if ObjectId.is_valid(item_id):
+                obj_ids.append(ObjectId(item_id))
+            else:
+                results[item_id] = bulk_items.INVALID_ID
+        items = await db["items"].find({"_id": {"$in": obj_ids}}, bulk_items.PROJECTION).to_list(length=None)
+        found = {str(item["_id"]) for item in items}
+        for obj_id in obj_ids:
+            if str(obj_id) not in found:
+                results[str(obj_id)] = bulk_items.NOT_FOUND
+    else:
+        filter_dict = _bulk_filter(request.filter)
+        if not filter_dict:
+            raise HTTPException(status_code=400, detail="Filter must have at least one criterion")
+        items = await db["items"].find(filter_dict, bulk_items.PROJECTION).limit(max_items + 1).to_list(length=None)
+        if len(items) > max_items:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Filter matches more than {max_items} items; narrow it down or run it in batches"
+            )
+    
+    item_results, applied = await bulk_items.bulk_update_items(db, items, update_data)
+    results.update(item_results)
+    
+    bulk_id = str(ObjectId())
+    if applied:
+        details = {"bulk_id": bulk_id}
+        if "storage_location" in update_data:
+            details["storage_location"] = update_data["storage_location"]
+        else:
+            details["status"] = update_data["status"]
+        await db["audit_logs"].insert_many([
+            {
+                "admin_id": str(current_user.id),
+                "admin_name": current_user.name,
+                "action": BULK_AUDIT_ACTIONS[request.action],
+                "target_type": "ITEM",
+                "target_id": str(item["_id"]),
+                "details": details,
+                "timestamp": now
+            }
+            for item in applied
+        ], ordered=False)
+    
+    summary = {}
+    for result in results.values():
+        summary[result] = summary.get(result, 0) + 1
+    
+    return {
+        "action": request.action,
+        "bulk_id": bulk_id,
+        "summary": summary,
+        "results": [{"item_id": item_id, "result": result} for item_id, result in results.items()]
+    }
+
+@router.post("/items/import")
+async def import_found_items(
+    file: UploadFile = File(...),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    Add found items from a CSV with columns category, location and
+    storage_location, plus optional description, admin_remarks, dateTime and
+    imageUrl. Rows are validated with ItemCreate and written in batches;
+    invalid rows are skipped and listed with their errors. Each imported row
+    reports its Found_ID and the open lost reports it may match.
+    """
+    try:
+        reader = item_import.read_csv(file.file)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Unreadable CSV: {e}")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    max_rows = settings.BULK_OPERATION_MAX_ITEMS
+    now = datetime.utcnow()
+    import_id = str(ObjectId())
+    verification = {
+        "user_id": str(current_user.id),
+        "verified_by": str(current_user.id),
+        "verified_by_name": current_user.name,
+        "verified_at": now,
+        "updated_at": now
+    }
+    rows_read, imported, errors = 0, [], []
+    limit_reached = False
+
+    try:
+        for batch in item_import.batches(reader, settings.IMPORT_BATCH_SIZE):
+            documents, row_numbers = [], {}
+            for row_number, row in batch:
+                if rows_read == max_rows:
+                    errors.append({"row": row_number, "errors": [{
+                        "field": None,
+                        "message": f"Import limit of {max_rows} rows reached; this and later rows were not imported"
+                    }]})
+                    limit_reached = True
+                    break
+                rows_read += 1
+                document, row_errors = item_import.validate_row(row, now)
+                if row_errors:
+                    errors.append({"row": row_number, "errors": row_errors})
+                    continue
+                document.update(verification)
+                documents.append(document)
+                row_numbers[id(document)] = row_number
+
+            if documents:
+                inserted, failed = await item_import.insert_found_items(db, documents)
+                for document in failed:
+                    errors.append({"row": row_numbers[id(document)], "errors": [
+                        {"field": "Found_ID", "message": "Could not be saved; please retry this row"}
+                    ]})
+                suggestions = await item_import.match_batch(db, inserted)
+                imported.extend(
+                    {
+                        "row": row_numbers[id(document)],
+                        "item_id": str(document["_id"]),
+                        "Found_ID": document["Found_ID"],
+                        "matches": suggestions[str(document["_id"])]
+                    }
+                    for document in inserted
+                )
+                if inserted:
+                    await db["audit_logs"].insert_many([
+                        {
+                            "admin_id": str(current_user.id),
+                            "admin_name": current_user.name,
+                            "action": "ITEM_CREATED_BY_ADMIN",
+                            "target_type": "ITEM",
+                            "target_id": str(document["_id"]),
+                            "details": {
+                                "category": document["category"],
+                                "description": document.get("description"),
+                                "import_id": import_id
+                            },
+                            "timestamp": now
+                        }
+                        for document in inserted
+                    ], ordered=False)
+
+            if limit_reached:
+                break
+    except item_import.UnreadableRow as e:
+        # batches() hands over every row before the unreadable one first
+        rows_read += 1
+        errors.append({"row": e.row, "errors": [{"field": None, "message": str(e)}]})
+
+    imported.sort(key=lambda r: r["row"])
+    errors.sort(key=lambda r: r["row"])
+    return {
+        "import_id": import_id,
+        "summary": {"rows": rows_read, "imported": len(imported), "rejected": rows_read - len(imported)},
+        "imported": imported,
+        "errors": errors
+    }
+
+# ============ ITEM LINKING ============
+
+@router.put("/items/{item_id}/link")
+async def link_items(
+    item_id: str,
+    link: LinkItemRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Link a LOST item with a FOUND item (mirror update)"""
+    try:
+        id1 = ObjectId(item_id)
+        id2 = ObjectId(link.linked_item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+
+    # Verify items exist
+    item1, item2 = await gather_limited(
+        partial(db["items"].find_one, {"_id": id1}),
+        partial(db["items"].find_one, {"_id": id2})
+    )
+    
+    if not item1 or not item2:
+        raise HTTPException(status_code=404, detail="One or both items not found")
+
+    # Update both items to link them
+    now = datetime.utcnow()
+    await gather_limited(
+        partial(db["items"].update_one, {"_id": id1}, {"$set": {"linked_item_id": link.linked_item_id, "updated_at": now}}),
+        partial(db["items"].update_one, {"_id": id2}, {"$set": {"linked_item_id": item_id, "updated_at": now}})
+    )
+
+    # Log action
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "ITEMS_LINKED",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {"linked_with": link.linked_item_id, "item1_type": item1['type'], "item2_type": item2['type']},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Items linked successfully"}
+
+# ============ ITEM CONTEXT & OWNER NOTIFICATION ============
+
+@router.get("/items/{item_id}/context")
+async def get_item_context(
+    item_id: str,
+    include_archive: bool = Query(True),
+    db = Depends(get_database)
+):
+    """Get full context for an item: itself, its link, and its claims.
+    Items moved to items_archive are found there unless include_archive is false."""
+    try:
+        obj_id = ObjectId(item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+        
+    # Item, reporter, linked item (with its reporter) and claims (with claimants)
+    # in a single round trip
+    pipeline = [
+        {"$match": {"_id": obj_id}},
+        *lookup_user("user_id", "user"),
+        *lookup_by_id("items", "linked_item_id", "linked_item", lookup_user("user_id", "user")),
+        {"$lookup": {
+            "from": "claims",
+            "let": {"item_id": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$item_id", "$$item_id"]}}},
+                {"$limit": 50},
+                *lookup_user("claimant_id", "claimant")
+            ],
+            "as": "claims"
+        }}
+    ]
+    results = await db["items"].aggregate(pipeline).to_list(length=1)
+    if not results and include_archive:
+        results = await db[ARCHIVE_COLLECTION].aggregate(pipeline).to_list(length=1)
+    if not results:
+        raise HTTPException(status_code=404, detail="Item not found")
+    
+    item = results[0]
+    linked_item = item.pop("linked_item", None)
+    claims = item.pop("claims", [])
+    if linked_item is None and include_archive and ObjectId.is_valid(str(item.get("linked_item_id"))):
+        linked_item = await db[ARCHIVE_COLLECTION].find_one({"_id": ObjectId(str(item["linked_item_id"]))})
+                
+    return convert_object_ids({
+        "item": item,
+        "linked_item": linked_item,
+        "claims": claims
+    })
+@router.post("/items/{item_id}/notify-owner")
+async def notify_lost_item_owner(
+    item_id: str,
+    payload: dict = Body(None),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    Notify the owner of a LOST item that a match has been found.
+    Updates status to AVAILABLE and sends a notification with optional remarks.
+    """
+    try:
+        obj_id = ObjectId(item_id)
+    except:
+        raise HTTPException(status_code=400, detail="Invalid item ID")
+        
+    item = await db["items"].find_one({"_id": obj_id})
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+        
+    if item["type"] != ItemType.LOST:
+        raise HTTPException(status_code=400, detail="Only LOST items can be notified to owners")
+
+    remarks = payload.get("remarks") if payload else None
+    
+    update_dict = {
+        "status": ItemStatus.AVAILABLE,
+        "verified_at": datetime.utcnow(),
+        "verified_by": str(current_user.id),
+        "verified_by_name": current_user.name,
+        "updated_at": datetime.utcnow()
+    }
+    
+    if remarks:
+        update_dict["admin_remarks"] = remarks
+    elif not item.get("admin_remarks"):
+        update_dict["admin_remarks"] = "Match found! Please visit Lost & Found office for collection."
+
+    # Update status
+    await db["items"].update_one(
+        {"_id": obj_id},
+        {"$set": update_dict}
+    )
+    
+    # Send notification to the user who reported the lost item
+    if item.get("user_id"):
+        msg = f"A matching item for your lost {item.get('category', 'item')} has been found."
+        if remarks:
+             msg += f" Note: {remarks}"
+        else:
+             msg += " Please visit the L&F office for collection."
+
+        notification = {
+            "user_id": str(item["user_id"]),
+            "title": "Great News! Item Found 🎁",
+            "message": msg,
+            "type": "MATCH_FOUND",
+            "related_id": item_id,
+            "read": False,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        }
+        await db["notifications"].insert_one(notification)
+
+    # Audit Log
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "OWNER_NOTIFIED",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {"status_to": "AVAILABLE", "remarks_included": bool(remarks)},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Owner notified successfully"}
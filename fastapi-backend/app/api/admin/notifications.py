@@ -0,0 +1,122 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from datetime import datetime
+from bson import ObjectId
+from pydantic import BaseModel
+from app.core.database import get_database
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.metrics import NOTIFICATION_FANOUT
+
+router = APIRouter()
+
+class BroadcastRequest(BaseModel):
+    title: str
+    message: str
+    category: Optional[str] = "SYSTEM"
+
+
+# ============ NOTIFICATIONS ============
+
+@router.get("/notifications")
+async def get_notifications(
+    current_user: UserResponse = Depends(get_current_user),
+    unread_only: bool = Query(False),
+    db = Depends(get_database)
+):
+    """Get admin notifications"""
+    filter_dict = {"admin_id": str(current_user.id)}
+    if unread_only:
+        filter_dict["read"] = False
+    
+    cursor = db["notifications"].find(filter_dict).sort("created_at", -1).limit(50)
+    notifications = await cursor.to_list(length=50)
+    
+    return notifications
+
+@router.put("/notifications/{notification_id}/read")
+async def mark_notification_read(
+    notification_id: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Mark notification as read"""
+    result = await db["notifications"].update_one(
+        {"_id": ObjectId(notification_id), "admin_id": str(current_user.id)},
+        {"$set": {"read": True, "updated_at": datetime.utcnow()}}
+    )
+    
+    if result.modified_count == 0:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    
+    return {"message": "Marked as read"}
+
+@router.post("/notification-trigger")
+async def create_notification(
+    admin_id: str,
+    title: str,
+    message: str,
+    notification_type: str,
+    related_id: Optional[str] = None,
+    db = Depends(get_database)
+):
+    """Manually trigger a notification (admin only)"""
+    notification = {
+        "admin_id": admin_id,
+        "title": title,
+        "message": message,
+        "notification_type": notification_type,
+        "related_id": related_id,
+        "read": False,
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow()
+    }
+    
+    result = await db["notifications"].insert_one(notification)
+    notification["_id"] = result.inserted_id
+    
+    return notification
+
+# ============ CAMPUS BROADCAST ============
+
+@router.post("/broadcast")
+async def send_campus_broadcast(
+    broadcast: BroadcastRequest,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Send a notification to all registered users"""
+    # Get all user IDs
+    users_cursor = db["users"].find({}, {"_id": 1})
+    users = await users_cursor.to_list(length=None)
+    
+    notifications = []
+    now = datetime.utcnow()
+    
+    for user in users:
+        notifications.append({
+            "user_id": str(user["_id"]),
+            "title": broadcast.title,
+            "message": broadcast.message,
+            "type": broadcast.category,
+            "read": False,
+            "created_at": now,
+            "updated_at": now
+        })
+    
+    if notifications:
+        await db["notifications"].insert_many(notifications)
+    NOTIFICATION_FANOUT.observe(len(notifications), type="BROADCAST")
+        
+    # Log the action
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "CAMPUS_BROADCAST",
+        "target_type": "SYSTEM",
+        "target_id": "ALL_USERS",
+        "details": {"title": broadcast.title},
+        "timestamp": now
+    })
+    
+    return {"message": f"Broadcast sent to {len(notifications)} users"}
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import datetime
+from app.core.database import get_database
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.scheduler import scheduler, RUNS_COLLECTION
+
+router = APIRouter()
+
+# ============ BACKGROUND JOBS ============
+
+@router.get("/scheduler/jobs")
+async def get_scheduler_jobs(
+    runs: int = Query(5, ge=0, le=50),
+    db = Depends(get_database)
+):
+    """Registered background jobs with their schedule, lock holder and recent runs"""
+    return {
+        "enabled": bool(scheduler.jobs),
+        "worker": scheduler.owner,
+        "jobs": await scheduler.status(db, runs)
+    }
+
+
+@router.get("/scheduler/runs")
+async def get_scheduler_runs(
+    job: str = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    db = Depends(get_database)
+):
+    """Run history, newest first"""
+    filter_dict = {"job": job} if job else {}
+    return await db[RUNS_COLLECTION].find(filter_dict).sort("started_at", -1).skip(skip).limit(limit).to_list(length=None)
+
+
+@router.post("/scheduler/jobs/{name}/run")
+async def trigger_scheduler_job(
+    name: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Make a job due now; the next scheduler poll on any worker runs it"""
+    if name not in scheduler.jobs or not await scheduler.trigger(db, name):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "JOB_TRIGGERED",
+        "target_type": "JOB",
+        "target_id": name,
+        "details": {},
+        "timestamp": datetime.utcnow()
+    })
+
+    return {"message": f"Job {name} will run on the next scheduler poll"}
@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends
+from datetime import datetime, timedelta
+from functools import partial
+import time
+from app.core.database import get_database, db as database
+from app.core.concurrency import gather_limited
+
+router = APIRouter()
+
+# ============ DASHBOARD STATISTICS ============
+@router.get("/stats/dashboard")
+async def get_dashboard_stats(
+    db = Depends(get_database)
+):
+    """Get dashboard overview statistics"""
+    items_col = db["items"]
+    claims_col = db["claims"]
+    
+    # High-risk items (phones, IDs, keys, devices, jewellery)
+    high_risk_categories = ["DEVICES", "KEYS", "JEWELLERY"]
+    
+    # Get stats
+    (
+        total_lost, total_found, pending_items, available_items,
+        total_resolved, returned_today, high_risk, pending_claims
+    ) = await gather_limited(
+        partial(items_col.count_documents, {"type": "LOST"}),
+        partial(items_col.count_documents, {"type": "FOUND"}),
+        partial(items_col.count_documents, {"status": "PENDING"}),
+        partial(items_col.count_documents, {"status": "AVAILABLE"}),
+        # Correct total resolved count (Including legacy RESOLVED status)
+        partial(items_col.count_documents, {"status": {"$in": ["RETURNED", "RESOLVED"]}}),
+        # Items returned in the last 24 hours
+        partial(items_col.count_documents, {
+            "status": {"$in": ["RETURNED", "RESOLVED"]},
+            "handed_over_at": {"$gte": datetime.utcnow() - timedelta(days=1)}
+        }),
+        partial(items_col.count_documents, {
+            "category": {"$in": high_risk_categories},
+            "status": {"$in": ["PENDING", "AVAILABLE"]}
+        }),
+        # Pending claims
+        partial(claims_col.count_documents, {"status": "PENDING"})
+    )
+    
+    return {
+        "total_lost": total_lost,
+        "total_found": total_found,
+        "pending_verification": pending_items,
+        "available_items": available_items,
+        "total_resolved": total_resolved,
+        "returned_today": returned_today,
+        "high_risk_items": high_risk,
+        "pending_claims": pending_claims
+    }
+
+@router.get("/stats/category-breakdown")
+async def get_category_stats(
+    db = Depends(get_database)
+):
+    """Get item count breakdown by category"""
+    items_col = db["items"]
+    categories = ["DOCUMENTS", "DEVICES", "ACCESSORIES", "PERSONAL_ITEMS", "KEYS", "BOOKS", "JEWELLERY", "OTHERS"]
+    
+    counts = await gather_limited(*(
+        partial(items_col.count_documents, {"category": cat}) for cat in categories
+    ))
+    
+    return dict(zip(categories, counts))
+
+@router.get("/stats/recovery-rate")
+async def get_recovery_rate(
+    db = Depends(get_database)
+):
+    """Calculate recovery rate: returned items / total found items"""
+    items_col = db["items"]
+    
+    # Count CLAIMED (Approved/Handover pending) and RETURNED/RESOLVED (Complete) as "Recovered"
+    total_found, returned, claimed = await gather_limited(
+        partial(items_col.count_documents, {"type": "FOUND"}),
+        partial(items_col.count_documents, {"type": "FOUND", "status": {"$in": ["RETURNED", "RESOLVED"]}}),
+        partial(items_col.count_documents, {"type": "FOUND", "status": "CLAIMED"})
+    )
+    
+    total_recovered = returned + claimed
+    
+    rate = (total_recovered / total_found * 100) if total_found > 0 else 0
+    
+    return {
+        "total_found": total_found,
+        "returned": total_recovered, # We'll call this "Recovered" in UI
+        "verified_handover": returned,
+        "pending_handover": claimed,
+        "recovery_rate_percent": round(rate, 2)
+    }
+
+# ============ DIAGNOSTICS ============
+
+@router.get("/diagnostics/database")
+async def get_database_diagnostics(
+    db = Depends(get_database)
+):
+    """Report the effective MongoDB client/pool settings and a ping round trip"""
+    report = database.diagnostics()
+    started = time.perf_counter()
+    try:
+        await db.command("ping")
+        report["ping_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    except Exception as e:
+        report["ping_error"] = str(e)
+    return report
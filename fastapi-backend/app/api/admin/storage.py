@@ -0,0 +1,285 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Optional
+from datetime import datetime, timedelta
+from functools import partial
+from bson import ObjectId
+from pydantic import BaseModel
+from app.core.database import get_database
+from app.models.enums import ItemStatus
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.concurrency import gather_limited
+from app.core.storage_racks import (
+    RACKS_COLLECTION, STORED_FILTER, rebuild_rack_occupancy, update_item_tracked
+)
+
+router = APIRouter()
+
+class StorageAssignment(BaseModel):
+    storage_location: str
+    admin_remarks: Optional[str] = None
+    status: Optional[str] = None
+
+
+# ============ STORAGE MANAGEMENT ============
+
+@router.put("/items/{item_id}/assign-storage")
+async def assign_storage_location(
+    item_id: str,
+    assignment: StorageAssignment,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Assign storage location to found item"""
+    # A malformed id raises InvalidId, answered by the app-wide handler
+    obj_id = ObjectId(item_id)
+    
+    update_data = {
+        "storage_location": assignment.storage_location,
+        "verified_by": str(current_user.id),
+        "verified_by_name": current_user.name,
+        "verified_at": datetime.utcnow(),
+        "status": assignment.status if assignment.status else ItemStatus.AVAILABLE
+    }
+    
+    if assignment.admin_remarks:
+        update_data["admin_remarks"] = assignment.admin_remarks
+
+    previous = await update_item_tracked(db, {"_id": obj_id}, update_data)
+    
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    
+    updated_item = await db["items"].find_one({"_id": obj_id})
+    
+    # Convert ObjectId to string for JSON serialization
+    if updated_item:
+        updated_item["_id"] = str(updated_item["_id"])
+        if "user_id" in updated_item:
+            updated_item["user_id"] = str(updated_item["user_id"])
+    
+    # Log action
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "STORAGE_ASSIGNED",
+        "target_type": "ITEM",
+        "target_id": item_id,
+        "details": {"storage_location": assignment.storage_location},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return updated_item
+
+# ============ ISSUE 4: STORAGE MANAGEMENT ============
+
+@router.get("/storage/inventory")
+async def get_storage_inventory(
+    location: Optional[str] = None,
+    item_skip: int = Query(0, ge=0),
+    item_limit: int = Query(50, ge=1, le=500),
+    db = Depends(get_database)
+):
+    """Get complete storage inventory - what's in each storage location.
+
+    Counts come from the maintained rack occupancy documents. The items listed
+    per location are one page (item_skip/item_limit, newest first), fetched
+    per rack with skip/limit on the storage_location_status_dateTime index,
+    so only the page and the rack's oldest/newest dates are read.
+    """
+    rack_filter = {"_id": location} if location else {}
+    racks, unassigned = await gather_limited(
+        partial(db[RACKS_COLLECTION].find(rack_filter).sort("_id", 1).to_list, length=None),
+        partial(db["items"].count_documents, {
+            "type": "FOUND",
+            "status": {"$in": ["AVAILABLE", "PENDING"]},
+            "$or": [
+                {"storage_location": {"$exists": False}},
+                {"storage_location": None},
+                {"storage_location": ""}
+            ]
+        })
+    )
+    
+    def rack_items(rack_id, direction, skip, limit, projection=None, dated_only=False):
+        query = {**STORED_FILTER, "storage_location": rack_id}
+        if dated_only:
+            # Null/missing dateTime sorts first ascending; skip it for the date bounds
+            query["dateTime"] = {"$ne": None}
+        return partial(
+            db["items"].find(query, projection)
+            .sort("dateTime", direction).skip(skip).limit(limit).to_list,
+            length=None
+        )
+    
+    # Per rack: the page, the newest item date and the oldest item date
+    stored = [rack for rack in racks if rack["item_count"] > 0]
+    calls = []
+    for rack in stored:
+        calls += [
+            rack_items(rack["_id"], -1, item_skip, item_limit),
+            rack_items(rack["_id"], -1, 0, 1, {"dateTime": 1}, dated_only=True),
+            rack_items(rack["_id"], 1, 0, 1, {"dateTime": 1}, dated_only=True)
+        ]
+    results = await gather_limited(*calls) if calls else []
+    pages = {}
+    for i, rack in enumerate(stored):
+        items, newest, oldest = results[3 * i:3 * i + 3]
+        pages[rack["_id"]] = {
+            "items": items,
+            "newest_item_date": newest[0].get("dateTime") if newest else None,
+            "oldest_item_date": oldest[0].get("dateTime") if oldest else None
+        }
+    
+    locations = []
+    for rack in racks:
+        page = pages.get(rack["_id"], {})
+        items = page.get("items", [])
+        for item in items:
+            item["_id"] = str(item["_id"])
+        locations.append({
+            "location": rack["_id"],
+            "items": items,
+            "total_items": rack["item_count"],
+            "has_more_items": item_skip + len(items) < rack["item_count"],
+            "categories": {cat: n for cat, n in rack.get("categories", {}).items() if n > 0},
+            "oldest_item_date": page.get("oldest_item_date"),
+            "newest_item_date": page.get("newest_item_date")
+        })
+    
+    return {
+        "summary": {
+            "total_locations": len(locations),
+            "total_stored_items": sum(loc["total_items"] for loc in locations),
+            "unassigned_items": unassigned
+        },
+        "locations": locations
+    }
+
+
+@router.get("/storage/locations")
+async def get_storage_locations_list(
+    db = Depends(get_database)
+):
+    """Get list of all unique storage locations with item counts"""
+    results = []
+    async for rack in db[RACKS_COLLECTION].find().sort("_id", 1):
+        results.append({
+            "location": rack["_id"],
+            "item_count": rack["item_count"],
+            "categories": [cat for cat, n in rack.get("categories", {}).items() if n > 0]
+        })
+    
+    return results
+
+
+@router.get("/storage/locations/{location}/items")
+async def get_storage_location_items(
+    location: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    db = Depends(get_database)
+):
+    """Page through the items stored at one location, newest first"""
+    rack, items = await gather_limited(
+        partial(db[RACKS_COLLECTION].find_one, {"_id": location}),
+        partial(
+            db["items"].find({**STORED_FILTER, "storage_location": location})
+            .sort("dateTime", -1).skip(skip).limit(limit).to_list,
+            length=None
+        )
+    )
+    for item in items:
+        item["_id"] = str(item["_id"])
+    
+    return {
+        "location": location,
+        "total_items": rack["item_count"] if rack else 0,
+        "skip": skip,
+        "limit": limit,
+        "items": items
+    }
+
+
+@router.post("/storage/racks/rebuild")
+async def rebuild_storage_racks(
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Recompute rack occupancy from the items collection"""
+    racks = await rebuild_rack_occupancy(db)
+    
+    await db["audit_logs"].insert_one({
+        "admin_id": str(current_user.id),
+        "admin_name": current_user.name,
+        "action": "STORAGE_RACKS_REBUILT",
+        "target_type": "SYSTEM",
+        "target_id": RACKS_COLLECTION,
+        "details": {"racks": racks},
+        "timestamp": datetime.utcnow()
+    })
+    
+    return {"message": "Rack occupancy rebuilt", "racks": racks}
+
+
+@router.get("/storage/report")
+async def get_storage_report(
+    db = Depends(get_database)
+):
+    """Generate a comprehensive storage report"""
+    now = datetime.utcnow()
+    month_ago = now - timedelta(days=30)
+    week_ago = now - timedelta(days=7)
+    
+    in_storage = {
+        "storage_location": {"$nin": [None, ""]},
+        "status": {"$in": ["AVAILABLE", "PENDING"]}
+    }
+    
+    def count_if(condition):
+        return {"$sum": {"$cond": [condition, 1, 0]}}
+    
+    # All aging buckets and the high-value count in one pass over stored items
+    pipeline = [
+        {"$match": in_storage},
+        {"$group": {
+            "_id": None,
+            "over_30_days": count_if({"$and": [
+                {"$gt": ["$dateTime", None]},
+                {"$lte": ["$dateTime", month_ago]}
+            ]}),
+            "7_to_30_days": count_if({"$and": [
+                {"$gt": ["$dateTime", month_ago]},
+                {"$lte": ["$dateTime", week_ago]}
+            ]}),
+            "under_7_days": count_if({"$gt": ["$dateTime", week_ago]}),
+            "high_value": count_if({"$in": ["$category", ["DEVICES", "KEYS", "JEWELLERY"]]})
+        }}
+    ]
+    
+    buckets, old_items = await gather_limited(
+        partial(db["items"].aggregate(pipeline).to_list, length=None),
+        # Oldest items first so the detail list shows the most overdue ones
+        partial(db["items"].find({
+            **in_storage,
+            "dateTime": {"$lte": month_ago}
+        }).sort("dateTime", 1).to_list, 100)
+    )
+    counts = buckets[0] if buckets else {}
+    
+    for item in old_items:
+        item["_id"] = str(item["_id"])
+        item_date = item.get("dateTime")
+        if item_date:
+            item["days_stored"] = (now - item_date).days
+    
+    return {
+        "aging_report": {
+            "over_30_days": counts.get("over_30_days", 0),
+            "7_to_30_days": counts.get("7_to_30_days", 0),
+            "under_7_days": counts.get("under_7_days", 0),
+            "old_items_detail": old_items
+        },
+        "high_value_in_storage": counts.get("high_value", 0),
+        "generated_at": now.isoformat()
+    }
@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Body, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from typing import Any
+from typing import Any, Optional
 from app.core.database import get_database
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.revocation import revocation_list
+from app.core.rate_limit import client_ip, login_limiter
+from app.core.sessions import create_session, revoke_session, revoke_session_by_token, rotate_session
+from app.api.deps import get_token_payload, optional_oauth2_scheme
+from app.core.security import (
+    get_password_hash_async, verify_password_async, create_access_token, access_token_lifetime, user_claims
+)
 from app.models.user_model import UserCreate, UserResponse, UserInDB
 from app.models.enums import Role
 from datetime import datetime, timedelta
+from bson import ObjectId
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/login")
 async def login(
+    request: Request,
     login_request: dict = Body(...), # Accepting arbitrary dict to match frontend
     db = Depends(get_database)
 ) -> Any:
@@ -20,83 +31,139 @@ async def login(
 
     if not email or not password:
          raise HTTPException(status_code=400, detail="Email and password required")
+    if not isinstance(email, str) or not isinstance(password, str):
+        raise HTTPException(status_code=422, detail="Email and password must be strings")
 
-    try:
-        user = await db["users"].find_one({"email": email})
-        if not user:
-            raise HTTPException(status_code=400, detail="Incorrect email or password")
-        
-        if not verify_password(password, user["password"]):
-            raise HTTPException(status_code=400, detail="Incorrect email or password")
-        
-        # Generate JWT
-        roles = [user.get("role", "USER")]
-
-        access_token = create_access_token(
-            data={"sub": user["email"], "roles": roles}
+    # Throttle before the user lookup and bcrypt so floods stay cheap
+    retry_after = await login_limiter.check(db, client_ip(request), email)
+    if retry_after:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)}
         )
 
-        print(f"Login successful for: {email}") # DEBUG LOG
-        
-        if roles and "ADMIN" in roles:
-            await db["audit_logs"].insert_one({
-                "admin_id": str(user["_id"]),
-                "admin_name": user.get("name", "Unknown"),
-                "action": "LOGIN",
-                "target_type": "USER",
-                "target_id": str(user["_id"]),
-                "details": {"email": email, "ip": "N/A"},
-                "timestamp": timedelta(0) + datetime.utcnow()
-            })
-
-        response_data = {
-            "token": access_token,
-            "accessToken": access_token, # details for compatibility
-            "type": "Bearer",
-            "id": str(user["_id"]),
-            "email": user["email"],
-            "roles": roles,
-            "name": user.get("name"),
-            "registerNumber": user.get("registerNumber") or user.get("register_number")
-        }
-        print("Returning response:", response_data) # DEBUG LOG
-        return response_data
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"ERROR during login: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Login error: {str(e)}")
+    user = await db["users"].find_one({"email": email})
+    if not user or not await verify_password_async(password, user["password"]):
+        await login_limiter.record_failure(db, email)
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    await login_limiter.record_success(db, email)
+    
+    # Generate JWT
+    claims = user_claims(user)
+    roles = claims["roles"]
+
+    session_id, refresh_token = await create_session(db, claims["id"], request.headers.get("user-agent"))
+    access_token = create_access_token(data={**claims, "sid": session_id})
+
+    logger.debug(f"Login successful for: {email}")
+    
+    if roles and "ADMIN" in roles:
+        await db["audit_logs"].insert_one({
+            "admin_id": str(user["_id"]),
+            "admin_name": user.get("name", "Unknown"),
+            "action": "LOGIN",
+            "target_type": "USER",
+            "target_id": str(user["_id"]),
+            "details": {"email": email, "ip": "N/A"},
+            "timestamp": timedelta(0) + datetime.utcnow()
+        })
+
+    response_data = {
+        "token": access_token,
+        "accessToken": access_token, # details for compatibility
+        "refreshToken": refresh_token,
+        "type": "Bearer",
+        "id": str(user["_id"]),
+        "email": user["email"],
+        "roles": roles,
+        "name": claims["name"],
+        "registerNumber": claims["registerNumber"],
+        "expiresIn": int(access_token_lifetime().total_seconds())
+    }
+    return response_data
 
 @router.post("/register")
 async def register(
     user_in: UserCreate,
     db = Depends(get_database)
 ) -> Any:
-    try:
-        # Check if user exists
-        existing_user = await db["users"].find_one({"email": user_in.email})
-        if existing_user:
-            raise HTTPException(
-                status_code=400,
-                detail="Error: Email is already in use!"
-            )
-        
-        hashed_password = get_password_hash(user_in.password)
-        
-        user_dict = user_in.model_dump(by_alias=True, exclude_unset=True)
-        user_dict["password"] = hashed_password
-        
-        # Insert
-        result = await db["users"].insert_one(user_dict)
-        
-        return {"message": "User registered successfully!"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"CRITICAL ERROR during register: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Database/Registration error: {str(e)}")
+    # Check if user exists
+    existing_user = await db["users"].find_one({"email": user_in.email})
+    if existing_user:
+        raise HTTPException(
+            status_code=400,
+            detail="Error: Email is already in use!"
+        )
+    
+    hashed_password = await get_password_hash_async(user_in.password)
+    
+    user_dict = user_in.model_dump(by_alias=True, exclude_unset=True)
+    user_dict["password"] = hashed_password
+    
+    # Insert
+    result = await db["users"].insert_one(user_dict)
+    
+    return {"message": "User registered successfully!"}
+
+@router.post("/refresh")
+async def refresh(
+    refresh_request: dict = Body(...),
+    db = Depends(get_database)
+) -> Any:
+    """Exchanges a refresh token for a new access token and a rotated refresh token"""
+    refresh_token = refresh_request.get("refreshToken")
+    if not refresh_token:
+        raise HTTPException(status_code=400, detail="refreshToken required")
+
+    session, new_refresh_token = await rotate_session(db, refresh_token)
+    if session is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
+
+    # Re-read the user so role changes take effect at the next refresh
+    user = await db["users"].find_one({"_id": ObjectId(session["user_id"])}, {"password": 0})
+    if user is None:
+        await revoke_session(db, str(session["_id"]), reason="user_missing")
+        raise HTTPException(status_code=401, detail="User not found")
+
+    claims = user_claims(user)
+    access_token = create_access_token(data={**claims, "sid": str(session["_id"])})
+    return {
+        "token": access_token,
+        "accessToken": access_token,
+        "refreshToken": new_refresh_token,
+        "type": "Bearer",
+        "roles": claims["roles"],
+        "expiresIn": int(access_token_lifetime().total_seconds())
+    }
+
+@router.post("/logout")
+async def logout(
+    logout_request: dict = Body(default={}),
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db = Depends(get_database)
+):
+    """
+    Ends the refresh session named by {"refreshToken": ...}, which works even
+    after the access token expired. Without one, ends the access token's
+    session, or revokes the token itself when it has none.
+    """
+    refresh_token = logout_request.get("refreshToken")
+    if refresh_token:
+        # Unknown or already revoked tokens log out quietly, like a repeated logout
+        await revoke_session_by_token(db, refresh_token)
+        return {"message": "Logged out"}
+
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    payload = await get_token_payload(token)
+    if payload.get("sid"):
+        await revoke_session(db, payload["sid"])
+    # Tokens issued before jti claims existed cannot be revoked individually
+    elif payload.get("jti"):
+        await revocation_list.revoke_token(db, payload)
+    return {"message": "Logged out"}
@@ -1,5 +1,6 @@
 import os
 import shutil
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Body, Form, UploadFile, File
 from typing import List, Optional
 from datetime import datetime
@@ -9,7 +10,13 @@ from app.models.claim_model import ClaimCreate, ClaimResponse
 from app.models.enums import ClaimStatus, ItemStatus, Role
 from app.models.user_model import UserResponse
 from app.api.deps import get_current_user
+from app.core.utils import claim_decision_fields, convert_object_ids, serialize_document
+from app.core.claim_queries import list_claims, populate_claims
+from app.core.custom_ids import insert_with_custom_id, parse_code
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -21,7 +28,6 @@ async def submit_claim(
     current_user: UserResponse = Depends(get_current_user),
     db = Depends(get_database)
 ):
-    from app.core.utils import generate_custom_id
     from app.core.cloudinary_utils import upload_image
     
     # Verify item exists
@@ -35,11 +41,9 @@ async def submit_claim(
         uploaded_url = upload_image(proof_image, folder="lostlink/claims")
         if uploaded_url:
             image_url = uploaded_url
-            print(f"Proof image uploaded to Cloudinary: {image_url}")
+            logger.debug(f"Proof image uploaded to Cloudinary: {image_url}")
         else:
-            print("Failed to upload proof image to Cloudinary, continuing without image.")
-
-    claim_id = generate_custom_id("CLM")
+            logger.warning("Failed to upload proof image to Cloudinary, continuing without image.")
 
     claim_dict = {
         "item_id": item_id,
@@ -48,76 +52,42 @@ async def submit_claim(
         "claimant_id": str(current_user.id),
         "status": "PENDING",
         "submissionDate": datetime.utcnow(),
-        "Claim_ID": claim_id
+        "updated_at": datetime.utcnow()
     }
     
-    result = await db["claims"].insert_one(claim_dict)
+    result = await insert_with_custom_id(db, "claims", claim_dict, "Claim_ID", "CLM")
     created_claim = await db["claims"].find_one({"_id": result.inserted_id})
     
     # Populate for response
     created_claim["item"] = item
     created_claim["claimant"] = current_user.model_dump(by_alias=True)
     
-    return jsonable_encoder(created_claim)
-
-def convert_object_ids(obj):
-    if isinstance(obj, list):
-        return [convert_object_ids(item) for item in obj]
-    if isinstance(obj, dict):
-        return {k: (str(v) if isinstance(v, ObjectId) else convert_object_ids(v)) for k, v in obj.items()}
-    return obj
+    return serialize_document(created_claim)
 
 @router.get("/status")
 async def get_claims_by_status(
     status: Optional[str] = Query(None),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=5000),
     current_user: UserResponse = Depends(get_current_user),
     db = Depends(get_database)
 ):
-    try:
-        print(f"DEBUG: Processing claims request for status={status}")
+    logger.debug(f"Processing claims request for status={status}")
+    
+    # Admin check
+    if str(current_user.role) != "ADMIN" and current_user.role != Role.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
         
-        # Admin check
-        if str(current_user.role) != "ADMIN" and current_user.role != Role.ADMIN:
-            raise HTTPException(status_code=403, detail="Not authorized")
-            
-        filter_dict = {}
-        if status:
-            filter_dict["status"] = status
-            
-        cursor = db["claims"].find(filter_dict).sort("submissionDate", -1)
-        claims_list = await cursor.to_list(length=100)
+    filter_dict = {}
+    if status:
+        filter_dict["status"] = status
         
-        results = []
-        for c in claims_list:
-            # Basic formatting
-            c["id"] = str(c["_id"])
-            
-            # Safe population of item
-            if c.get("item_id"):
-                try:
-                    item = await db["items"].find_one({"_id": ObjectId(str(c["item_id"]))})
-                    if item:
-                        c["item"] = item
-                except: pass
-                
-            # Safe population of claimant
-            if c.get("claimant_id"):
-                try:
-                    user = await db["users"].find_one({"_id": ObjectId(str(c["claimant_id"]))})
-                    if user:
-                        c["claimant"] = user
-                except: pass
-                
-            results.append(c)
-            
-        # RECUSIVELY convert all ObjectIds before encoding
-        safe_results = convert_object_ids(results)
-        return jsonable_encoder(safe_results)
-    except Exception as e:
-        print(f"CRITICAL API ERROR: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Server Error: {str(e)}")
+    claims_list = await list_claims(db, filter_dict, skip=skip, limit=limit)
+    for c in claims_list:
+        c["id"] = str(c["_id"])
+        
+    # Serialized in one pass; returned as-is to skip FastAPI's re-encoding
+    return JSONResponse(content=serialize_document(claims_list))
 
 @router.get("/raw-debug")
 async def get_raw_claims(db = Depends(get_database)):
@@ -137,35 +107,36 @@ async def get_claims_for_item(
     if current_user.role != Role.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
         
-    cursor = db["claims"].find({"item_id": item_id})
-    claims = await cursor.to_list(length=100)
-    
-    # Populate
-    results = []
-    for claim in claims:
-        # Populate claimant
-        user = await db["users"].find_one({"_id": ObjectId(claim["claimant_id"])})
-        if user:
-            claim["claimant"] = user
-        results.append(claim)
-    return results
+    return await list_claims(db, {"item_id": item_id}, with_item=False)
+
+@router.get("/by-code/{code}", response_model=ClaimResponse)
+async def get_claim_by_code(
+    code: str,
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Look up a claim by its Claim_ID (e.g. CLM-20260219-0007); admins or the claimant only"""
+    code = code.strip().upper()
+    try:
+        collection, field = parse_code(code)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if collection != "claims":
+        raise HTTPException(status_code=400, detail="Not a claim ID")
+
+    claim = await db["claims"].find_one({field: code})
+    if not claim or (current_user.role != Role.ADMIN and claim.get("claimant_id") != str(current_user.id)):
+        raise HTTPException(status_code=404, detail="Claim not found")
+
+    await populate_claims(db, [claim])
+    return claim
 
 @router.get("/my-claims", response_model=List[ClaimResponse])
 async def get_my_claims(
     current_user: UserResponse = Depends(get_current_user),
     db = Depends(get_database)
 ):
-    cursor = db["claims"].find({"claimant_id": str(current_user.id)})
-    claims = await cursor.to_list(length=100)
-    
-    results = []
-    for claim in claims:
-        # Populate item
-        item = await db["items"].find_one({"_id": ObjectId(claim["item_id"])})
-        if item:
-            claim["item"] = item
-        results.append(claim)
-    return results
+    return await list_claims(db, {"claimant_id": str(current_user.id)}, with_claimant=False)
 
 @router.put("/{id}/verify")
 async def verify_claim(
@@ -178,9 +149,15 @@ async def verify_claim(
     if current_user.role != Role.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
         
-    update_data = {"status": status}
+    claim = await db["claims"].find_one({"_id": ObjectId(id)})
+    if not claim:
+        raise HTTPException(status_code=404, detail="Claim not found")
+        
+    update_data = {"status": status, "updated_at": datetime.utcnow()}
     if remarks:
         update_data["admin_remarks"] = remarks
+    if status in (ClaimStatus.APPROVED, ClaimStatus.REJECTED):
+        update_data.update(claim_decision_fields(claim, status, str(current_user.id), current_user.name))
         
     result = await db["claims"].update_one(
         {"_id": ObjectId(id)},
@@ -192,27 +169,26 @@ async def verify_claim(
         
     # If approved, update item
     if status == ClaimStatus.APPROVED:
-        claim = await db["claims"].find_one({"_id": ObjectId(id)})
-        if claim:
-            await db["items"].update_one(
-                {"_id": ObjectId(claim["item_id"])},
-                {"$set": {"status": ItemStatus.CLAIMED}} # Required mandatory physical handover
-            )
-            
-            # Send notification to claimant
-            item = await db["items"].find_one({"_id": ObjectId(claim["item_id"])})
-            storage_info = f" at {item.get('storage_location')}" if item and item.get('storage_location') else ""
-            
-            notification_data = {
-                "user_id": str(claim["claimant_id"]),
-                "title": "Claim Approved! 🎉",
-                "message": f"Your claim for {item.get('category', 'item') if item else 'an item'} has been approved. Please collect it{storage_info}.",
-                "type": "CLAIM_APPROVED",
-                "related_id": str(claim["item_id"]),
-                "read": False,
-                "created_at": datetime.utcnow()
-            }
-            await db["notifications"].insert_one(notification_data)
+        await db["items"].update_one(
+            {"_id": ObjectId(claim["item_id"])},
+            {"$set": {"status": ItemStatus.CLAIMED, "updated_at": datetime.utcnow()}} # Required mandatory physical handover
+        )
+        
+        # Send notification to claimant
+        item = await db["items"].find_one({"_id": ObjectId(claim["item_id"])})
+        storage_info = f" at {item.get('storage_location')}" if item and item.get('storage_location') else ""
+        
+        notification_data = {
+            "user_id": str(claim["claimant_id"]),
+            "title": "Claim Approved! 🎉",
+            "message": f"Your claim for {item.get('category', 'item') if item else 'an item'} has been approved. Please collect it{storage_info}.",
+            "type": "CLAIM_APPROVED",
+            "related_id": str(claim["item_id"]),
+            "read": False,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow()
+        }
+        await db["notifications"].insert_one(notification_data)
             
     updated_claim = await db["claims"].find_one({"_id": ObjectId(id)})
     
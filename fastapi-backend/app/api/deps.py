@@ -5,27 +5,50 @@ from pydantic import ValidationError
 from typing import Optional
 from app.core.config import settings
 from app.models.user_model import UserResponse
+from app.models.enums import Role
 from app.core.database import get_database
+from app.core.revocation import revocation_list
 from app.models.common import PyObjectId
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
+# For endpoints that also accept other credentials (logout with a refresh token)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login", auto_error=False)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db = Depends(get_database)) -> UserResponse:
+async def get_token_payload(token: str = Depends(oauth2_scheme)) -> dict:
+    """Decoded access token claims; resolved once per request and shared by the auth dependencies"""
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
     except (JWTError, ValidationError):
+        payload = None
+    if payload is None or payload.get("sub") is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    return payload
+
+async def get_current_user(payload: dict = Depends(get_token_payload), db = Depends(get_database)) -> UserResponse:
+    await revocation_list.sync(db)
+    if revocation_list.is_revoked(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Stateless mode trusts the signed identity claims; tokens issued before
+    # those claims existed fall through to the database lookup
+    if settings.AUTH_STATELESS and payload.get("id") and payload.get("roles"):
+        return UserResponse(
+            _id=payload["id"],
+            email=payload["sub"],
+            name=payload.get("name") or "",
+            registerNumber=payload.get("registerNumber"),
+            role=payload["roles"][0]
+        )
+
+    email: str = payload["sub"]
     
     user = await db["users"].find_one({"email": email})
     if user is None:
@@ -38,3 +61,24 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db = Depends(get
     # helper to convert _id to str if needed, but Pydantic handles it via aliases usually if configured
     # We return the dict and Pydantic parses it
     return UserResponse(**user)
+
+async def require_admin_claim(payload: dict = Depends(get_token_payload)) -> dict:
+    # Rejects non-admin tokens from their roles claim, before any database work
+    if Role.ADMIN.value not in payload.get("roles", []):
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return payload
+
+async def require_admin(
+    payload: dict = Depends(require_admin_claim),
+    current_user: UserResponse = Depends(get_current_user)
+) -> UserResponse:
+    """
+    Router-level guard for admin routes. The token claim is checked first; the
+    role is then confirmed through get_current_user (the stored role, or in
+    stateless mode the unrevoked claims) so a demoted admin loses access before
+    their token expires. Handlers that also depend on get_current_user reuse
+    the same per-request result instead of looking the user up again.
+    """
+    if current_user.role != Role.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return current_user
@@ -1,16 +1,23 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body, Form, UploadFile, File
 from typing import List
 from datetime import datetime
+from functools import partial
 from bson import ObjectId
 from app.core.database import get_database
 from app.models.item_model import ItemCreate, ItemResponse, ItemInDB
 from app.models.enums import ItemType, ItemStatus, Role
 from app.models.user_model import UserResponse
 from app.api.deps import get_current_user
-from app.core.utils import generate_custom_id
+from app.core.custom_ids import insert_with_custom_id, parse_code
+from app.core.utils import serialize_document
+from app.core.storage_racks import update_item_tracked
+from app.core.item_tiering import ARCHIVE_COLLECTION, find_item, find_items
 from app.core.cloudinary_utils import upload_image
-from fastapi.encoders import jsonable_encoder
+from app.core.concurrency import gather_limited
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -24,55 +31,47 @@ async def report_item(
     dateTime: str = Form(None), # Frontend sends ISO string
     image: UploadFile = File(None),
     current_user: UserResponse = Depends(get_current_user),
-    try:
-        image_url = None
-        if image:
-            # Upload to Cloudinary instead of local storage
-            uploaded_url = upload_image(image, folder="lostlink/items")
-            if uploaded_url:
-                image_url = uploaded_url
-                print(f"Image uploaded to Cloudinary: {image_url}")
-            else:
-                print("Failed to upload image to Cloudinary, continuing without image.")
-
-        # Generate custom ID based on type
-        lost_id = None
-        found_id = None
-        if type == ItemType.LOST:
-            lost_id = generate_custom_id("LOST")
+    db = Depends(get_database)
+):
+    image_url = None
+    if image:
+        # Upload to Cloudinary instead of local storage
+        uploaded_url = upload_image(image, folder="lostlink/items")
+        if uploaded_url:
+            image_url = uploaded_url
+            logger.debug(f"Image uploaded to Cloudinary: {image_url}")
         else:
-            found_id = generate_custom_id("FND")
-
-        # Construct item dict manually since we are using Form data
-        item_dict = {
-            "type": type,
-            "category": category,
-            "description": description,
-            "location": location,
-            "status": status, # PENDING/OPEN
-            "user_id": str(current_user.id),
-            "imageUrl": image_url,
-            "dateTime": datetime.utcnow(),
-            "Lost_ID": lost_id,
-            "Found_ID": found_id
-        }
-
-        # Insert into DB
-        result = await db["items"].insert_one(item_dict)
-        created_item = await db["items"].find_one({"_id": result.inserted_id})
-        
-        if not created_item:
-             raise HTTPException(status_code=404, detail="Item creation failed")
+            logger.warning("Failed to upload image to Cloudinary, continuing without image.")
 
-        # Populate user details
-        created_item["user"] = current_user.model_dump(by_alias=True)
-        
-        return jsonable_encoder(created_item)
-    except Exception as e:
-        print(f"CRITICAL ERROR in report_item: {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+    # Construct item dict manually since we are using Form data
+    item_dict = {
+        "type": type,
+        "category": category,
+        "description": description,
+        "location": location,
+        "status": status, # PENDING/OPEN
+        "user_id": str(current_user.id),
+        "imageUrl": image_url,
+        "dateTime": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+        "Lost_ID": None,
+        "Found_ID": None
+    }
+
+    # Insert into DB with a sequential custom ID based on type
+    if type == ItemType.LOST:
+        result = await insert_with_custom_id(db, "items", item_dict, "Lost_ID", "LOST")
+    else:
+        result = await insert_with_custom_id(db, "items", item_dict, "Found_ID", "FND")
+    created_item = await db["items"].find_one({"_id": result.inserted_id})
+    
+    if not created_item:
+         raise HTTPException(status_code=404, detail="Item creation failed")
+
+    # Populate user details
+    created_item["user"] = current_user.model_dump(by_alias=True)
+    
+    return serialize_document(created_item)
 
 @router.get("/feed", response_model=List[ItemResponse])
 async def get_item_feed(
@@ -130,77 +129,97 @@ async def get_found_items(
         results.append(item)
     return results
 
+def _claim_summary(claim: dict) -> dict:
+    return {
+        "verificationDetails": claim.get("verificationDetails"),
+        "proofImageUrl": claim.get("proofImageUrl"),
+        "status": claim.get("status"),
+        "submissionDate": claim.get("submissionDate"),
+        "Claim_ID": claim.get("Claim_ID"),
+        "adminRemarks": claim.get("admin_remarks")
+    }
+
 @router.get("/my-requests", response_model=List[ItemResponse])
 async def get_my_requests(
     current_user: UserResponse = Depends(get_current_user),
     db = Depends(get_database)
 ):
-    # 1. Items reported by the user
-    items_cursor = db["items"].find({"user_id": str(current_user.id)}).sort("dateTime", -1)
-    reported_items = await items_cursor.to_list(length=100)
-    
-    for item in reported_items:
-        item["is_report"] = True
-        # For reports, check if there are any claims so we can show the reporter 'how they claimed'
-        item_id_str = str(item["_id"])
-        claim = await db["claims"].find_one(
-            {"item_id": item_id_str, "status": "APPROVED"}
-        )
-        if not claim:
-            # If no approved claim, show the most recent pending one
-            claim = await db["claims"].find_one(
-                {"item_id": item_id_str},
-                sort=[("submissionDate", -1)]
-            )
-            
-        if claim:
-            item["user_claim"] = {
-                "verificationDetails": claim.get("verificationDetails"),
-                "proofImageUrl": claim.get("proofImageUrl"),
-                "status": claim.get("status"),
-                "submissionDate": claim.get("submissionDate"),
-                "Claim_ID": claim.get("Claim_ID"),
-                "adminRemarks": claim.get("admin_remarks"),
-                "claimant_name": "Applicant"
-            }
-    
-    # 2. Items claimed by the user (but not reported by them)
-    claims_cursor = db["claims"].find({"claimant_id": str(current_user.id)})
-    claims = await claims_cursor.to_list(length=100)
-    
+    user_id = str(current_user.id)
+    # 1. Items reported by the user, and the user's own claims
+    # Reports that were tiered to items_archive are still the user's history
+    reported_items, archived_reports, claims = await gather_limited(
+        partial(db["items"].find({"user_id": user_id}).sort("dateTime", -1).to_list, length=100),
+        partial(db[ARCHIVE_COLLECTION].find({"user_id": user_id}).sort("dateTime", -1).to_list, length=100),
+        partial(db["claims"].find({"claimant_id": user_id}).to_list, length=100)
+    )
+    reported_items += archived_reports
+
     claim_map = {str(c["item_id"]): c for c in claims}
     claimed_item_ids = [ObjectId(item_id) for item_id in claim_map.keys()]
     
     # Filter out items already in the reported list
     reported_item_ids = [str(i["_id"]) for i in reported_items]
     new_item_ids = [id for id in claimed_item_ids if str(id) not in reported_item_ids]
-    
+
+    # 2. For reports, the claim that best explains 'how they claimed' (approved
+    # first, else the most recent), for all reports in one aggregation, fetched
+    # alongside the items claimed by the user (but not reported by them)
+    best_claims, claimed_items = await gather_limited(
+        partial(db["claims"].aggregate([
+            {"$match": {"item_id": {"$in": reported_item_ids}}},
+            {"$project": {
+                "item_id": 1, "verificationDetails": 1, "proofImageUrl": 1, "status": 1,
+                "submissionDate": 1, "Claim_ID": 1, "admin_remarks": 1,
+                "approved": {"$cond": [{"$eq": ["$status", "APPROVED"]}, 1, 0]}
+            }},
+            {"$sort": {"item_id": 1, "approved": -1, "submissionDate": -1}},
+            {"$group": {"_id": "$item_id", "claim": {"$first": "$$ROOT"}}}
+        ]).to_list, length=None),
+        partial(find_items, db, new_item_ids)
+    )
+    best_claim_map = {entry["_id"]: entry["claim"] for entry in best_claims}
+
+    for item in reported_items:
+        item["is_report"] = True
+        claim = best_claim_map.get(str(item["_id"]))
+        if claim:
+            item["user_claim"] = {**_claim_summary(claim), "claimant_name": "Applicant"}
+
     items = list(reported_items)
-    
-    if new_item_ids:
-        claimed_items_cursor = db["items"].find({"_id": {"$in": new_item_ids}})
-        claimed_items = await claimed_items_cursor.to_list(length=100)
-        
-        for item in claimed_items:
-            item_id_str = str(item["_id"])
-            if item_id_str in claim_map:
-                claim = claim_map[item_id_str]
-                # Populate user_claim with specific details
-                item["user_claim"] = {
-                    "verificationDetails": claim.get("verificationDetails"),
-                    "proofImageUrl": claim.get("proofImageUrl"),
-                    "status": claim.get("status"),
-                    "submissionDate": claim.get("submissionDate"),
-                    "Claim_ID": claim.get("Claim_ID"),
-                    "adminRemarks": claim.get("admin_remarks")
-                }
-            item["is_claim"] = True
-            items.append(item)
+
+    for item in claimed_items:
+        item_id_str = str(item["_id"])
+        if item_id_str in claim_map:
+            # Populate user_claim with specific details
+            item["user_claim"] = _claim_summary(claim_map[item_id_str])
+        item["is_claim"] = True
+        items.append(item)
         
     # Final sort
     items.sort(key=lambda x: x["dateTime"], reverse=True)
     return items
 
+@router.get("/by-code/{code}", response_model=ItemResponse)
+async def get_item_by_code(
+    code: str,
+    include_archive: bool = Query(True),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """Look up an item by the Lost_ID/Found_ID printed on its tag (e.g. FND-20260219-0042)"""
+    code = code.strip().upper()
+    try:
+        collection, field = parse_code(code)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if collection != "items":
+        raise HTTPException(status_code=400, detail="Not an item ID")
+
+    item = await find_item(db, {field: code}, include_archive)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
 @router.get("/lost", response_model=List[ItemResponse])
 async def get_lost_items(
     current_user: UserResponse = Depends(get_current_user),
@@ -231,13 +250,10 @@ async def update_item_status(
     if current_user.role != Role.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
         
-    result = await db["items"].update_one(
-        {"_id": ObjectId(id)},
-        {"$set": {"status": status}}
-    )
+    previous = await update_item_tracked(db, {"_id": ObjectId(id)}, {"status": status})
     
-    if result.modified_count == 0:
+    if previous is None:
          raise HTTPException(status_code=404, detail="Item not found")
          
     updated_item = await db["items"].find_one({"_id": ObjectId(id)})
-    return updated_item
+    return serialize_document(updated_item)
@@ -43,7 +43,7 @@ async def mark_user_notification_read(
         
     result = await db["notifications"].update_one(
         {"_id": obj_id, "user_id": str(current_user.id)},
-        {"$set": {"read": True}}
+        {"$set": {"read": True, "updated_at": datetime.utcnow()}}
     )
     
     if result.matched_count == 0:
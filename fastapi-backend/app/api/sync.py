@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
+from typing import Optional
+from app.core.database import get_database
+from app.models.user_model import UserResponse
+from app.api.deps import get_current_user
+from app.core.sync import InvalidSyncToken, fetch_changes
+from app.core.utils import serialize_document
+
+router = APIRouter()
+
+@router.get("")
+async def sync_changes(
+    since: Optional[str] = Query(None, description="Token from the previous sync; omit for a full snapshot"),
+    current_user: UserResponse = Depends(get_current_user),
+    db = Depends(get_database)
+):
+    """
+    Items, claims and notifications changed since `since`, plus the ids
+    deleted or no longer visible. Store the returned token for the next call
+    and repeat immediately while `has_more` is true. On `reset` the client
+    should drop its cache and keep the snapshot instead.
+    """
+    try:
+        changes = await fetch_changes(db, str(current_user.id), since)
+    except InvalidSyncToken as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JSONResponse(serialize_document(changes))
@@ -0,0 +1,119 @@
+import json
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from pymongo.errors import BulkWriteError, OperationFailure
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+AUDIT_COLLECTION = "audit_logs"
+PARTITION_PREFIX = "audit_logs_"
+DUPLICATE_KEY = 11000
+
+
+def partition_name(timestamp: datetime) -> str:
+    """
+    Monthly archive partition for an audit timestamp.
+    Example: audit_logs_2026_02
+    """
+    return f"{PARTITION_PREFIX}{timestamp.year:04d}_{timestamp.month:02d}"
+
+
+def time_window(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    default_days: Optional[int] = None
+) -> dict:
+    """
+    Build a bounded `timestamp` filter.
+    Open-ended queries fall back to the configured window so their cost
+    does not grow with the size of the history.
+    """
+    if since is None:
+        days = default_days or settings.AUDIT_LOG_QUERY_WINDOW_DAYS
+        since = (until or datetime.utcnow()) - timedelta(days=days)
+    window = {"$gte": since}
+    if until is not None:
+        window["$lte"] = until
+    return window
+
+
+async def ensure_audit_indexes(db):
+    """Indexes for the bounded audit queries plus the TTL retention index"""
+    col = db[AUDIT_COLLECTION]
+    await col.create_index([("admin_id", 1), ("action", 1), ("timestamp", -1)])
+    await col.create_index([("target_id", 1), ("timestamp", -1)])
+    await col.create_index([("action", 1), ("timestamp", -1)])
+
+    retention_days = settings.AUDIT_LOG_RETENTION_DAYS
+    ttl = {"expireAfterSeconds": retention_days * 86400} if retention_days > 0 else {}
+    try:
+        await col.create_index("timestamp", name="timestamp_ttl", **ttl)
+    except OperationFailure:
+        if not ttl:
+            logger.warning("audit_logs still has a TTL index; drop 'timestamp_ttl' to disable retention")
+            return
+        # Retention changed since the index was built - adjust it in place
+        await db.command(
+            "collMod", AUDIT_COLLECTION,
+            index={"name": "timestamp_ttl", "expireAfterSeconds": ttl["expireAfterSeconds"]}
+        )
+
+
+async def _flush_partition(db, name: str, entries: list, export_dir: Optional[str]):
+    partition = db[name]
+    try:
+        await partition.insert_many(entries, ordered=False)
+    except BulkWriteError as e:
+        # Entries copied by an interrupted earlier run are already there
+        if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+            raise
+
+    if export_dir:
+        with open(os.path.join(export_dir, f"{name}.jsonl"), "a", encoding="utf-8") as fh:
+            for entry in entries:
+                fh.write(json.dumps(entry, default=str) + "\n")
+
+    await db[AUDIT_COLLECTION].delete_many({"_id": {"$in": [e["_id"] for e in entries]}})
+
+
+async def archive_audit_logs(
+    db,
+    older_than_days: Optional[int] = None,
+    export_dir: Optional[str] = None,
+    batch_size: int = 1000
+) -> dict:
+    """
+    Move audit entries older than the cutoff out of the hot collection into
+    monthly partitions (audit_logs_YYYY_MM), optionally appending them to
+    JSONL files in `export_dir`. Safe to re-run after an interruption.
+    """
+    days = older_than_days if older_than_days is not None else settings.AUDIT_LOG_ARCHIVE_AFTER_DAYS
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    if export_dir:
+        os.makedirs(export_dir, exist_ok=True)
+
+    moved = {}
+    pending = {}
+    cursor = db[AUDIT_COLLECTION].find({"timestamp": {"$lt": cutoff}}).sort("timestamp", 1).batch_size(batch_size)
+    async for entry in cursor:
+        name = partition_name(entry["timestamp"])
+        pending.setdefault(name, []).append(entry)
+        if len(pending[name]) >= batch_size:
+            await _flush_partition(db, name, pending.pop(name), export_dir)
+            moved[name] = moved.get(name, 0) + batch_size
+
+    for name, entries in pending.items():
+        await _flush_partition(db, name, entries, export_dir)
+        moved[name] = moved.get(name, 0) + len(entries)
+
+    for name in moved:
+        await db[name].create_index("timestamp")
+
+    return {
+        "cutoff": cutoff.isoformat(),
+        "partitions": moved,
+        "total_archived": sum(moved.values())
+    }
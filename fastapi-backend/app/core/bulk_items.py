@@ -0,0 +1,96 @@
+"""
+Bulk item updates.
+
+bulk_update_items applies one `$set` to a set of already-fetched items with
+a single unordered bulk_write. Every write is guarded on the status and
+storage_location the item was read with, so an item another admin changed
+in the meantime is reported as a CONFLICT rather than overwritten, and its
+rack occupancy is never double counted. Items already in the target state
+are skipped as UNCHANGED, which makes re-running a clean-up harmless.
+"""
+from datetime import datetime
+from typing import Dict, List, Tuple
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from app.core.storage_racks import apply_transitions
+
+UPDATED = "UPDATED"
+UNCHANGED = "UNCHANGED"
+CONFLICT = "CONFLICT"
+FAILED = "FAILED"
+NOT_FOUND = "NOT_FOUND"
+INVALID_ID = "INVALID_ID"
+
+# Fields an item is read and guarded on; also what bulk callers must project
+STATE_FIELDS = ("status", "storage_location")
+PROJECTION = {"status": 1, "storage_location": 1, "category": 1, "type": 1}
+
+
+def _stored_value(value):
+    # BSON dates keep millisecond precision; match what a re-read returns
+    if isinstance(value, datetime):
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value
+
+
+def _in_target_state(item: dict, update_data: dict) -> bool:
+    return all(item.get(field) == update_data[field] for field in STATE_FIELDS if field in update_data)
+
+
+async def bulk_update_items(db, items: List[dict], update_data: dict) -> Tuple[Dict[str, str], List[dict]]:
+    """
+    Returns ({item_id: result}, [items as they were before each applied update]).
+    `items` must carry the PROJECTION fields.
+    """
+    update_data = {k: _stored_value(v) for k, v in {**update_data, "updated_at": datetime.utcnow()}.items()}
+    results, pending = {}, []
+    for item in items:
+        if _in_target_state(item, update_data):
+            results[str(item["_id"])] = UNCHANGED
+        else:
+            pending.append(item)
+    if not pending:
+        return results, []
+
+    requests = [
+        UpdateOne(
+            {"_id": item["_id"], **{field: item.get(field) for field in STATE_FIELDS}},
+            {"$set": update_data}
+        )
+        for item in pending
+    ]
+    failed = set()
+    try:
+        outcome = await db["items"].bulk_write(requests, ordered=False)
+        matched = outcome.matched_count
+    except BulkWriteError as e:
+        failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        matched = e.details.get("nMatched", 0)
+
+    if matched + len(failed) == len(pending):
+        applied = [item for i, item in enumerate(pending) if i not in failed]
+    else:
+        # Some guards did not match: re-read to tell applied writes from conflicts
+        current = {
+            doc["_id"]: doc
+            async for doc in db["items"].find(
+                {"_id": {"$in": [item["_id"] for item in pending]}},
+                {field: 1 for field in update_data}
+            )
+        }
+        applied = [
+            item for i, item in enumerate(pending)
+            if i not in failed and all(
+                current.get(item["_id"], {}).get(k) == v for k, v in update_data.items()
+            )
+        ]
+
+    applied_ids = {item["_id"] for item in applied}
+    for i, item in enumerate(pending):
+        if i in failed:
+            results[str(item["_id"])] = FAILED
+        else:
+            results[str(item["_id"])] = UPDATED if item["_id"] in applied_ids else CONFLICT
+
+    await apply_transitions(db, [(item, {**item, **update_data}) for item in applied])
+    return results, applied
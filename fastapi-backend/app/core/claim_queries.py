@@ -0,0 +1,59 @@
+"""
+Claim list queries.
+
+Claims reference their item and claimant by string id. Rather than one
+find_one per claim, a page of claims is populated with at most two `$in`
+fetches (items and users) issued concurrently, so the number of queries
+is constant whatever the page size. Items already tiered to items_archive
+cost one more `$in` fetch for the ones missing.
+"""
+from functools import partial
+from typing import Iterable, List, Optional
+from bson import ObjectId
+from app.core.concurrency import gather_limited
+from app.core.lookups import USER_PRIVATE_FIELDS
+from app.core.item_tiering import find_items
+
+
+def _object_ids(values: Iterable) -> List[ObjectId]:
+    return list({ObjectId(str(v)) for v in values if v and ObjectId.is_valid(str(v))})
+
+
+async def populate_claims(db, claims: List[dict], with_item: bool = True, with_claimant: bool = True) -> List[dict]:
+    """Attaches `item` and/or `claimant` to each claim in place; unresolvable references are left unset"""
+    calls, targets = [], []
+    if with_item:
+        item_ids = _object_ids(c.get("item_id") for c in claims)
+        if item_ids:
+            calls.append(partial(find_items, db, item_ids))
+            targets.append(("item", "item_id"))
+    if with_claimant:
+        user_ids = _object_ids(c.get("claimant_id") for c in claims)
+        if user_ids:
+            calls.append(partial(db["users"].find({"_id": {"$in": user_ids}}, USER_PRIVATE_FIELDS).to_list, length=None))
+            targets.append(("claimant", "claimant_id"))
+
+    results = await gather_limited(*calls) if calls else []
+    for (as_field, local_field), docs in zip(targets, results):
+        by_id = {str(doc["_id"]): doc for doc in docs}
+        for claim in claims:
+            doc = by_id.get(str(claim.get(local_field)))
+            if doc is not None:
+                claim[as_field] = doc
+    return claims
+
+
+async def list_claims(
+    db,
+    filter_dict: dict,
+    skip: int = 0,
+    limit: Optional[int] = 100,
+    with_item: bool = True,
+    with_claimant: bool = True
+) -> List[dict]:
+    """Newest-first page of claims matching `filter_dict`, populated in batch"""
+    cursor = db["claims"].find(filter_dict).sort("submissionDate", -1).skip(skip)
+    if limit:
+        cursor = cursor.limit(limit)
+    claims = await cursor.to_list(length=limit)
+    return await populate_claims(db, claims, with_item=with_item, with_claimant=with_claimant)
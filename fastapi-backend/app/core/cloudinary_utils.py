@@ -1,33 +1,52 @@
-import cloudinary
-import cloudinary.uploader
+import time
+import logging
+from functools import lru_cache
 from fastapi import UploadFile
 from app.core.config import settings
+from app.core.metrics import UPLOAD_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _uploader():
+    """
+    Imports and configures the Cloudinary SDK on first use.
+    The SDK (and the HTTP stack it drags in) is only needed when an image
+    is actually uploaded, so it stays out of application startup.
+    """
+    import cloudinary
+    import cloudinary.uploader
 
-# Initialize Cloudinary configuration
-if settings.CLOUDINARY_CLOUD_NAME and settings.CLOUDINARY_API_KEY and settings.CLOUDINARY_API_SECRET:
     cloudinary.config(
         cloud_name=settings.CLOUDINARY_CLOUD_NAME,
         api_key=settings.CLOUDINARY_API_KEY,
         api_secret=settings.CLOUDINARY_API_SECRET,
         secure=True
     )
+    return cloudinary.uploader
 
 def upload_image(file: UploadFile, folder: str = "lostlink") -> str:
     """
     Uploads an image to Cloudinary and returns the secure URL.
     Returns None if upload fails or if cloudinary is not configured.
     """
-    if not settings.CLOUDINARY_CLOUD_NAME:
-        print("Cloudinary is not configured. Cannot upload image.")
+    if not (settings.CLOUDINARY_CLOUD_NAME and settings.CLOUDINARY_API_KEY and settings.CLOUDINARY_API_SECRET):
+        logger.warning("Cloudinary is not configured. Cannot upload image.")
         return None
 
+    started = time.perf_counter()
+    outcome = "error"
     try:
-        result = cloudinary.uploader.upload(
+        result = _uploader().upload(
             file.file,
             folder=folder,
             resource_type="image"
         )
+        outcome = "ok"
         return result.get("secure_url")
     except Exception as e:
-        print(f"Error uploading image to Cloudinary: {e}")
+        logger.error(f"Error uploading image to Cloudinary: {e}")
         return None
+    finally:
+        UPLOAD_DURATION.observe(time.perf_counter() - started, folder=folder, outcome=outcome)
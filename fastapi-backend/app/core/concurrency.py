@@ -0,0 +1,32 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+from app.core.config import settings
+
+
+async def gather_limited(*calls: Callable[[], Awaitable], limit: Optional[int] = None) -> list:
+    """
+    Run independent queries concurrently, at most `limit` at a time
+    (QUERY_FANOUT_LIMIT by default), and return their results in order.
+
+    Pass zero-argument callables such as
+    `functools.partial(col.count_documents, query)`, not awaitables: Motor
+    dispatches a query as soon as its method is called, so the call itself
+    has to wait for a free slot.
+
+    Every call runs to completion. A single failure is re-raised as-is so
+    HTTPExceptions keep their status codes; several failures are raised
+    together as an ExceptionGroup.
+    """
+    semaphore = asyncio.Semaphore(limit or settings.QUERY_FANOUT_LIMIT)
+
+    async def run(call):
+        async with semaphore:
+            return await call()
+
+    results = await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise BaseExceptionGroup(f"{len(errors)} of {len(results)} concurrent queries failed", errors)
+    return results
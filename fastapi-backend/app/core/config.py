@@ -1,17 +1,207 @@
+import ipaddress
 import os
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator, model_validator
+
+READ_PREFERENCES = ("primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest")
+COMPRESSORS = ("zstd", "snappy", "zlib")
 
 class Settings(BaseModel):
     APP_NAME: str = "REC LostLink"
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "lostlink_db_review")
+
+    # Motor client / connection pool
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "0")) # 0 keeps idle connections
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "0")) # 0 waits indefinitely
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+    MONGO_CONNECT_TIMEOUT_MS: int = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+    MONGO_COMPRESSORS: str = os.getenv("MONGO_COMPRESSORS", "") # e.g. "zstd,snappy,zlib"
+    MONGO_READ_PREFERENCE: str = os.getenv("MONGO_READ_PREFERENCE", "primary")
+    MONGO_WRITE_CONCERN: str = os.getenv("MONGO_WRITE_CONCERN", "") # "majority" or a node count; empty uses the server default
+
     SECRET_KEY: str = os.getenv("SECRET_KEY", "9a4f2c8d3b7a1e6f4g5h8i0j2k4l6m8n0p2q4r6s8t0u2v4w6x8y0z")
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 # 1 day
+    # Access tokens are short-lived; clients renew them through /api/auth/refresh
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14")) # idle timeout of a session
+    REFRESH_REUSE_GRACE_SECONDS: int = int(os.getenv("REFRESH_REUSE_GRACE_SECONDS", "10"))
+    # Stateless auth: trust signed token claims instead of loading the user on every request.
+    # Tokens are short-lived and checked against an in-memory revocation list synced from MongoDB.
+    AUTH_STATELESS: bool = os.getenv("AUTH_STATELESS", "false").lower() in ("1", "true", "yes")
+    STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
+    REVOCATION_SYNC_SECONDS: int = int(os.getenv("REVOCATION_SYNC_SECONDS", "30"))
+    # Re-read window for revocations stamped by a worker whose clock runs behind
+    REVOCATION_SYNC_GRACE_SECONDS: int = int(os.getenv("REVOCATION_SYNC_GRACE_SECONDS", "60"))
+    # Login throttling, checked before bcrypt runs; 0 disables a limit.
+    # "mongo" shares counters across workers through the rate_limits collection.
+    LOGIN_RATE_LIMIT_STORE: str = os.getenv("LOGIN_RATE_LIMIT_STORE", "memory")
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_IP", "30"))
+    LOGIN_RATE_WINDOW_SECONDS: int = int(os.getenv("LOGIN_RATE_WINDOW_SECONDS", "60"))
+    LOGIN_MAX_FAILURES_PER_EMAIL: int = int(os.getenv("LOGIN_MAX_FAILURES_PER_EMAIL", "5"))
+    LOGIN_FAILURE_WINDOW_SECONDS: int = int(os.getenv("LOGIN_FAILURE_WINDOW_SECONDS", "900"))
+    LOGIN_LOCKOUT_SECONDS: int = int(os.getenv("LOGIN_LOCKOUT_SECONDS", "900"))
+    # Reverse proxies (IPs or CIDRs, comma-separated; "*" = any peer) whose X-Forwarded-For
+    # is trusted for the client IP. Empty: the socket peer address is the client.
+    TRUSTED_PROXIES: str = os.getenv("TRUSTED_PROXIES", "")
+    BCRYPT_WORKERS: int = int(os.getenv("BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
 
     # Cloudinary Config
     CLOUDINARY_CLOUD_NAME: str = os.getenv("CLOUDINARY_CLOUD_NAME", "")
     CLOUDINARY_API_KEY: str = os.getenv("CLOUDINARY_API_KEY", "")
     CLOUDINARY_API_SECRET: str = os.getenv("CLOUDINARY_API_SECRET", "")
 
+    # Sequential custom IDs (FND-YYYYMMDD-NNNN) reserved per counter round trip
+    CUSTOM_ID_BLOCK_SIZE: int = int(os.getenv("CUSTOM_ID_BLOCK_SIZE", "20"))
+
+    # Most items one bulk admin operation may touch
+    BULK_OPERATION_MAX_ITEMS: int = int(os.getenv("BULK_OPERATION_MAX_ITEMS", "1000"))
+    # CSV import rows validated, inserted and matched together (capped by BULK_OPERATION_MAX_ITEMS per file)
+    IMPORT_BATCH_SIZE: int = int(os.getenv("IMPORT_BATCH_SIZE", "100"))
+
+    # Background jobs: every worker polls; a Mongo lock lets one of them run each due job
+    SCHEDULER_ENABLED: bool = os.getenv("SCHEDULER_ENABLED", "true").lower() == "true"
+    SCHEDULER_POLL_SECONDS: int = int(os.getenv("SCHEDULER_POLL_SECONDS", "60"))
+    SCHEDULER_LOCK_SECONDS: int = int(os.getenv("SCHEDULER_LOCK_SECONDS", "900"))
+    SCHEDULER_RUN_RETENTION_DAYS: int = int(os.getenv("SCHEDULER_RUN_RETENTION_DAYS", "30"))
+
+    # Archive FOUND items still unclaimed after this many days (0 disables the job)
+    AUTO_ARCHIVE_AFTER_DAYS: int = int(os.getenv("AUTO_ARCHIVE_AFTER_DAYS", "90"))
+    AUTO_ARCHIVE_INTERVAL_MINUTES: int = int(os.getenv("AUTO_ARCHIVE_INTERVAL_MINUTES", "360"))
+    AUTO_ARCHIVE_BATCH_SIZE: int = int(os.getenv("AUTO_ARCHIVE_BATCH_SIZE", "200"))
+    AUTO_ARCHIVE_MAX_BATCHES: int = int(os.getenv("AUTO_ARCHIVE_MAX_BATCHES", "25"))
+
+    # Move finished items (resolved/returned/archived/disposed) idle this many days to items_archive (0 disables)
+    TIERING_AFTER_DAYS: int = int(os.getenv("TIERING_AFTER_DAYS", "180"))
+    TIERING_INTERVAL_MINUTES: int = int(os.getenv("TIERING_INTERVAL_MINUTES", "1440"))
+    TIERING_BATCH_SIZE: int = int(os.getenv("TIERING_BATCH_SIZE", "500"))
+    TIERING_MAX_BATCHES: int = int(os.getenv("TIERING_MAX_BATCHES", "40"))
+
+    # Delta sync (GET /api/sync): documents per collection per response, re-read window, tombstone lifetime
+    SYNC_PAGE_SIZE: int = int(os.getenv("SYNC_PAGE_SIZE", "500"))
+    SYNC_GRACE_SECONDS: int = int(os.getenv("SYNC_GRACE_SECONDS", "5"))
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+    # Documents fetched per cursor round trip by the streaming admin exports
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+    # Max concurrent MongoDB queries a single request may fan out
+    QUERY_FANOUT_LIMIT: int = int(os.getenv("QUERY_FANOUT_LIMIT", "8"))
+
+    # Logging: root level, per-logger overrides ("app.api.auth=DEBUG,uvicorn.access=WARNING") and "text" or "json" output
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text")
+
+    # Full tracebacks logged per minute for unhandled errors; the rest are logged as one-liners
+    TRACEBACK_LOG_RATE_PER_MINUTE: int = int(os.getenv("TRACEBACK_LOG_RATE_PER_MINUTE", "10"))
+
+    # Requests issuing more MongoDB commands than this are logged as warnings
+    QUERY_BUDGET: int = int(os.getenv("QUERY_BUDGET", "25"))
+
+    # Bearer token required by GET /metrics; empty leaves it open (scrape from a private network)
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+
+    # Audit log retention: the archive job moves entries into monthly partitions
+    # before TTL expiry deletes them from audit_logs
+    AUDIT_LOG_RETENTION_DAYS: int = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "180")) # 0 disables TTL expiry
+    AUDIT_LOG_ARCHIVE_AFTER_DAYS: int = int(os.getenv("AUDIT_LOG_ARCHIVE_AFTER_DAYS", "90")) # 0 disables the job
+    AUDIT_LOG_ARCHIVE_INTERVAL_MINUTES: int = int(os.getenv("AUDIT_LOG_ARCHIVE_INTERVAL_MINUTES", "1440"))
+    AUDIT_LOG_QUERY_WINDOW_DAYS: int = int(os.getenv("AUDIT_LOG_QUERY_WINDOW_DAYS", "30"))
+
+    @field_validator("LOGIN_RATE_WINDOW_SECONDS", "LOGIN_FAILURE_WINDOW_SECONDS")
+    @classmethod
+    def positive_window(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("must be >= 1")
+        return v
+
+    @field_validator(
+        "SCHEDULER_POLL_SECONDS", "SCHEDULER_LOCK_SECONDS", "AUTO_ARCHIVE_INTERVAL_MINUTES",
+        "AUTO_ARCHIVE_BATCH_SIZE", "AUTO_ARCHIVE_MAX_BATCHES",
+        "TIERING_INTERVAL_MINUTES", "TIERING_BATCH_SIZE", "TIERING_MAX_BATCHES", "AUDIT_LOG_ARCHIVE_INTERVAL_MINUTES",
+        "SYNC_PAGE_SIZE", "SYNC_TOMBSTONE_RETENTION_DAYS", "EXPORT_BATCH_SIZE", "IMPORT_BATCH_SIZE"
+    )
+    @classmethod
+    def positive_job_setting(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError("must be >= 1")
+        return v
+
+    @field_validator("TRUSTED_PROXIES")
+    @classmethod
+    def valid_trusted_proxies(cls, v: str) -> str:
+        for entry in (e.strip() for e in v.split(",")):
+            if entry and entry != "*":
+                ipaddress.ip_network(entry, strict=False)
+        return v
+
+    @field_validator("LOGIN_RATE_LIMIT_STORE")
+    @classmethod
+    def known_rate_limit_store(cls, v: str) -> str:
+        if v not in ("memory", "mongo"):
+            raise ValueError("expected 'memory' or 'mongo'")
+        return v
+
+    @field_validator(
+        "MONGO_MAX_POOL_SIZE", "MONGO_MIN_POOL_SIZE", "MONGO_MAX_IDLE_TIME_MS",
+        "MONGO_WAIT_QUEUE_TIMEOUT_MS", "MONGO_SERVER_SELECTION_TIMEOUT_MS", "MONGO_CONNECT_TIMEOUT_MS"
+    )
+    @classmethod
+    def non_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("must be >= 0")
+        return v
+
+    @field_validator("MONGO_COMPRESSORS")
+    @classmethod
+    def known_compressors(cls, v: str) -> str:
+        names = [c.strip() for c in v.split(",") if c.strip()]
+        unknown = [c for c in names if c not in COMPRESSORS]
+        if unknown:
+            raise ValueError(f"unknown compressors {unknown}, expected any of {list(COMPRESSORS)}")
+        return ",".join(names)
+
+    @field_validator("MONGO_READ_PREFERENCE")
+    @classmethod
+    def known_read_preference(cls, v: str) -> str:
+        if v not in READ_PREFERENCES:
+            raise ValueError(f"expected one of {list(READ_PREFERENCES)}")
+        return v
+
+    @field_validator("MONGO_WRITE_CONCERN")
+    @classmethod
+    def valid_write_concern(cls, v: str) -> str:
+        if v and v != "majority" and not v.isdigit():
+            raise ValueError("expected 'majority' or a node count")
+        return v
+
+    @field_validator("LOG_LEVEL")
+    @classmethod
+    def known_log_level(cls, v: str) -> str:
+        if v.upper() not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            raise ValueError("expected DEBUG, INFO, WARNING, ERROR or CRITICAL")
+        return v.upper()
+
+    @field_validator("LOG_FORMAT")
+    @classmethod
+    def known_log_format(cls, v: str) -> str:
+        if v not in ("text", "json"):
+            raise ValueError("expected 'text' or 'json'")
+        return v
+
+    @model_validator(mode="after")
+    def pool_bounds(self):
+        if self.MONGO_MAX_POOL_SIZE and self.MONGO_MIN_POOL_SIZE > self.MONGO_MAX_POOL_SIZE:
+            raise ValueError("MONGO_MIN_POOL_SIZE cannot exceed MONGO_MAX_POOL_SIZE")
+        return self
+
+    @model_validator(mode="after")
+    def audit_archive_before_expiry(self):
+        if self.AUDIT_LOG_RETENTION_DAYS and self.AUDIT_LOG_RETENTION_DAYS <= self.AUDIT_LOG_ARCHIVE_AFTER_DAYS:
+            # TTL expiry would delete entries before the archive job ever moves them
+            raise ValueError("AUDIT_LOG_RETENTION_DAYS must exceed AUDIT_LOG_ARCHIVE_AFTER_DAYS (or be 0)")
+        return self
+
 settings = Settings()
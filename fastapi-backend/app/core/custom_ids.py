@@ -0,0 +1,145 @@
+"""
+Human-readable, collision-free IDs printed on item tags and claim slips.
+
+Format: PREFIX-YYYYMMDD-NNNN (e.g. FND-20260219-0042), numbered per prefix
+and day. Each day's counter lives in the `counters` collection. Instead of
+one findOneAndUpdate per ID, a worker reserves a block of
+CUSTOM_ID_BLOCK_SIZE numbers at a time and hands them out from memory.
+Numbers are therefore unique but not strictly increasing across workers,
+and a restart leaves a gap.
+
+Unique partial indexes on Lost_ID, Found_ID and Claim_ID back both the
+uniqueness guarantee and the by-code lookups. insert_with_custom_id
+retries with a fresh number if an insert still collides, e.g. with a
+legacy random ID from the same day. Bulk imports take a whole batch of
+numbers in one go with allocate_many and insert_many_with_custom_ids.
+"""
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Tuple
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+COUNTERS_COLLECTION = "counters"
+MAX_INSERT_ATTEMPTS = 5
+DUPLICATE_KEY = 11000
+
+# collection -> fields holding custom IDs
+CUSTOM_ID_FIELDS = {
+    "items": ("Lost_ID", "Found_ID"),
+    "claims": ("Claim_ID",),
+}
+# ID prefix -> (collection, field)
+PREFIXES = {
+    "LOST": ("items", "Lost_ID"),
+    "FND": ("items", "Found_ID"),
+    "CLM": ("claims", "Claim_ID"),
+}
+
+
+async def ensure_custom_id_indexes(db):
+    for collection, fields in CUSTOM_ID_FIELDS.items():
+        for field in fields:
+            # Partial: documents without an ID of that kind store null or omit it
+            await db[collection].create_index(
+                field, unique=True, name=f"{field}_unique",
+                partialFilterExpression={field: {"$type": "string"}}
+            )
+
+
+def parse_code(code: str) -> Tuple[str, str]:
+    """Returns (collection, field) for a custom ID, raising ValueError for unknown prefixes"""
+    prefix = code.split("-", 1)[0].upper()
+    if prefix not in PREFIXES:
+        raise ValueError(f"Unknown ID prefix '{prefix}'")
+    return PREFIXES[prefix]
+
+
+class CustomIdAllocator:
+    def __init__(self):
+        # "PREFIX-YYYYMMDD" -> [next number, end of reserved block (exclusive)]
+        self._blocks: Dict[str, List[int]] = {}
+        self._lock = asyncio.Lock()
+
+    async def _reserve(self, db, key: str, size: int) -> List[int]:
+        counter = await db[COUNTERS_COLLECTION].find_one_and_update(
+            {"_id": key},
+            {"$inc": {"seq": size}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return [counter["seq"] - size + 1, counter["seq"] + 1]
+
+    async def allocate_many(self, db, prefix: str, count: int) -> List[str]:
+        """
+        Hands out `count` IDs, reserving one block big enough for whatever
+        the cached block cannot cover.
+        """
+        day = datetime.now().strftime("%Y%m%d")
+        key = f"{prefix}-{day}"
+        async with self._lock:
+            block = self._blocks.get(key)
+            cached = block is not None and block[1] - block[0] >= count
+            record_cache_lookup("custom_id_block", cached)
+            numbers = []
+            if block is not None and not cached:
+                # Use up what is left before reserving more
+                numbers = list(range(block[0], block[1]))
+                block[0] = block[1]
+            if not cached:
+                size = max(settings.CUSTOM_ID_BLOCK_SIZE, count - len(numbers), 1)
+                block = await self._reserve(db, key, size)
+                # Blocks from previous days are never used again
+                self._blocks = {k: v for k, v in self._blocks.items() if k.endswith(day)}
+                self._blocks[key] = block
+            taken = count - len(numbers)
+            numbers.extend(range(block[0], block[0] + taken))
+            block[0] += taken
+        return [f"{key}-{number:04d}" for number in numbers]
+
+    async def allocate(self, db, prefix: str) -> str:
+        return (await self.allocate_many(db, prefix, 1))[0]
+
+
+custom_id_allocator = CustomIdAllocator()
+
+
+async def insert_with_custom_id(db, collection: str, document: dict, field: str, prefix: str):
+    """Allocates `field` for `document` and inserts it, retrying on an ID collision"""
+    for attempt in range(MAX_INSERT_ATTEMPTS):
+        document[field] = await custom_id_allocator.allocate(db, prefix)
+        document.pop("_id", None)
+        try:
+            return await db[collection].insert_one(document)
+        except DuplicateKeyError:
+            # _id is regenerated on each attempt, so the collision is on the custom ID
+            if attempt == MAX_INSERT_ATTEMPTS - 1:
+                raise
+
+
+async def insert_many_with_custom_ids(
+    db, collection: str, documents: List[dict], field: str, prefix: str
+) -> Tuple[List[dict], List[dict]]:
+    """
+    Allocates `field` for each document and inserts them with unordered
+    insert_many calls. Documents that collide on the custom ID are retried
+    with fresh numbers. Returns (inserted documents, documents that failed).
+    """
+    inserted, pending = [], list(documents)
+    for attempt in range(MAX_INSERT_ATTEMPTS):
+        for document, code in zip(pending, await custom_id_allocator.allocate_many(db, prefix, len(pending))):
+            document[field] = code
+            document.pop("_id", None)
+        try:
+            await db[collection].insert_many(pending, ordered=False)
+            return inserted + pending, []
+        except BulkWriteError as e:
+            errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+            inserted += [doc for i, doc in enumerate(pending) if i not in errors]
+            failed = [pending[i] for i, error in errors.items() if error.get("code") != DUPLICATE_KEY]
+            pending = [pending[i] for i, error in errors.items() if error.get("code") == DUPLICATE_KEY]
+            if failed or attempt == MAX_INSERT_ATTEMPTS - 1:
+                return inserted, failed + pending
+    return inserted, pending
@@ -1,33 +1,107 @@
+from importlib.util import find_spec
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
+from app.core.instrumentation import query_stats_listener
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Python module each wire compressor needs; pymongo silently drops missing ones
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+def client_options() -> dict:
+    """Build AsyncIOMotorClient keyword options from Settings"""
+    options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS,
+        "readPreference": settings.MONGO_READ_PREFERENCE
+    }
+    if settings.MONGO_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = settings.MONGO_MAX_IDLE_TIME_MS
+    if settings.MONGO_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGO_WRITE_CONCERN:
+        w = settings.MONGO_WRITE_CONCERN
+        options["w"] = int(w) if w.isdigit() else w
+
+    compressors = []
+    for name in filter(None, settings.MONGO_COMPRESSORS.split(",")):
+        if find_spec(COMPRESSOR_MODULES[name]) is None:
+            logger.warning(f"MongoDB compressor '{name}' needs the '{COMPRESSOR_MODULES[name]}' package; skipping it")
+            continue
+        compressors.append(name)
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
 class Database:
     client: AsyncIOMotorClient = None
     db = None
+    options: dict = {}
 
     def connect(self):
         try:
+            self.options = client_options()
             self.client = AsyncIOMotorClient(
                 settings.MONGODB_URL,
-                serverSelectionTimeoutMS=5000,
-                connectTimeoutMS=5000
+                event_listeners=[query_stats_listener],
+                **self.options
             )
             self.db = self.client[settings.DATABASE_NAME]
             logger.info(f"Connected to MongoDB at {settings.MONGODB_URL}")
-            print(f"Connected to MongoDB at {settings.MONGODB_URL}")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
-            print(f"ERROR: Failed to connect to MongoDB: {e}")
             raise
 
+    async def ensure_indexes(self):
+        from app.core.audit import ensure_audit_indexes
+        from app.core.revocation import ensure_revocation_indexes
+        from app.core.sessions import ensure_session_indexes
+        from app.core.rate_limit import ensure_rate_limit_indexes
+        from app.core.custom_ids import ensure_custom_id_indexes
+        from app.core.storage_racks import ensure_storage_rack_indexes
+        from app.core.scheduler import ensure_scheduler_indexes
+        from app.core.item_tiering import ensure_item_archive_indexes
+        from app.core.sync import ensure_sync_indexes
+        for ensure in (
+            ensure_audit_indexes, ensure_revocation_indexes, ensure_session_indexes,
+            ensure_rate_limit_indexes, ensure_custom_id_indexes, ensure_storage_rack_indexes,
+            ensure_scheduler_indexes, ensure_item_archive_indexes, ensure_sync_indexes
+        ):
+            try:
+                await ensure(self.db)
+            except Exception as e:
+                # Index builds must not keep the API from starting
+                logger.error(f"Failed to ensure indexes ({ensure.__name__}): {e}")
+
+    def diagnostics(self) -> dict:
+        """Effective client settings as negotiated by the driver"""
+        if self.client is None:
+            return {"connected": False}
+        options = self.client.delegate.options
+        pool = options.pool_options
+        return {
+            "connected": True,
+            "database": settings.DATABASE_NAME,
+            "requested_options": self.options,
+            "pool": {
+                "max_pool_size": pool.max_pool_size,
+                "min_pool_size": pool.min_pool_size,
+                "max_idle_time_seconds": pool.max_idle_time_seconds,
+                "wait_queue_timeout_seconds": pool.wait_queue_timeout,
+                "connect_timeout_seconds": pool.connect_timeout
+            },
+            "compressors": self.options.get("compressors", "").split(",") if self.options.get("compressors") else [],
+            "read_preference": options.read_preference.mongos_mode,
+            "write_concern": options.write_concern.document
+        }
+
     def close(self):
         if self.client:
             self.client.close()
             logger.info("Disconnected from MongoDB")
-            print("Disconnected from MongoDB")
 
 db = Database()
 
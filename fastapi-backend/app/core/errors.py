@@ -0,0 +1,83 @@
+"""
+Exception handling for the API.
+
+Known client mistakes (malformed ObjectIds, model validation failures) map
+to cheap 4xx responses without any traceback work. Unhandled exceptions
+return a generic 500 that carries only the request id; their details go to
+the background log sink, with full tracebacks sampled by a token bucket so
+an error storm cannot turn into a formatting storm.
+"""
+import logging
+import threading
+import time
+from bson.errors import InvalidId
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from app.core.config import settings
+from app.core.logging_config import request_id_var
+
+logger = logging.getLogger(__name__)
+
+
+class TracebackSampler:
+    """Token bucket allowing `rate_per_minute` full tracebacks, with bursts up to that size"""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = max(rate_per_minute, 0)
+        self.tokens = float(self.capacity)
+        self.refill_per_second = self.capacity / 60
+        self.updated = time.monotonic()
+        self.suppressed = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            self.suppressed += 1
+            return False
+
+
+traceback_sampler = TracebackSampler(settings.TRACEBACK_LOG_RATE_PER_MINUTE)
+
+
+def log_unhandled(request: Request, exc: Exception):
+    summary = f"Unhandled {type(exc).__name__} on {request.method} {request.url.path}: {exc}"
+    if traceback_sampler.allow():
+        logger.error(summary, exc_info=(type(exc), exc, exc.__traceback__))
+    else:
+        logger.error(f"{summary} (traceback suppressed, {traceback_sampler.suppressed} so far)")
+
+
+def internal_error_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal Server Error", "request_id": request_id_var.get()}
+    )
+
+
+async def invalid_id_handler(request: Request, exc: InvalidId):
+    return JSONResponse(status_code=400, content={"detail": "Invalid ID"})
+
+
+async def validation_error_handler(request: Request, exc: ValidationError):
+    return JSONResponse(
+        status_code=422,
+        content={"detail": exc.errors(include_url=False, include_context=False, include_input=False)}
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    log_unhandled(request, exc)
+    return internal_error_response()
+
+
+def register_exception_handlers(app: FastAPI):
+    app.add_exception_handler(InvalidId, invalid_id_handler)
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
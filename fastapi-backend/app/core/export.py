@@ -0,0 +1,122 @@
+"""
+Streaming exports.
+
+stream_rows turns one or more Motor cursors into CSV or JSONL text chunks
+for a StreamingResponse. Documents are read with `async for` in batches of
+EXPORT_BATCH_SIZE and encoded into a buffer that is yielded every
+CHUNK_BYTES, so memory stays flat whatever the row count. Starlette only
+pulls the next chunk once the previous one has been handed to the client,
+which throttles the cursor to the client's download speed; a dropped
+connection cancels the generator and closes the cursor.
+
+Cursors are read in index order (_id, or timestamp for audit logs), so
+mongod never has to sort in memory.
+Rows only start flowing after the 200 headers are sent, so a failure mid
+stream cannot change the status code; the file then ends with an
+EXPORT_INCOMPLETE marker row instead of being cut short silently.
+
+CSV files are opened in spreadsheets, so a text cell starting with a
+formula character is prefixed with a quote to keep it from being evaluated.
+"""
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List
+from bson import ObjectId
+from app.core.metrics import EXPORT_ROWS
+
+logger = logging.getLogger(__name__)
+
+CHUNK_BYTES = 64 * 1024
+INCOMPLETE_MARKER = "EXPORT_INCOMPLETE"
+
+# Leading characters that make Excel/Sheets treat a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson"
+}
+
+COLUMNS = {
+    "items": [
+        "_id", "Lost_ID", "Found_ID", "type", "category", "description", "location", "status",
+        "storage_location", "dateTime", "user_id", "verified_by_name", "verified_at",
+        "handed_over_by_name", "handed_over_to_student_id", "handed_over_at",
+        "archived_at", "disposed_at", "linked_item_id", "updated_at"
+    ],
+    "claims": [
+        "_id", "Claim_ID", "item_id", "claimant_id", "status", "verificationDetails",
+        "submissionDate", "decided_at", "processing_hours", "verified_by_name",
+        "rejected_by_name", "rejection_reason", "admin_remarks", "updated_at"
+    ],
+    "audit_logs": [
+        "_id", "timestamp", "admin_id", "admin_name", "action", "target_type", "target_id", "details"
+    ]
+}
+
+
+def projection(collection: str, fmt: str):
+    """CSV only needs its columns; JSONL exports whole documents"""
+    return {field: 1 for field in COLUMNS[collection]} if fmt == "csv" else None
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, float)):
+        # Negative numbers are data, not formulas
+        return str(value)
+    text = json.dumps(value, default=str) if isinstance(value, (dict, list)) else str(value)
+    return "'" + text if text.startswith(FORMULA_PREFIXES) else text
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, ObjectId):
+        return str(value)
+    return str(value)
+
+
+async def stream_rows(cursors: Iterable, collection: str, fmt: str) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    columns: List[str] = COLUMNS[collection]
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer:
+        writer.writerow(columns)
+
+    rows = 0
+    try:
+        for cursor in cursors:
+            try:
+                async for doc in cursor:
+                    if writer:
+                        writer.writerow([_cell(doc.get(field)) for field in columns])
+                    else:
+                        buffer.write(json.dumps(doc, default=_json_default))
+                        buffer.write("\n")
+                    rows += 1
+                    if buffer.tell() >= CHUNK_BYTES:
+                        yield buffer.getvalue()
+                        buffer.seek(0)
+                        buffer.truncate()
+            finally:
+                await cursor.close()
+        if buffer.tell():
+            yield buffer.getvalue()
+    except Exception:
+        logger.exception(f"Export of {collection} failed after {rows} rows")
+        message = f"export failed after {rows} rows; this file is incomplete"
+        if writer:
+            writer.writerow([INCOMPLETE_MARKER, message])
+        else:
+            buffer.write(json.dumps({INCOMPLETE_MARKER: message}))
+            buffer.write("\n")
+        yield buffer.getvalue()
+    finally:
+        EXPORT_ROWS.inc(rows, collection=collection, format=fmt)
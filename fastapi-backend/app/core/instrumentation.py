@@ -0,0 +1,155 @@
+"""
+Per-request MongoDB instrumentation.
+
+A pymongo CommandListener attributes every command to the request that
+issued it through a context var (Motor copies the context into its worker
+threads). The HTTP middleware assigns the request id used in logs,
+reports the totals as a `Server-Timing` header and a structured log line,
+warns when a request exceeds QUERY_BUDGET, feeds the request/DB latency
+metrics and turns unhandled exceptions into the lean 500 from
+app.core.errors.
+"""
+import logging
+import re
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+from pymongo import monitoring
+from app.core.config import settings
+from app.core.errors import internal_error_response, log_unhandled
+from app.core.logging_config import request_id_var
+from app.core.metrics import DB_COMMAND_LATENCY, REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Driver housekeeping that says nothing about handler behaviour
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "endSessions", "saslStart", "saslContinue", "ping"}
+
+
+class RequestQueryStats:
+    """Query totals for one request; updated from Motor's worker threads"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_command = None
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def record(self, command_name: str, duration_micros: int, failed: bool = False):
+        duration_ms = duration_micros / 1000
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            if failed:
+                self.failed += 1
+            if duration_ms > self.slowest_ms:
+                self.slowest_ms = duration_ms
+                self.slowest_command = command_name
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 2),
+            "slowest_ms": round(self.slowest_ms, 2),
+            "slowest_command": self.slowest_command,
+            "failed": self.failed
+        }
+
+
+_request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[RequestQueryStats]:
+    return _request_stats.get()
+
+
+class QueryStatsListener(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def _record(self, event, failed: bool):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        DB_COMMAND_LATENCY.observe(
+            event.duration_micros / 1_000_000,
+            command=event.command_name, outcome="failed" if failed else "ok"
+        )
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.record(event.command_name, event.duration_micros, failed=failed)
+
+    def succeeded(self, event):
+        self._record(event, failed=False)
+
+    def failed(self, event):
+        self._record(event, failed=True)
+
+
+query_stats_listener = QueryStatsListener()
+
+# Incoming X-Request-ID values are kept only when short and log-safe
+REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+
+def _route_path(request, default: Optional[str] = None) -> str:
+    route = request.scope.get("route")
+    return getattr(route, "path", default or request.url.path)
+
+
+async def instrumentation_middleware(request, call_next):
+    request_id = request.headers.get("x-request-id", "")
+    if not REQUEST_ID_PATTERN.fullmatch(request_id):
+        # Untrusted header: it is echoed back and written into every log line
+        request_id = uuid.uuid4().hex[:16]
+    request_id_token = request_id_var.set(request_id)
+    try:
+        stats = RequestQueryStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            response = await call_next(request)
+        except Exception as exc:
+            # Answer here instead of re-raising, which would make the server
+            # format and log the traceback a second time
+            log_unhandled(request, exc)
+            response = internal_error_response()
+        finally:
+            _request_stats.reset(token)
+            REQUESTS_IN_FLIGHT.dec()
+        total_ms = (time.perf_counter() - started) * 1000
+        REQUEST_LATENCY.observe(
+            total_ms / 1000,
+            # Unmatched paths share one label to keep metric cardinality bounded
+            method=request.method, route=_route_path(request, "unmatched"), status=response.status_code
+        )
+
+        response.headers["X-Request-ID"] = request_id
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+            f'app;dur={max(total_ms - stats.total_ms, 0):.1f}'
+        )
+
+        details = {
+            "method": request.method,
+            "route": _route_path(request),
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 2),
+            **stats.as_dict()
+        }
+        if stats.count > settings.QUERY_BUDGET:
+            logger.warning(
+                f"Query budget exceeded: {request.method} {details['route']} ran {stats.count} queries "
+                f"(budget {settings.QUERY_BUDGET}, {details['db_ms']}ms in db)",
+                extra={"request_stats": details}
+            )
+        else:
+            logger.debug(f"{request.method} {details['route']} queries={stats.count} db_ms={details['db_ms']}",
+                         extra={"request_stats": details})
+        return response
+    finally:
+        request_id_var.reset(request_id_token)
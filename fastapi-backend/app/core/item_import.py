@@ -0,0 +1,119 @@
+"""
+Bulk CSV import of found items.
+
+The uploaded file is read one record at a time and handled in batches of
+IMPORT_BATCH_SIZE rows, so a long spreadsheet never sits in memory as a
+whole. Each row is validated with ItemCreate. A batch's valid rows get
+their Found_IDs from one counter reservation, are written with one
+insert_many, update rack occupancy with one bulk_write and are scored
+against the open LOST reports of their categories, fetched with one query.
+"""
+import csv
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from app.models.enums import ItemStatus, ItemType
+from app.models.item_model import ItemCreate
+from app.core.custom_ids import insert_many_with_custom_ids
+from app.core.matching import find_matches, open_lost_items
+from app.core.storage_racks import apply_transitions
+
+REQUIRED_COLUMNS = ("category", "location", "storage_location")
+OPTIONAL_COLUMNS = ("description", "admin_remarks", "dateTime", "imageUrl")
+
+
+class UnreadableRow(Exception):
+    """A record that could not be decoded or parsed; rows before it were already yielded"""
+    def __init__(self, row: int, error: Exception):
+        super().__init__(f"Unreadable CSV: {error}")
+        self.row = row
+
+
+def _lines(file: BinaryIO) -> Iterator[str]:
+    # Decoded line by line, so a bad byte only costs the record it is in
+    for number, raw in enumerate(file):
+        yield raw.decode("utf-8-sig" if number == 0 else "utf-8")
+
+
+def read_csv(file: BinaryIO) -> csv.DictReader:
+    """DictReader over an uploaded file; raises ValueError if required columns are missing"""
+    reader = csv.DictReader(_lines(file))
+    columns = [name.strip() for name in reader.fieldnames or []]
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+    reader.fieldnames = columns
+    return reader
+
+
+def batches(reader: csv.DictReader, size: int) -> Iterator[List[Tuple[int, dict]]]:
+    """
+    Yields lists of (spreadsheet row number, row); the header is row 1.
+    On an unreadable record the rows read so far are yielded first, then
+    UnreadableRow is raised with that record's row number.
+    """
+    batch, row_number = [], 1
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            break
+        except (UnicodeDecodeError, csv.Error) as e:
+            if batch:
+                yield batch
+            raise UnreadableRow(row_number + 1, e) from e
+        row_number += 1
+        batch.append((row_number, row))
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validate_row(row: dict, now: datetime) -> Tuple[Optional[dict], List[dict]]:
+    """Returns (item document, []) for a valid row or (None, errors)"""
+    data = {}
+    for name in REQUIRED_COLUMNS + OPTIONAL_COLUMNS:
+        value = (row.get(name) or "").strip()
+        if value:
+            data[name] = value
+    errors = [{"field": name, "message": "Field required"} for name in REQUIRED_COLUMNS if name not in data]
+    if errors:
+        return None, errors
+
+    data.setdefault("dateTime", now)
+    try:
+        item = ItemCreate(**data, type=ItemType.FOUND, status=ItemStatus.AVAILABLE)
+    except ValidationError as e:
+        return None, [
+            {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+            for error in e.errors()
+        ]
+    return item.model_dump(by_alias=True, exclude_none=True), []
+
+
+async def insert_found_items(db, documents: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """Inserts a batch with fresh Found_IDs; returns (inserted, failed) documents"""
+    inserted, failed = await insert_many_with_custom_ids(db, "items", documents, "Found_ID", "FND")
+    await apply_transitions(db, [(None, document) for document in inserted])
+    return inserted, failed
+
+
+async def match_batch(db, found_items: List[dict]) -> Dict[str, List[dict]]:
+    """Match suggestions per found item _id (as a string), HIGH confidence first"""
+    if not found_items:
+        return {}
+    lost_items = await open_lost_items(db, {item["category"] for item in found_items})
+    suggestions = {str(item["_id"]): [] for item in found_items}
+    for match in find_matches(found_items, lost_items):
+        lost = match["lost_item"]
+        suggestions[match["found_item"]["_id"]].append({
+            "lost_item_id": lost["_id"],
+            "Lost_ID": lost.get("Lost_ID"),
+            "confidence": match["confidence"],
+            "shared_keywords": match["shared_keywords"]
+        })
+    for matches in suggestions.values():
+        matches.sort(key=lambda m: m["confidence"] != "HIGH")
+    return suggestions
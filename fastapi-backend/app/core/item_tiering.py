@@ -0,0 +1,116 @@
+"""
+Cold-storage tiering for finished items.
+
+Items in a terminal state (resolved, returned, archived, disposed) whose
+last activity is older than TIERING_AFTER_DAYS are moved from `items` into
+`items_archive`, so feeds, searches and counts over `items` only touch the
+live working set. Documents keep their _id and fields, plus `tiered_at`.
+
+Each batch is copied with insert_many (duplicates left by an interrupted
+run are ignored) and then deleted from `items` with a filter that still
+requires a terminal status; an item revived between the copy and the
+delete stays hot and its archive copy is dropped. Moved items leave sync
+tombstones so phones drop them from their caches. Reads that need history
+opt in through find_item / find_items / the include_archive query
+parameters. Claim views always do, because a user's resolved claims keep
+pointing at their items after those are tiered.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+import logging
+from pymongo.errors import BulkWriteError
+from app.core.config import settings
+from app.core.sync import record_tombstones
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_COLLECTION = "items_archive"
+TERMINAL_STATUSES = ["RESOLVED", "RETURNED", "ARCHIVED", "DISPOSED"]
+DUPLICATE_KEY = 11000
+
+# Timestamps that count as activity on an item; all must be older than the cutoff
+ACTIVITY_FIELDS = ("dateTime", "verified_at", "handed_over_at", "archived_at", "disposed_at")
+
+
+def tiering_filter(cutoff: datetime) -> dict:
+    return {
+        "status": {"$in": TERMINAL_STATUSES},
+        "$and": [
+            {"$or": [{field: None}, {field: {"$lte": cutoff}}]}
+            for field in ACTIVITY_FIELDS
+        ]
+    }
+
+
+async def find_item(db, item_filter: dict, include_archive: bool = False) -> Optional[dict]:
+    """find_one on items, falling back to items_archive when asked to"""
+    item = await db["items"].find_one(item_filter)
+    if item is None and include_archive:
+        item = await db[ARCHIVE_COLLECTION].find_one(item_filter)
+    return item
+
+
+async def find_items(db, ids: List, projection: Optional[dict] = None) -> List[dict]:
+    """Items with the given _ids from `items`, plus any of them already moved to items_archive"""
+    if not ids:
+        return []
+    items = await db["items"].find({"_id": {"$in": ids}}, projection).to_list(length=None)
+    found = {item["_id"] for item in items}
+    missing = [i for i in ids if i not in found]
+    if missing:
+        items += await db[ARCHIVE_COLLECTION].find({"_id": {"$in": missing}}, projection).to_list(length=None)
+    return items
+
+
+async def _move_batch(db, items: list, now: datetime) -> int:
+    try:
+        await db[ARCHIVE_COLLECTION].insert_many([{**item, "tiered_at": now} for item in items], ordered=False)
+    except BulkWriteError as e:
+        if any(err.get("code") != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+            raise
+
+    ids = [item["_id"] for item in items]
+    result = await db["items"].delete_many({"_id": {"$in": ids}, "status": {"$in": TERMINAL_STATUSES}})
+    revived = set()
+    if result.deleted_count < len(ids):
+        revived = set(await db["items"].distinct("_id", {"_id": {"$in": ids}}))
+        if revived:
+            await db[ARCHIVE_COLLECTION].delete_many({"_id": {"$in": list(revived)}})
+    await record_tombstones(db, "items", [i for i in ids if i not in revived])
+    return result.deleted_count
+
+
+async def tier_items(
+    db,
+    older_than_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    max_batches: Optional[int] = None
+) -> dict:
+    """Moves one run's worth of finished items to items_archive"""
+    days = older_than_days if older_than_days is not None else settings.TIERING_AFTER_DAYS
+    batch_size = batch_size or settings.TIERING_BATCH_SIZE
+    max_batches = max_batches or settings.TIERING_MAX_BATCHES
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    query = tiering_filter(cutoff)
+
+    moved, batches = 0, 0
+    while batches < max_batches:
+        items = await db["items"].find(query).sort("_id", 1).to_list(batch_size)
+        if not items:
+            break
+        moved += await _move_batch(db, items, datetime.utcnow())
+        batches += 1
+        if len(items) < batch_size:
+            break
+
+    return {"cutoff": cutoff, "moved": moved, "batches": batches}
+
+
+async def ensure_item_archive_indexes(db):
+    col = db[ARCHIVE_COLLECTION]
+    await col.create_index([("type", 1), ("status", 1), ("dateTime", -1)])
+    await col.create_index([("category", 1), ("dateTime", -1)])
+    await col.create_index("user_id")
+    await col.create_index("tiered_at")
+    for field in ("Lost_ID", "Found_ID"):
+        await col.create_index(field, partialFilterExpression={field: {"$type": "string"}})
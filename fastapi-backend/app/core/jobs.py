@@ -0,0 +1,141 @@
+"""
+Background jobs run by app.core.scheduler.
+
+auto_archive_stale_items archives FOUND items nobody has claimed within
+AUTO_ARCHIVE_AFTER_DAYS. It walks the candidates in _id order in batches
+of AUTO_ARCHIVE_BATCH_SIZE (at most AUTO_ARCHIVE_MAX_BATCHES per run) and
+per batch issues one bulk_write for the items, one insert_many for the
+reporter notifications and one for the audit entries. Items with a
+pending claim are left alone.
+
+tier_finished_items moves long-finished items to items_archive (see
+app.core.item_tiering).
+
+archive_old_audit_logs moves audit entries past AUDIT_LOG_ARCHIVE_AFTER_DAYS
+into the monthly audit_logs_YYYY_MM partitions (see app.core.audit) before
+the TTL index on audit_logs expires them.
+"""
+from datetime import datetime, timedelta
+import logging
+from app.core import bulk_items
+from app.core.audit import archive_audit_logs
+from app.core.config import settings
+from app.core.item_tiering import tier_items
+from app.core.metrics import ITEMS_AUTO_ARCHIVED, NOTIFICATION_FANOUT
+from app.models.enums import ItemStatus
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_ADMIN_ID = "system"
+SYSTEM_ADMIN_NAME = "Scheduler"
+
+STALE_STATUSES = ["PENDING", "AVAILABLE"]
+
+
+async def auto_archive_stale_items(db, run_id: str) -> dict:
+    days = settings.AUTO_ARCHIVE_AFTER_DAYS
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    query = {
+        "type": "FOUND",
+        "status": {"$in": STALE_STATUSES},
+        "dateTime": {"$lte": cutoff}
+    }
+    projection = {**bulk_items.PROJECTION, "user_id": 1, "Found_ID": 1}
+    stats = {"cutoff": cutoff, "scanned": 0, "archived": 0, "skipped_pending_claims": 0, "conflicts": 0}
+
+    last_id = None
+    for _ in range(settings.AUTO_ARCHIVE_MAX_BATCHES):
+        batch_query = {**query, "_id": {"$gt": last_id}} if last_id else query
+        items = await db["items"].find(batch_query, projection).sort("_id", 1).to_list(settings.AUTO_ARCHIVE_BATCH_SIZE)
+        if not items:
+            break
+        last_id = items[-1]["_id"]
+        stats["scanned"] += len(items)
+
+        claimed = set(await db["claims"].distinct(
+            "item_id",
+            {"item_id": {"$in": [str(item["_id"]) for item in items]}, "status": "PENDING"}
+        ))
+        candidates = [item for item in items if str(item["_id"]) not in claimed]
+        stats["skipped_pending_claims"] += len(items) - len(candidates)
+
+        now = datetime.utcnow()
+        results, applied = await bulk_items.bulk_update_items(db, candidates, {
+            "status": ItemStatus.ARCHIVED,
+            "archived_at": now,
+            "archived_by": SYSTEM_ADMIN_ID
+        })
+        stats["conflicts"] += sum(1 for result in results.values() if result == bulk_items.CONFLICT)
+        stats["archived"] += len(applied)
+        if applied:
+            await _record_archived(db, applied, days, run_id, now)
+
+        if len(items) < settings.AUTO_ARCHIVE_BATCH_SIZE:
+            break
+
+    ITEMS_AUTO_ARCHIVED.inc(stats["archived"])
+    return stats
+
+
+async def _record_archived(db, items: list, days: int, run_id: str, now: datetime):
+    notifications = [
+        {
+            "user_id": str(item["user_id"]),
+            "title": "Found Item Archived",
+            "message": f"The {item.get('category', 'item')} you reported as found was not claimed within {days} days and has been archived.",
+            "type": "ITEM_ARCHIVED",
+            "related_id": str(item["_id"]),
+            "read": False,
+            "created_at": now,
+            "updated_at": now
+        }
+        for item in items if item.get("user_id")
+    ]
+    if notifications:
+        await db["notifications"].insert_many(notifications, ordered=False)
+        NOTIFICATION_FANOUT.observe(len(notifications), type="ITEM_ARCHIVED")
+
+    await db["audit_logs"].insert_many([
+        {
+            "admin_id": SYSTEM_ADMIN_ID,
+            "admin_name": SYSTEM_ADMIN_NAME,
+            "action": "ITEM_ARCHIVED",
+            "target_type": "ITEM",
+            "target_id": str(item["_id"]),
+            "details": {"status": "ARCHIVED", "reason": "AUTO_ARCHIVE", "after_days": days, "run_id": run_id},
+            "timestamp": now
+        }
+        for item in items
+    ], ordered=False)
+
+
+async def tier_finished_items(db, run_id: str) -> dict:
+    return await tier_items(db)
+
+
+async def archive_old_audit_logs(db, run_id: str) -> dict:
+    return await archive_audit_logs(db)
+
+
+def register_jobs(scheduler):
+    if settings.AUTO_ARCHIVE_AFTER_DAYS > 0:
+        scheduler.register(
+            "auto_archive_stale_items",
+            auto_archive_stale_items,
+            timedelta(minutes=settings.AUTO_ARCHIVE_INTERVAL_MINUTES),
+            f"Archive FOUND items unclaimed for {settings.AUTO_ARCHIVE_AFTER_DAYS} days"
+        )
+    if settings.TIERING_AFTER_DAYS > 0:
+        scheduler.register(
+            "tier_finished_items",
+            tier_finished_items,
+            timedelta(minutes=settings.TIERING_INTERVAL_MINUTES),
+            f"Move items finished for {settings.TIERING_AFTER_DAYS} days to items_archive"
+        )
+    if settings.AUDIT_LOG_ARCHIVE_AFTER_DAYS > 0:
+        scheduler.register(
+            "archive_old_audit_logs",
+            archive_old_audit_logs,
+            timedelta(minutes=settings.AUDIT_LOG_ARCHIVE_INTERVAL_MINUTES),
+            f"Move audit entries older than {settings.AUDIT_LOG_ARCHIVE_AFTER_DAYS} days to monthly partitions"
+        )
@@ -0,0 +1,39 @@
+"""
+Reusable aggregation stages for populating related documents.
+
+Items, claims and users reference each other through string ids
+(`user_id`, `item_id`, `claimant_id`, `linked_item_id`), so the stages
+below convert them to ObjectIds inside the pipeline. Invalid ids resolve
+to no match instead of failing the whole aggregation.
+"""
+
+USER_PRIVATE_FIELDS = {"password": 0, "hashed_password": 0}
+
+
+def to_object_id(expr):
+    return {"$convert": {"input": expr, "to": "objectId", "onError": None, "onNull": None}}
+
+
+def first(field: str) -> dict:
+    """Unwrap a single-document $lookup result; leaves the field missing when nothing matched"""
+    return {"$addFields": {field: {"$arrayElemAt": [f"${field}", 0]}}}
+
+
+def lookup_by_id(collection: str, local_field: str, as_field: str, pipeline: list = None) -> list:
+    """Populate one document from `collection` whose _id is stored as a string in `local_field`"""
+    stages = [{"$match": {"$expr": {"$eq": ["$_id", "$$ref_id"]}}}]
+    if collection == "users":
+        stages.append({"$project": USER_PRIVATE_FIELDS})
+    return [
+        {"$lookup": {
+            "from": collection,
+            "let": {"ref_id": to_object_id(f"${local_field}")},
+            "pipeline": stages + (pipeline or []),
+            "as": as_field
+        }},
+        first(as_field)
+    ]
+
+
+def lookup_user(local_field: str, as_field: str) -> list:
+    return lookup_by_id("users", local_field, as_field)
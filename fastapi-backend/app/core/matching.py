@@ -0,0 +1,42 @@
+"""
+LOST/FOUND match suggestions.
+
+Two items match when they share a category; sharing a description keyword
+(a word longer than three letters) raises the confidence from LOW to HIGH.
+find_matches pairs any lists of items in memory, so callers fetch each side
+with one query and score a whole batch at once.
+"""
+from collections import defaultdict
+from typing import List, Set
+
+
+def keywords(text) -> Set[str]:
+    return {w for w in (text or "").lower().split() if len(w) > 3}
+
+
+def find_matches(found_items: List[dict], lost_items: List[dict]) -> List[dict]:
+    """Scores every same-category FOUND/LOST pair; items are returned with string _ids"""
+    lost_by_category = defaultdict(list)
+    for l in lost_items:
+        lost_by_category[l["category"]].append((l, keywords(l.get("description"))))
+
+    matches = []
+    for f in found_items:
+        f_words = keywords(f.get("description"))
+        for l, l_words in lost_by_category.get(f["category"], []):
+            common = f_words & l_words
+            matches.append({
+                "found_item": {**f, "_id": str(f["_id"])},
+                "lost_item": {**l, "_id": str(l["_id"])},
+                "confidence": "HIGH" if common else "LOW",
+                "shared_keywords": list(common)
+            })
+    return matches
+
+
+async def open_lost_items(db, categories=None, limit=None) -> List[dict]:
+    """OPEN lost reports, optionally only those in `categories`"""
+    query = {"type": "LOST", "status": "OPEN"}
+    if categories is not None:
+        query["category"] = {"$in": list(categories)}
+    return await db["items"].find(query).to_list(limit)
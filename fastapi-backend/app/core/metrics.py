@@ -0,0 +1,204 @@
+"""
+Minimal in-process metrics registry rendered in the Prometheus text format.
+
+Metrics are updated from the event loop as well as from Motor and bcrypt
+worker threads, so every update takes the metric's lock. Values are per
+process; with several uvicorn workers, scrape each one or aggregate
+in Prometheus.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (1, 10, 100, 1000, 10000, 100000)
+JOB_DURATION_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = (), registry: Registry = REGISTRY):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _labels(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterable:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name + "_total", self._labels(key), value
+
+
+class Gauge(_Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = (), registry: Registry = REGISTRY):
+        super().__init__(name, help, labelnames, registry)
+        if not self.labelnames:
+            self._values[()] = 0
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextmanager
+    def track_inprogress(self, **labels):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self) -> Iterable:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, self._labels(key), value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS, registry: Registry = REGISTRY):
+        super().__init__(name, help, labelnames, registry)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * len(self.buckets), 0.0)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> Iterable:
+        with self._lock:
+            items = [(key, (list(counts), total)) for key, (counts, total) in self._values.items()]
+        for key, (counts, total) in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield self.name + "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield self.name + "_sum", labels, total
+            yield self.name + "_count", labels, cumulative
+
+
+# ============ APPLICATION METRICS ============
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests currently being served")
+DB_COMMAND_LATENCY = Histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency as seen by the driver",
+    ("command", "outcome"), buckets=DB_LATENCY_BUCKETS
+)
+BCRYPT_QUEUE_DEPTH = Gauge("bcrypt_pool_queue_depth", "Password hash/verify jobs waiting for a bcrypt worker")
+BCRYPT_IN_FLIGHT = Gauge("bcrypt_pool_in_flight", "Password hash/verify jobs currently running")
+UPLOAD_DURATION = Histogram(
+    "image_upload_duration_seconds", "Image upload duration to Cloudinary",
+    ("folder", "outcome")
+)
+NOTIFICATION_FANOUT = Histogram(
+    "notification_fanout_size", "Notifications written by a single fan-out",
+    ("type",), buckets=SIZE_BUCKETS
+)
+CACHE_REQUESTS = Counter("cache_requests", "In-process cache lookups", ("cache", "result"))
+LOGIN_ATTEMPTS = Counter("login_attempts", "Login attempts by outcome", ("outcome",))
+LOGIN_LOCKOUTS = Counter("login_lockouts", "Accounts locked after repeated failed logins")
+RATE_LIMIT_KEYS = Gauge("login_rate_limit_tracked_keys", "Emails and client IPs tracked by the in-memory login limiter")
+SCHEDULER_RUNS = Counter("scheduler_job_runs", "Background job runs executed by this worker", ("job", "outcome"))
+SCHEDULER_RUN_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "Background job run duration",
+    ("job",), buckets=JOB_DURATION_BUCKETS
+)
+ITEMS_AUTO_ARCHIVED = Counter("items_auto_archived", "Stale found items archived by the scheduler")
+EXPORT_ROWS = Counter("export_rows", "Rows streamed by admin exports", ("collection", "format"))
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
@@ -0,0 +1,217 @@
+"""
+Login throttling, checked before any password hashing.
+
+Two limits apply:
+- per client IP: at most LOGIN_MAX_ATTEMPTS_PER_IP attempts per
+  LOGIN_RATE_WINDOW_SECONDS, whatever the outcome;
+- per email: LOGIN_MAX_FAILURES_PER_EMAIL failures within
+  LOGIN_FAILURE_WINDOW_SECONDS lock the email for LOGIN_LOCKOUT_SECONDS
+  (whether or not the account exists, so lockouts do not reveal accounts).
+
+Counts use a sliding-window counter: the current fixed window plus the
+previous one weighted by how much of it still overlaps. That is O(1)
+memory per key. The default store is process memory, an LRU capped at
+MemoryStore.MAX_KEYS keys: stale keys are dropped from the cold end as
+requests come in, and under a flood of distinct keys the least recently
+seen ones are evicted, so each hit stays O(1). With
+LOGIN_RATE_LIMIT_STORE=mongo the counters live in the `rate_limits`
+collection so every worker shares them.
+
+Behind a reverse proxy every request arrives from the proxy's address, so
+client_ip reads X-Forwarded-For, but only when the peer is listed in
+TRUSTED_PROXIES; otherwise any client could pick its own IP.
+"""
+import ipaddress
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional
+from pymongo import ReturnDocument
+from app.core.config import settings
+from app.core.metrics import LOGIN_ATTEMPTS, LOGIN_LOCKOUTS, RATE_LIMIT_KEYS
+
+COLLECTION = "rate_limits"
+
+
+@lru_cache(maxsize=1)
+def _trusted_networks(setting: str):
+    entries = [e.strip() for e in setting.split(",") if e.strip()]
+    if "*" in entries:
+        return None
+    return [ipaddress.ip_network(e, strict=False) for e in entries]
+
+
+def _in_networks(address: str, networks) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_ip(request) -> str:
+    """
+    The socket peer, or - when that peer is a trusted proxy - the nearest
+    X-Forwarded-For hop that is not itself a trusted proxy. With "*" only
+    the peer is trusted and the hop it appended (the last one) is used.
+    """
+    peer = request.client.host if request.client else "unknown"
+    if not settings.TRUSTED_PROXIES.strip():
+        return peer
+    networks = _trusted_networks(settings.TRUSTED_PROXIES)
+    if networks is not None and not _in_networks(peer, networks):
+        return peer
+    hops = [h.strip() for h in request.headers.get("x-forwarded-for", "").split(",") if h.strip()]
+    if not hops:
+        return peer
+    if networks is None:
+        return hops[-1]
+    for hop in reversed(hops):
+        if not _in_networks(hop, networks):
+            return hop
+    return hops[0]
+
+
+def _estimate(current: int, previous: int, window: int, now: float) -> float:
+    elapsed = now % window
+    return previous * (1 - elapsed / window) + current
+
+
+async def ensure_rate_limit_indexes(db):
+    if settings.LOGIN_RATE_LIMIT_STORE == "mongo":
+        await db[COLLECTION].create_index("expires_at", name="expires_at_ttl", expireAfterSeconds=0)
+
+
+class MemoryStore:
+    """Per-process counters; the db argument is accepted for interface parity and ignored"""
+
+    MAX_KEYS = 100_000
+
+    def __init__(self):
+        # key -> [window start, current count, previous count], least recently hit first
+        self._windows: "OrderedDict[str, List[float]]" = OrderedDict()
+        # key -> locked until, earliest lock first
+        self._locks: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        """Drops stale entries from the cold ends and enforces MAX_KEYS; O(1) amortised"""
+        longest = max(settings.LOGIN_RATE_WINDOW_SECONDS, settings.LOGIN_FAILURE_WINDOW_SECONDS)
+        while self._windows:
+            _, entry = next(iter(self._windows.items()))
+            if len(self._windows) <= self.MAX_KEYS and now - entry[0] < 2 * longest:
+                break
+            self._windows.popitem(last=False)
+        while self._locks:
+            _, until = next(iter(self._locks.items()))
+            if len(self._locks) <= self.MAX_KEYS and until > now:
+                break
+            self._locks.popitem(last=False)
+
+    async def hit(self, db, key: str, window: int) -> float:
+        now = time.time()
+        start = now - now % window
+        with self._lock:
+            entry = self._windows.pop(key, None)
+            if entry is None or start - entry[0] >= 2 * window:
+                entry = [start, 0, 0]
+            elif start != entry[0]:
+                entry = [start, 0, entry[1]]
+            entry[1] += 1
+            self._windows[key] = entry
+            self._prune(now)
+            RATE_LIMIT_KEYS.set(len(self._windows))
+            return _estimate(entry[1], entry[2], window, now)
+
+    async def reset(self, db, key: str):
+        with self._lock:
+            self._windows.pop(key, None)
+
+    async def lock(self, db, key: str, seconds: int):
+        now = time.time()
+        with self._lock:
+            self._locks.pop(key, None)
+            self._locks[key] = now + seconds
+            self._prune(now)
+
+    async def locked_for(self, db, key: str) -> float:
+        with self._lock:
+            until = self._locks.get(key)
+        return max(until - time.time(), 0) if until else 0
+
+
+class MongoStore:
+    """Counters shared by all workers, one document per key and fixed window"""
+
+    async def hit(self, db, key: str, window: int) -> float:
+        now = time.time()
+        start = int(now - now % window)
+        current = await db[COLLECTION].find_one_and_update(
+            {"_id": f"{key}:{start}"},
+            {
+                "$inc": {"count": 1},
+                "$setOnInsert": {"expires_at": datetime.utcfromtimestamp(start + 2 * window)}
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        previous = await db[COLLECTION].find_one({"_id": f"{key}:{start - window}"})
+        return _estimate(current["count"], previous["count"] if previous else 0, window, now)
+
+    async def reset(self, db, key: str):
+        await db[COLLECTION].delete_many({"_id": {"$regex": f"^{re.escape(key)}:"}})
+
+    async def lock(self, db, key: str, seconds: int):
+        until = datetime.utcnow() + timedelta(seconds=seconds)
+        await db[COLLECTION].update_one(
+            {"_id": f"lock:{key}"}, {"$set": {"until": until, "expires_at": until}}, upsert=True
+        )
+
+    async def locked_for(self, db, key: str) -> float:
+        lock = await db[COLLECTION].find_one({"_id": f"lock:{key}"})
+        if lock is None:
+            return 0
+        return max((lock["until"] - datetime.utcnow()).total_seconds(), 0)
+
+
+class LoginLimiter:
+    def __init__(self, store):
+        self.store = store
+
+    async def check(self, db, client_ip: str, email: str) -> Optional[int]:
+        """Records an attempt; returns seconds to wait if it must be rejected, else None"""
+        email_key = f"email:{email.lower()}"
+        locked_for = await self.store.locked_for(db, email_key)
+        if locked_for:
+            LOGIN_ATTEMPTS.inc(outcome="locked_out")
+            return math.ceil(locked_for)
+
+        if settings.LOGIN_MAX_ATTEMPTS_PER_IP:
+            window = settings.LOGIN_RATE_WINDOW_SECONDS
+            attempts = await self.store.hit(db, f"ip:{client_ip}", window)
+            if attempts > settings.LOGIN_MAX_ATTEMPTS_PER_IP:
+                LOGIN_ATTEMPTS.inc(outcome="rate_limited")
+                return math.ceil(window - time.time() % window)
+        return None
+
+    async def record_failure(self, db, email: str):
+        LOGIN_ATTEMPTS.inc(outcome="failed")
+        if not settings.LOGIN_MAX_FAILURES_PER_EMAIL:
+            return
+        email_key = f"email:{email.lower()}"
+        failures = await self.store.hit(db, email_key, settings.LOGIN_FAILURE_WINDOW_SECONDS)
+        if failures >= settings.LOGIN_MAX_FAILURES_PER_EMAIL:
+            await self.store.lock(db, email_key, settings.LOGIN_LOCKOUT_SECONDS)
+            await self.store.reset(db, email_key)
+            LOGIN_LOCKOUTS.inc()
+
+    async def record_success(self, db, email: str):
+        LOGIN_ATTEMPTS.inc(outcome="succeeded")
+        await self.store.reset(db, f"email:{email.lower()}")
+
+
+login_limiter = LoginLimiter(MongoStore() if settings.LOGIN_RATE_LIMIT_STORE == "mongo" else MemoryStore())
@@ -0,0 +1,128 @@
+"""
+Access-token revocation for stateless auth (AUTH_STATELESS).
+
+Revocations are written to the `revoked_tokens` collection and mirrored in
+an in-memory list that every request checks without touching MongoDB. Each
+worker pulls entries written by other workers at most every
+REVOCATION_SYNC_SECONDS, so a revocation takes effect everywhere within
+that interval (immediately on the worker that issued it). created_at comes
+from the writing worker's clock, so each pull re-reads the last
+REVOCATION_SYNC_GRACE_SECONDS before the newest entry seen; entries with a
+slightly older stamp that commit late are still picked up, and re-applying
+an entry is harmless. Entries expire via a TTL index once the tokens they
+cover can no longer be valid.
+
+Three kinds of entry exist:
+- {"jti": ...}: a single token
+- {"sid": ...}: every access token minted for a refresh session, e.g. on logout
+- {"user_id": ..., "revoked_before": ...}: every token issued to a user
+  before that time, e.g. after a role change. Token `iat` claims are
+  whole seconds, so tokens issued in the second of the revocation are
+  kept; a re-login right after it must not be rejected.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from app.core.config import settings
+from app.core.metrics import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "revoked_tokens"
+
+
+async def ensure_revocation_indexes(db):
+    await db[COLLECTION].create_index("expires_at", name="expires_at_ttl", expireAfterSeconds=0)
+    await db[COLLECTION].create_index("created_at")
+
+
+def _longest_token_lifetime() -> timedelta:
+    # Any access token issued before now has expired once this has passed
+    return timedelta(minutes=max(settings.ACCESS_TOKEN_EXPIRE_MINUTES, settings.STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES))
+
+
+class RevocationList:
+    def __init__(self):
+        self._jtis: Dict[str, datetime] = {}
+        self._sids: Dict[str, datetime] = {}
+        self._users: Dict[str, datetime] = {}
+        self._synced_at = 0.0
+        self._cursor: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    def _apply(self, entry: dict):
+        if entry.get("jti"):
+            self._jtis[entry["jti"]] = entry["expires_at"]
+        elif entry.get("sid"):
+            self._sids[entry["sid"]] = entry["expires_at"]
+        elif entry.get("user_id"):
+            current = self._users.get(entry["user_id"])
+            if current is None or entry["revoked_before"] > current:
+                self._users[entry["user_id"]] = entry["revoked_before"]
+
+    async def sync(self, db, force: bool = False):
+        """Pulls revocations recorded since the last sync, at most every REVOCATION_SYNC_SECONDS"""
+        fresh = time.monotonic() - self._synced_at < settings.REVOCATION_SYNC_SECONDS
+        record_cache_lookup("revocation_list", fresh and not force)
+        if fresh and not force:
+            return
+        async with self._lock:
+            if not force and time.monotonic() - self._synced_at < settings.REVOCATION_SYNC_SECONDS:
+                return
+            query = {}
+            if self._cursor:
+                grace = timedelta(seconds=settings.REVOCATION_SYNC_GRACE_SECONDS)
+                query = {"created_at": {"$gt": self._cursor - grace}}
+            async for entry in db[COLLECTION].find(query, {"_id": 0}).sort("created_at", 1):
+                self._apply(entry)
+                self._cursor = max(self._cursor or entry["created_at"], entry["created_at"])
+            now = datetime.utcnow()
+            self._jtis = {jti: exp for jti, exp in self._jtis.items() if exp > now}
+            self._sids = {sid: exp for sid, exp in self._sids.items() if exp > now}
+            self._synced_at = time.monotonic()
+
+    def is_revoked(self, payload: dict) -> bool:
+        if payload.get("jti") in self._jtis or payload.get("sid") in self._sids:
+            return True
+        revoked_before = self._users.get(payload.get("id"))
+        if revoked_before is not None:
+            issued_at = datetime.utcfromtimestamp(payload.get("iat", 0))
+            return issued_at < revoked_before.replace(microsecond=0)
+        return False
+
+    async def revoke_token(self, db, payload: dict):
+        entry = {
+            "jti": payload["jti"],
+            "expires_at": datetime.utcfromtimestamp(payload["exp"]),
+            "created_at": datetime.utcnow()
+        }
+        self._apply(entry)
+        await db[COLLECTION].insert_one(entry)
+
+    async def revoke_session(self, db, session_id: str):
+        """Invalidates the access tokens minted for a refresh session"""
+        now = datetime.utcnow()
+        entry = {
+            "sid": session_id,
+            "expires_at": now + _longest_token_lifetime(),
+            "created_at": now
+        }
+        self._apply(entry)
+        await db[COLLECTION].insert_one(entry)
+
+    async def revoke_user(self, db, user_id: str):
+        """Invalidates every access token issued to the user so far"""
+        now = datetime.utcnow()
+        entry = {
+            "user_id": user_id,
+            "revoked_before": now,
+            "expires_at": now + _longest_token_lifetime(),
+            "created_at": now
+        }
+        self._apply(entry)
+        await db[COLLECTION].insert_one(entry)
+
+
+revocation_list = RevocationList()
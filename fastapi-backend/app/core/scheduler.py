@@ -0,0 +1,219 @@
+"""
+In-process background job scheduler.
+
+Every worker started by the FastAPI lifespan runs one polling task. A job's
+schedule and lock live in a single `scheduler_locks` document:
+
+    {"_id": job, "next_run_at": ..., "locked_until": ..., "owner": ...}
+
+A worker claims a due job with one atomic find_one_and_update that only
+matches when next_run_at has passed and no unexpired lock is held, so with
+several workers (or several app instances) each due run executes exactly
+once. While a job runs, its worker pushes locked_until forward every third
+of SCHEDULER_LOCK_SECONDS, so a long run keeps its lock. A worker that dies
+mid-run stops heartbeating and leaves a lock that expires after
+SCHEDULER_LOCK_SECONDS, after which another worker picks the job up.
+
+Each run is recorded in `scheduler_runs` (kept for
+SCHEDULER_RUN_RETENTION_DAYS) with its outcome and the stats the job
+returned, and counted in the scheduler_job_* metrics.
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from pymongo import ReturnDocument
+from app.core.config import settings
+from app.core.metrics import SCHEDULER_RUNS, SCHEDULER_RUN_DURATION
+
+logger = logging.getLogger(__name__)
+
+LOCKS_COLLECTION = "scheduler_locks"
+RUNS_COLLECTION = "scheduler_runs"
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[..., Awaitable[Optional[dict]]]
+    interval: timedelta
+    description: str = ""
+
+
+class Scheduler:
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, func, interval: timedelta, description: str = ""):
+        """Adds a job; func(db, run_id) returns a dict of stats for the run record"""
+        self.jobs[name] = Job(name, func, interval, description)
+
+    def start(self, db):
+        if self._task is None and self.jobs:
+            self._task = asyncio.create_task(self._loop(db), name="scheduler")
+            logger.info(f"Scheduler started with jobs: {', '.join(self.jobs)}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self, db):
+        seeded = False
+        while True:
+            if not seeded:
+                # Mongo may still be unreachable at startup; retry on the next poll
+                try:
+                    await self._seed(db)
+                    seeded = True
+                except Exception as e:
+                    logger.error(f"Scheduler could not initialise job schedules, retrying: {e}")
+                    await asyncio.sleep(settings.SCHEDULER_POLL_SECONDS)
+                    continue
+            for job in self.jobs.values():
+                try:
+                    await self.run_if_due(db, job)
+                except Exception as e:
+                    logger.error(f"Scheduler poll for {job.name} failed: {e}")
+            await asyncio.sleep(settings.SCHEDULER_POLL_SECONDS)
+
+    async def _seed(self, db):
+        now = datetime.utcnow()
+        for name in self.jobs:
+            await db[LOCKS_COLLECTION].update_one(
+                {"_id": name},
+                {"$setOnInsert": {"next_run_at": now, "locked_until": None, "owner": None}},
+                upsert=True
+            )
+
+    async def _acquire(self, db, job: Job) -> bool:
+        now = datetime.utcnow()
+        claimed = await db[LOCKS_COLLECTION].find_one_and_update(
+            {
+                "_id": job.name,
+                "next_run_at": {"$lte": now},
+                "$or": [{"locked_until": None}, {"locked_until": {"$lte": now}}]
+            },
+            {"$set": {
+                "owner": self.owner,
+                "locked_until": now + timedelta(seconds=settings.SCHEDULER_LOCK_SECONDS)
+            }},
+            return_document=ReturnDocument.AFTER
+        )
+        return claimed is not None
+
+    async def _heartbeat(self, db, job: Job):
+        """Keeps extending this worker's lock on `job` until cancelled"""
+        lock_seconds = settings.SCHEDULER_LOCK_SECONDS
+        while True:
+            await asyncio.sleep(max(lock_seconds / 3, 1))
+            try:
+                result = await db[LOCKS_COLLECTION].update_one(
+                    {"_id": job.name, "owner": self.owner},
+                    {"$set": {"locked_until": datetime.utcnow() + timedelta(seconds=lock_seconds)}}
+                )
+                if result.matched_count == 0:
+                    logger.warning(f"Scheduler lost the lock on {job.name} while it was still running")
+            except Exception as e:
+                logger.error(f"Scheduler heartbeat for {job.name} failed: {e}")
+
+    async def run_if_due(self, db, job: Job) -> bool:
+        """Runs the job if it is due and this worker wins its lock; returns whether it ran"""
+        if not await self._acquire(db, job):
+            return False
+
+        run_id = uuid.uuid4().hex
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        record = {
+            "_id": run_id,
+            "job": job.name,
+            "owner": self.owner,
+            "started_at": started_at,
+            "status": "RUNNING"
+        }
+        await db[RUNS_COLLECTION].insert_one(record)
+
+        outcome, stats, error = "SUCCESS", None, None
+        heartbeat = asyncio.create_task(self._heartbeat(db, job), name=f"scheduler-heartbeat-{job.name}")
+        try:
+            stats = await job.func(db, run_id)
+        except asyncio.CancelledError:
+            outcome, error = "CANCELLED", "worker shutting down"
+            raise
+        except Exception as e:
+            outcome, error = "FAILED", f"{e.__class__.__name__}: {e}"
+            logger.exception(f"Scheduled job {job.name} failed")
+        finally:
+            heartbeat.cancel()
+            duration = time.perf_counter() - started
+            SCHEDULER_RUNS.inc(job=job.name, outcome=outcome.lower())
+            SCHEDULER_RUN_DURATION.observe(duration, job=job.name)
+            finished_at = datetime.utcnow()
+            # A cancelled run is retried on the next poll by whichever worker is still up
+            next_run_at = finished_at if outcome == "CANCELLED" else started_at + job.interval
+            await asyncio.shield(self._finish(db, job, run_id, {
+                "status": outcome,
+                "finished_at": finished_at,
+                "duration_seconds": round(duration, 3),
+                "stats": stats,
+                "error": error
+            }, next_run_at))
+        logger.info(f"Scheduled job {job.name} finished ({outcome}) in {duration:.2f}s: {stats}")
+        return True
+
+    async def _finish(self, db, job: Job, run_id: str, result: dict, next_run_at: datetime):
+        await db[RUNS_COLLECTION].update_one({"_id": run_id}, {"$set": result})
+        await db[LOCKS_COLLECTION].update_one(
+            {"_id": job.name, "owner": self.owner},
+            {"$set": {"locked_until": None, "next_run_at": next_run_at, "last_status": result["status"]}}
+        )
+
+    async def trigger(self, db, name: str) -> bool:
+        """Makes a job due now; the next poll of any worker runs it"""
+        result = await db[LOCKS_COLLECTION].update_one(
+            {"_id": name},
+            {"$set": {"next_run_at": datetime.utcnow()}}
+        )
+        return result.matched_count > 0
+
+    async def status(self, db, runs_per_job: int = 5) -> list:
+        locks = {doc["_id"]: doc async for doc in db[LOCKS_COLLECTION].find({"_id": {"$in": list(self.jobs)}})}
+        jobs = []
+        for job in self.jobs.values():
+            lock = locks.get(job.name, {})
+            runs = await db[RUNS_COLLECTION].find({"job": job.name}).sort("started_at", -1).to_list(runs_per_job)
+            jobs.append({
+                "name": job.name,
+                "description": job.description,
+                "interval_seconds": int(job.interval.total_seconds()),
+                "next_run_at": lock.get("next_run_at"),
+                "locked_until": lock.get("locked_until"),
+                "owner": lock.get("owner"),
+                "last_status": lock.get("last_status"),
+                "recent_runs": runs
+            })
+        return jobs
+
+
+async def ensure_scheduler_indexes(db):
+    await db[RUNS_COLLECTION].create_index([("job", 1), ("started_at", -1)])
+    await db[RUNS_COLLECTION].create_index(
+        "started_at",
+        name="started_at_ttl",
+        expireAfterSeconds=settings.SCHEDULER_RUN_RETENTION_DAYS * 86400
+    )
+
+
+scheduler = Scheduler()
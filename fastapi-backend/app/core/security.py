@@ -1,8 +1,16 @@
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Union
 from jose import jwt
 import bcrypt
 from app.core.config import settings
+from app.core.metrics import BCRYPT_IN_FLIGHT, BCRYPT_QUEUE_DEPTH
+
+# bcrypt is deliberately slow CPU work; run it off the event loop on a
+# bounded pool so login bursts queue up instead of stalling every request
+_bcrypt_pool = ThreadPoolExecutor(max_workers=settings.BCRYPT_WORKERS, thread_name_prefix="bcrypt")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -17,12 +25,42 @@ def get_password_hash(password: str) -> str:
     salt = bcrypt.gensalt()
     return bcrypt.hashpw(pw_bytes, salt).decode("utf-8")
 
+def _run_bcrypt(fn, *args):
+    BCRYPT_QUEUE_DEPTH.dec()
+    with BCRYPT_IN_FLIGHT.track_inprogress():
+        return fn(*args)
+
+async def _submit_bcrypt(fn, *args):
+    BCRYPT_QUEUE_DEPTH.inc()
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_pool, _run_bcrypt, fn, *args)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bcrypt pool."""
+    return await _submit_bcrypt(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the bcrypt pool."""
+    return await _submit_bcrypt(get_password_hash, password)
+
+def access_token_lifetime() -> timedelta:
+    if settings.AUTH_STATELESS:
+        return timedelta(minutes=settings.STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES)
+    return timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+def user_claims(user: dict) -> dict:
+    """Identity claims carried by access tokens; enough to authorize without loading the user"""
+    return {
+        "sub": user["email"],
+        "id": str(user["_id"]),
+        "roles": [user.get("role", "USER")],
+        "name": user.get("name"),
+        "registerNumber": user.get("registerNumber") or user.get("register_number")
+    }
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    now = datetime.utcnow()
+    expire = now + (expires_delta or access_token_lifetime())
+    to_encode.update({"exp": expire, "iat": now, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
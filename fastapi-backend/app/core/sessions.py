@@ -0,0 +1,119 @@
+"""
+Refresh-token sessions.
+
+Login opens a session in the `sessions` collection and hands out an opaque
+refresh token; only its SHA-256 hash is stored. Every /api/auth/refresh
+rotates the token atomically. Presenting an already-rotated token again
+(outside a short grace window for racing clients) is treated as theft and
+revokes the whole session. Access tokens carry the session id as `sid`, so
+revoking a session also cuts off its outstanding access tokens through the
+in-memory revocation list.
+"""
+import hashlib
+import logging
+import secrets
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from bson import ObjectId
+from pymongo import ReturnDocument
+from app.core.config import settings
+from app.core.revocation import revocation_list
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "sessions"
+PREVIOUS_TOKENS_KEPT = 5
+
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def ensure_session_indexes(db):
+    await db[COLLECTION].create_index("token_hash", unique=True)
+    await db[COLLECTION].create_index("previous_token_hashes")
+    await db[COLLECTION].create_index("user_id")
+    await db[COLLECTION].create_index("expires_at", name="expires_at_ttl", expireAfterSeconds=0)
+
+
+async def create_session(db, user_id: str, user_agent: Optional[str] = None) -> Tuple[str, str]:
+    """Returns (session_id, refresh_token)"""
+    now = datetime.utcnow()
+    refresh_token = secrets.token_urlsafe(32)
+    result = await db[COLLECTION].insert_one({
+        "user_id": user_id,
+        "token_hash": hash_token(refresh_token),
+        "previous_token_hashes": [],
+        "user_agent": user_agent,
+        "created_at": now,
+        "last_used_at": now,
+        "expires_at": now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        "revoked_at": None
+    })
+    return str(result.inserted_id), refresh_token
+
+
+async def rotate_session(db, refresh_token: str) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    Exchanges a refresh token for a new one. Returns (session, new_refresh_token),
+    or (None, None) when the token is unknown, expired, revoked or reused.
+    """
+    now = datetime.utcnow()
+    token_hash = hash_token(refresh_token)
+    new_token = secrets.token_urlsafe(32)
+    session = await db[COLLECTION].find_one_and_update(
+        {"token_hash": token_hash, "revoked_at": None, "expires_at": {"$gt": now}},
+        {
+            "$set": {
+                "token_hash": hash_token(new_token),
+                "last_used_at": now,
+                # Sliding expiry: sessions end after REFRESH_TOKEN_EXPIRE_DAYS of inactivity
+                "expires_at": now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+            },
+            "$push": {"previous_token_hashes": {"$each": [token_hash], "$slice": -PREVIOUS_TOKENS_KEPT}}
+        },
+        return_document=ReturnDocument.AFTER
+    )
+    if session:
+        return session, new_token
+
+    rotated = await db[COLLECTION].find_one({"previous_token_hashes": token_hash, "revoked_at": None})
+    if rotated is None:
+        return None, None
+    if rotated["last_used_at"] > now - timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS):
+        # Two requests raced on the same token; the loser just retries with the new one
+        return None, None
+
+    logger.warning(f"Refresh token reuse detected for session {rotated['_id']} (user {rotated['user_id']}); revoking")
+    await revoke_session(db, str(rotated["_id"]), reason="reuse")
+    return None, None
+
+
+async def revoke_session(db, session_id: str, reason: str = "logout"):
+    await db[COLLECTION].update_one(
+        {"_id": ObjectId(session_id), "revoked_at": None},
+        {"$set": {"revoked_at": datetime.utcnow(), "revoked_reason": reason}}
+    )
+    await revocation_list.revoke_session(db, session_id)
+
+
+async def revoke_session_by_token(db, refresh_token: str, reason: str = "logout") -> bool:
+    """Ends the session a refresh token (current or just rotated) belongs to"""
+    token_hash = hash_token(refresh_token)
+    session = await db[COLLECTION].find_one(
+        {"$or": [{"token_hash": token_hash}, {"previous_token_hashes": token_hash}], "revoked_at": None},
+        {"_id": 1}
+    )
+    if session is None:
+        return False
+    await revoke_session(db, str(session["_id"]), reason=reason)
+    return True
+
+
+async def revoke_user_sessions(db, user_id: str, reason: str = "admin"):
+    """Ends every open session of a user so no new access tokens can be minted"""
+    result = await db[COLLECTION].update_many(
+        {"user_id": user_id, "revoked_at": None},
+        {"$set": {"revoked_at": datetime.utcnow(), "revoked_reason": reason}}
+    )
+    return result.modified_count
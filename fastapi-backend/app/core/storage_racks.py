@@ -0,0 +1,143 @@
+"""
+Materialized storage rack occupancy.
+
+Each document in `storage_racks` is keyed by the storage location string
+and holds the number of stored items on it plus a per-category breakdown.
+Handlers that move an item onto or off a rack (storage assignment,
+handover, archive, dispose, status changes) read the item's previous state
+atomically with find_one_and_update and pass both states to
+record_transition, which applies the difference with `$inc`; bulk changes
+net their moves per rack with apply_transitions. The storage room summary
+is then a read of a few small documents instead of a scan over every
+stored item.
+
+rebuild_rack_occupancy recomputes the collection from `items` with one
+`$group`; it seeds an empty collection on startup and repairs drift.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+import logging
+from pymongo import ReturnDocument, UpdateOne
+
+logger = logging.getLogger(__name__)
+
+RACKS_COLLECTION = "storage_racks"
+
+# Statuses for which an item physically occupies its storage location
+STORED_STATUSES = ("AVAILABLE", "PENDING", "CLAIMED")
+
+# Filter matching every item that occupies a rack
+STORED_FILTER = {
+    "storage_location": {"$nin": [None, ""]},
+    "status": {"$in": list(STORED_STATUSES)}
+}
+
+
+def _status_value(status) -> Optional[str]:
+    return getattr(status, "value", status)
+
+
+def rack_slot(item: Optional[dict]) -> Optional[Tuple[str, str]]:
+    """(location, category) the item occupies, or None when it is not on a rack"""
+    if not item:
+        return None
+    location = item.get("storage_location")
+    if not location or _status_value(item.get("status")) not in STORED_STATUSES:
+        return None
+    return location, _status_value(item.get("category")) or "OTHER"
+
+
+async def apply_transitions(db, transitions: Iterable[Tuple[Optional[dict], Optional[dict]]]):
+    """
+    Applies (before, after) item state pairs to rack occupancy.
+    Deltas are netted per rack and category first, so a batch of moves costs
+    one bulk_write however many items it covers.
+    """
+    deltas = defaultdict(int)
+    for before, after in transitions:
+        old, new = rack_slot(before), rack_slot(after)
+        if old == new:
+            continue
+        if old:
+            deltas[old] -= 1
+        if new:
+            deltas[new] += 1
+
+    by_rack = defaultdict(dict)
+    for (location, category), delta in deltas.items():
+        if delta:
+            by_rack[location][f"categories.{category}"] = delta
+    if not by_rack:
+        return
+
+    now = datetime.utcnow()
+    await db[RACKS_COLLECTION].bulk_write([
+        UpdateOne(
+            {"_id": location},
+            {"$inc": {"item_count": sum(incs.values()), **incs}, "$set": {"updated_at": now}},
+            upsert=True
+        )
+        for location, incs in by_rack.items()
+    ], ordered=False)
+    await db[RACKS_COLLECTION].delete_many({"_id": {"$in": list(by_rack)}, "item_count": {"$lte": 0}})
+
+
+async def record_transition(db, before: Optional[dict], after: Optional[dict]):
+    """Applies one item's move between rack slots; a no-op when the slot is unchanged"""
+    await apply_transitions(db, [(before, after)])
+
+
+async def update_item_tracked(db, item_filter: dict, update_data: dict) -> Optional[dict]:
+    """
+    `$set`s update_data (plus updated_at) on one item and keeps rack occupancy
+    in step. Returns the item as it was before the update, or None if nothing
+    matched.
+    """
+    update_data = {**update_data, "updated_at": datetime.utcnow()}
+    before = await db["items"].find_one_and_update(
+        item_filter,
+        {"$set": update_data},
+        return_document=ReturnDocument.BEFORE
+    )
+    if before is not None:
+        await record_transition(db, before, {**before, **update_data})
+    return before
+
+
+async def rebuild_rack_occupancy(db) -> int:
+    """Recomputes storage_racks from items; returns the number of occupied racks"""
+    pipeline = [
+        {"$match": STORED_FILTER},
+        {"$group": {
+            "_id": {"location": "$storage_location", "category": {"$ifNull": ["$category", "OTHER"]}},
+            "count": {"$sum": 1}
+        }}
+    ]
+    racks = {}
+    async for doc in db["items"].aggregate(pipeline):
+        rack = racks.setdefault(doc["_id"]["location"], {"item_count": 0, "categories": {}})
+        rack["item_count"] += doc["count"]
+        rack["categories"][doc["_id"]["category"]] = doc["count"]
+
+    now = datetime.utcnow()
+    for location, rack in racks.items():
+        await db[RACKS_COLLECTION].replace_one(
+            {"_id": location},
+            {**rack, "updated_at": now},
+            upsert=True
+        )
+    await db[RACKS_COLLECTION].delete_many({"_id": {"$nin": list(racks)}})
+    return len(racks)
+
+
+async def ensure_storage_rack_indexes(db):
+    """Index the stored-item scans and seed rack occupancy on first start"""
+    await db["items"].create_index(
+        [("storage_location", 1), ("status", 1), ("dateTime", -1)],
+        name="storage_location_status_dateTime"
+    )
+    if await db[RACKS_COLLECTION].estimated_document_count() == 0:
+        racks = await rebuild_rack_occupancy(db)
+        if racks:
+            logger.info(f"Seeded occupancy for {racks} storage racks")
@@ -0,0 +1,189 @@
+"""
+Delta sync for the mobile app.
+
+Items, claims and notifications carry an `updated_at` stamped by every
+write, and removals leave a document in `tombstones`. A client keeps the
+opaque token returned by GET /api/sync and sends it back as `since`; the
+response then holds only what changed after it.
+
+The token stores, per collection, the (updated_at, _id) position the client
+has read up to, and pages are read in that order, so a bulk write that
+stamps thousands of documents with the same time still pages correctly.
+Once a collection is caught up its position is set SYNC_GRACE_SECONDS
+before the time the query started, so writes stamped just before the read
+but committed just after it are delivered on the next sync. Clients upsert
+by _id, so the few documents sent twice are harmless.
+
+Only the tombstone position decides whether a token is too old: once it
+falls behind SYNC_TOMBSTONE_RETENTION_DAYS, deletions the client has not
+seen may have expired, so the response is a full snapshot with
+`reset: true`. Document positions say nothing about that; a snapshot that
+pages through old documents legitimately holds old positions.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from app.core.config import settings
+from app.core.lookups import USER_PRIVATE_FIELDS
+
+TOMBSTONES_COLLECTION = "tombstones"
+TOKEN_VERSION = 1
+MIN_OBJECT_ID = ObjectId("0" * 24)
+EPOCH = datetime(1970, 1, 1)
+
+# Statuses shown in the public feed; other users' items outside them are removed client-side
+FEED_STATUSES = ["PENDING", "OPEN", "AVAILABLE"]
+
+# Used to backfill updated_at on documents written before it existed
+CREATED_FIELDS = {"items": "dateTime", "claims": "submissionDate", "notifications": "created_at"}
+
+Position = Tuple[datetime, ObjectId]
+
+
+class InvalidSyncToken(ValueError):
+    pass
+
+
+def _millis(dt: datetime) -> int:
+    return int((dt - EPOCH).total_seconds() * 1000)
+
+
+def _from_millis(ms: int) -> datetime:
+    return EPOCH + timedelta(milliseconds=ms)
+
+
+def encode_token(positions: dict) -> str:
+    payload = {
+        "v": TOKEN_VERSION,
+        "p": {name: [_millis(at), str(oid)] for name, (at, oid) in positions.items()}
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token: str) -> dict:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        version, positions = payload.get("v"), payload["p"]
+        decoded = {name: (_from_millis(ms), ObjectId(oid)) for name, (ms, oid) in positions.items()}
+    except (binascii.Error, InvalidId, ValueError, AttributeError, KeyError, TypeError) as e:
+        raise InvalidSyncToken("Invalid sync token") from e
+    if version != TOKEN_VERSION:
+        raise InvalidSyncToken("Sync token version is not supported")
+    return decoded
+
+
+def _after(field: str, position: Position) -> dict:
+    at, oid = position
+    return {"$or": [{field: {"$gt": at}}, {field: at, "_id": {"$gt": oid}}]}
+
+
+async def _read_page(db, collection: str, scope: dict, field: str, position: Position, limit: int) -> List[dict]:
+    query = {"$and": [scope, _after(field, position)]} if scope else _after(field, position)
+    return await db[collection].find(query).sort([(field, 1), ("_id", 1)]).to_list(limit)
+
+
+async def record_tombstones(db, collection: str, ids: list, user_id: Optional[str] = None):
+    """Marks documents as deleted for syncing clients; user_id scopes the tombstone to one user"""
+    if not ids:
+        return
+    now = datetime.utcnow()
+    await db[TOMBSTONES_COLLECTION].insert_many([
+        {"collection": collection, "doc_id": str(doc_id), "user_id": user_id, "deleted_at": now}
+        for doc_id in ids
+    ], ordered=False)
+
+
+async def fetch_changes(db, user_id: str, since: Optional[str]) -> dict:
+    started = datetime.utcnow()
+    caught_up_at = (started - timedelta(seconds=settings.SYNC_GRACE_SECONDS), MIN_OBJECT_ID)
+    limit = settings.SYNC_PAGE_SIZE
+
+    positions = decode_token(since) if since else {}
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    tombstones_seen = positions.get(TOMBSTONES_COLLECTION, (EPOCH, MIN_OBJECT_ID))[0]
+    reset = bool(positions) and tombstones_seen < started - retention
+    if reset:
+        positions = {}
+    snapshot = not positions
+    start = (EPOCH, MIN_OBJECT_ID)
+
+    # Snapshots hold only what the client shows; deltas also carry items that left the feed
+    visible_items = {"$or": [{"status": {"$in": FEED_STATUSES}}, {"user_id": user_id}]}
+    scopes = {
+        "items": visible_items if snapshot else {},
+        "claims": {"claimant_id": user_id},
+        "notifications": {"user_id": user_id}
+    }
+
+    response = {"items": [], "claims": [], "notifications": []}
+    deleted = {"items": [], "claims": [], "notifications": []}
+    new_positions, has_more = {}, False
+    for name, scope in scopes.items():
+        docs = await _read_page(db, name, scope, "updated_at", positions.get(name, start), limit)
+        if len(docs) == limit:
+            has_more = True
+            new_positions[name] = (docs[-1]["updated_at"], docs[-1]["_id"])
+        else:
+            new_positions[name] = max(positions.get(name, start), caught_up_at)
+        for doc in docs:
+            if name == "items" and not snapshot and doc.get("status") not in FEED_STATUSES and doc.get("user_id") != user_id:
+                deleted["items"].append(str(doc["_id"]))
+            else:
+                response[name].append(doc)
+
+    if snapshot:
+        new_positions[TOMBSTONES_COLLECTION] = caught_up_at
+    else:
+        tombstones = await _read_page(
+            db, TOMBSTONES_COLLECTION,
+            {"user_id": {"$in": [None, user_id]}},
+            "deleted_at", positions.get(TOMBSTONES_COLLECTION, start), limit
+        )
+        if len(tombstones) == limit:
+            has_more = True
+            new_positions[TOMBSTONES_COLLECTION] = (tombstones[-1]["deleted_at"], tombstones[-1]["_id"])
+        else:
+            new_positions[TOMBSTONES_COLLECTION] = max(positions.get(TOMBSTONES_COLLECTION, start), caught_up_at)
+        for tombstone in tombstones:
+            deleted.setdefault(tombstone["collection"], []).append(tombstone["doc_id"])
+
+    # Reporters of the returned items, once each
+    user_ids = {ObjectId(i["user_id"]) for i in response["items"] if ObjectId.is_valid(str(i.get("user_id")))}
+    users = await db["users"].find(
+        {"_id": {"$in": list(user_ids)}}, USER_PRIVATE_FIELDS
+    ).to_list(length=None) if user_ids else []
+
+    return {
+        **response,
+        "users": {str(u["_id"]): u for u in users},
+        "deleted": deleted,
+        "reset": reset,
+        "has_more": has_more,
+        "token": encode_token(new_positions),
+        "server_time": started
+    }
+
+
+async def ensure_sync_indexes(db):
+    """Sync read indexes, tombstone expiry and a one-off updated_at backfill"""
+    await db["items"].create_index([("updated_at", 1), ("_id", 1)])
+    await db["claims"].create_index([("claimant_id", 1), ("updated_at", 1), ("_id", 1)])
+    await db["notifications"].create_index([("user_id", 1), ("updated_at", 1), ("_id", 1)])
+    await db[TOMBSTONES_COLLECTION].create_index([("deleted_at", 1), ("_id", 1)])
+    await db[TOMBSTONES_COLLECTION].create_index(
+        "deleted_at",
+        name="deleted_at_ttl",
+        expireAfterSeconds=settings.SYNC_TOMBSTONE_RETENTION_DAYS * 86400
+    )
+
+    now = datetime.utcnow()
+    for collection, created_field in CREATED_FIELDS.items():
+        await db[collection].update_many(
+            {"updated_at": None},
+            [{"$set": {"updated_at": {"$ifNull": [f"${created_field}", now]}}}]
+        )
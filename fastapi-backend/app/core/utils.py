@@ -1,13 +1,52 @@
-import random
-import string
 from datetime import datetime
+from typing import Optional
+from bson import ObjectId
 
-def generate_custom_id(prefix: str) -> str:
+def convert_object_ids(obj):
+    """Recursively replace ObjectIds with their string form for JSON responses"""
+    if isinstance(obj, list):
+        return [convert_object_ids(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: (str(v) if isinstance(v, ObjectId) else convert_object_ids(v)) for k, v in obj.items()}
+    return obj
+
+def serialize_document(obj):
+    """
+    JSON-ready copy of a document in one pass: ObjectIds become strings and
+    datetimes ISO strings, so the result can go straight into a JSONResponse
+    without convert_object_ids followed by jsonable_encoder.
+    """
+    if isinstance(obj, dict):
+        return {k: serialize_document(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [serialize_document(item) for item in obj]
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return obj
+
+def claim_decision_fields(
+    claim: dict,
+    status: str,
+    admin_id: str,
+    admin_name: str,
+    decided_at: Optional[datetime] = None
+) -> dict:
     """
-    Generates a readable custom ID.
-    Format: PREFIX-YYYYMMDD-XXXX
-    Example: LOST-20240221-A7B2
+    Lifecycle fields stamped on a claim when it is approved or rejected.
+    Stores the decision time and how long the claim waited, so analytics
+    can average `processing_hours` without reading the audit trail.
     """
-    date_str = datetime.now().strftime("%Y%m%d")
-    random_str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
-    return f"{prefix}-{date_str}-{random_str}"
+    decided_at = decided_at or datetime.utcnow()
+    prefix = "verified" if status == "APPROVED" else "rejected"
+    fields = {
+        "decided_at": decided_at,
+        f"{prefix}_at": decided_at,
+        f"{prefix}_by": admin_id,
+        f"{prefix}_by_name": admin_name
+    }
+    submitted = claim.get("submissionDate")
+    if isinstance(submitted, datetime):
+        fields["processing_hours"] = round((decided_at - submitted).total_seconds() / 3600, 2)
+    return fields
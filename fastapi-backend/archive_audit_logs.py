@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+load_dotenv()
+
+from app.core.audit import archive_audit_logs
+from app.core.config import settings
+
+# Moves old audit entries into monthly audit_logs_YYYY_MM collections before
+# the TTL index on audit_logs expires them. The scheduler runs the same archive
+# as the archive_old_audit_logs job; use this for a one-off run or an export.
+async def main():
+    parser = argparse.ArgumentParser(description="Archive old audit logs into monthly partitions")
+    parser.add_argument("--older-than-days", type=int, default=settings.AUDIT_LOG_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--export-dir", default=None, help="Also append archived entries to JSONL files here")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", settings.MONGODB_URL))
+    db = client[os.getenv("DATABASE_NAME", settings.DATABASE_NAME)]
+
+    print(f"Archiving audit logs older than {args.older_than_days} days...")
+    result = await archive_audit_logs(db, args.older_than_days, args.export_dir, args.batch_size)
+    for name, count in sorted(result["partitions"].items()):
+        print(f"- {name}: {count} entries")
+    print(f"Archived {result['total_archived']} entries (cutoff {result['cutoff']})")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
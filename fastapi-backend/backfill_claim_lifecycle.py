@@ -0,0 +1,76 @@
+import asyncio
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+load_dotenv()
+
+from app.core.utils import claim_decision_fields
+
+BATCH_SIZE = 500
+
+# One-off migration: stamps decided_at / processing_hours on claims that were
+# approved or rejected before those fields existed. The decision time comes
+# from rejected_at/verified_at when present, otherwise from the latest CLAIM_*
+# audit entry. Entries already moved to audit_logs_YYYY_MM are not consulted.
+async def backfill_claims():
+    mongo_url = os.getenv("MONGODB_URL")
+    db_name = os.getenv("DATABASE_NAME")
+    
+    print(f"Connecting to {mongo_url}...")
+    client = AsyncIOMotorClient(mongo_url)
+    db = client[db_name]
+    
+    print("Collecting claim decisions from audit logs...")
+    decisions = {}
+    async for entry in db["audit_logs"].aggregate([
+        {"$match": {"target_type": "CLAIM", "action": {"$regex": "^CLAIM_(ClaimStatus\\.)?(APPROVED|REJECTED)"}}},
+        {"$sort": {"timestamp": 1}},
+        {"$group": {
+            "_id": "$target_id",
+            "timestamp": {"$last": "$timestamp"},
+            "admin_id": {"$last": "$admin_id"},
+            "admin_name": {"$last": "$admin_name"}
+        }}
+    ], allowDiskUse=True):
+        decisions[entry["_id"]] = entry
+    print(f"Found decisions for {len(decisions)} claims.")
+    
+    query = {
+        "status": {"$in": ["APPROVED", "REJECTED"]},
+        "processing_hours": {"$exists": False}
+    }
+    updates = []
+    fixed = 0
+    skipped = 0
+    async for claim in db["claims"].find(query):
+        audit = decisions.get(str(claim["_id"]), {})
+        decided_at = claim.get("rejected_at") or claim.get("verified_at") or audit.get("timestamp")
+        if not isinstance(decided_at, datetime):
+            skipped += 1
+            continue
+        
+        fields = claim_decision_fields(
+            claim,
+            claim["status"],
+            claim.get("rejected_by") or claim.get("verified_by") or audit.get("admin_id"),
+            claim.get("rejected_by_name") or claim.get("verified_by_name") or audit.get("admin_name"),
+            decided_at=decided_at
+        )
+        updates.append(UpdateOne({"_id": claim["_id"]}, {"$set": fields}))
+        if len(updates) >= BATCH_SIZE:
+            await db["claims"].bulk_write(updates, ordered=False)
+            fixed += len(updates)
+            updates = []
+    
+    if updates:
+        await db["claims"].bulk_write(updates, ordered=False)
+        fixed += len(updates)
+    
+    print(f"Backfilled {fixed} claims, skipped {skipped} without a known decision time.")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(backfill_claims())
@@ -0,0 +1,108 @@
+"""
+Measure the per-request cost of the admin authorization guard.
+
+    python -m benchmarks.admin_guard --json guard.json
+    python -m benchmarks.admin_guard --compare guard.json
+
+Two scenarios run against a server on the benchmark dataset:
+
+* rejected: a student token calling admin endpoints. The roles claim is
+  checked before any user lookup, so these should cost zero MongoDB ops.
+* accepted: an admin token calling /api/admin/profile, the cheapest admin
+  route, which isolates the auth overhead (one user lookup per request).
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from pymongo import MongoClient
+from benchmarks.dataset import ADMIN_EMAIL, USER_EMAIL, PASSWORD
+from benchmarks.run import login, mongo_ops, percentile
+
+REJECTED_PATHS = [
+    "/api/admin/stats/dashboard",
+    "/api/admin/claims/prioritized",
+    "/api/admin/storage/inventory",
+    "/api/admin/analytics/trends",
+]
+ACCEPTED_PATH = "/api/admin/profile"
+
+
+def run_scenario(base_url, token, paths, expected_status, total, concurrency, admin_db):
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+
+    def call(i):
+        started = time.perf_counter()
+        response = session.get(f"{base_url}{paths[i % len(paths)]}", timeout=60)
+        return (time.perf_counter() - started) * 1000, response.status_code
+
+    ops_before = mongo_ops(admin_db)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(call, range(total)))
+    wall = time.perf_counter() - started
+    ops_after = mongo_ops(admin_db)
+
+    latencies = [elapsed for elapsed, code in results if code == expected_status]
+    report = {
+        "requests": total,
+        "unexpected_status": total - len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "throughput_rps": round(total / wall, 1) if wall else 0.0,
+    }
+    if ops_before is not None:
+        report["db_ops_per_request"] = round((ops_after - ops_before - 1) / total, 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the admin authorization guard")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017",
+                        help="Used only to read opcounters; pass '' to skip query counting")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    parser.add_argument("--compare", help="Previous --json output to print alongside")
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongodb_url) if args.mongodb_url else None
+    admin_db = client.admin if client else None
+    user_token = login(args.base_url, USER_EMAIL, PASSWORD)
+    admin_token = login(args.base_url, ADMIN_EMAIL, PASSWORD)
+
+    results = {
+        "rejected": run_scenario(args.base_url, user_token, REJECTED_PATHS, 403,
+                                 args.requests, args.concurrency, admin_db),
+        "accepted": run_scenario(args.base_url, admin_token, [ACCEPTED_PATH], 200,
+                                 args.requests, args.concurrency, admin_db),
+    }
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    columns = ["p50_ms", "p95_ms", "throughput_rps", "db_ops_per_request", "unexpected_status"]
+    print(f"{'scenario':<12}" + "".join(f"{c:>20}" for c in columns))
+    for name, report in results.items():
+        print(f"{name:<12}" + "".join(f"{str(report.get(c, '-')):>20}" for c in columns))
+        if name in baseline:
+            print(f"{'  baseline':<12}" + "".join(f"{str(baseline[name].get(c, '-')):>20}" for c in columns))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if client:
+        client.close()
+    if any(report["unexpected_status"] for report in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
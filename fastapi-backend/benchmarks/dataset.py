@@ -0,0 +1,217 @@
+"""
+Synthetic campus dataset for load testing.
+
+Generates users, LOST/FOUND items, claims, notifications and audit logs
+with realistic distributions and writes them to a (local, disposable)
+MongoDB database in batches.
+
+    python -m benchmarks.dataset --items 100000 --users 50000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+import bcrypt
+from pymongo import MongoClient
+
+CATEGORIES = ["DOCUMENTS", "DEVICES", "ACCESSORIES", "PERSONAL_ITEMS", "KEYS", "BOOKS", "JEWELLERY", "OTHERS"]
+CATEGORY_WEIGHTS = [12, 18, 16, 20, 10, 12, 4, 8]
+LOCATIONS = [
+    "Library 2nd Floor", "Canteen", "Main Block Corridor", "Auditorium", "Parking Lot",
+    "Hostel Block A", "Hostel Block B", "Sports Complex", "CSE Lab 3", "ECE Seminar Hall",
+    "Bus Bay", "Admin Office", "Open Air Theatre", "Mechanical Workshop", "Chemistry Lab"
+]
+RACKS = [f"Rack {r}{n}" for r in "ABCDEF" for n in range(1, 7)]
+WORDS = [
+    "black", "blue", "red", "leather", "wallet", "charger", "laptop", "phone", "earphones",
+    "bottle", "umbrella", "calculator", "notebook", "keychain", "watch", "ring", "spectacles",
+    "hoodie", "backpack", "pendrive", "idcard", "textbook", "scarf", "bracelet", "lunchbox"
+]
+# (type, status, weight)
+ITEM_STATES = [
+    ("LOST", "OPEN", 20), ("LOST", "PENDING", 10), ("LOST", "AVAILABLE", 4), ("LOST", "RESOLVED", 6),
+    ("FOUND", "PENDING", 10), ("FOUND", "AVAILABLE", 22), ("FOUND", "CLAIMED", 6),
+    ("FOUND", "RETURNED", 14), ("FOUND", "ARCHIVED", 5), ("FOUND", "DISPOSED", 3)
+]
+AUDIT_ACTIONS = [
+    "LOGIN", "STORAGE_ASSIGNED", "CLAIM_APPROVED", "CLAIM_REJECTED", "PHYSICAL_HANDOVER",
+    "ITEM_ARCHIVED", "OWNER_NOTIFIED", "CLAIM_MESSAGE_SENT"
+]
+
+ADMIN_EMAIL = "bench-admin@rec.edu.in"
+USER_EMAIL = "bench-user-0@rec.edu.in"
+PASSWORD = "bench123"
+
+
+def _batched(docs, size):
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert(col, docs, batch_size):
+    ids = []
+    for batch in _batched(docs, batch_size):
+        ids += col.insert_many(batch, ordered=False).inserted_ids
+    return ids
+
+
+def _description(rng):
+    return " ".join(rng.sample(WORDS, rng.randint(3, 6)))
+
+
+def generate(db, items, users, claims, notifications, audit_logs, admins=5, days=180, seed=42, batch_size=5000):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    # Hash once: bcrypt per synthetic user would dominate generation time
+    password = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+    timings = {}
+
+    def timed(name, fn):
+        started = time.perf_counter()
+        result = fn()
+        timings[name] = round(time.perf_counter() - started, 2)
+        print(f"  {name}: {timings[name]}s")
+        return result
+
+    def user_docs():
+        for i in range(admins):
+            yield {
+                "name": f"Bench Admin {i}", "email": ADMIN_EMAIL if i == 0 else f"bench-admin-{i}@rec.edu.in",
+                "password": password, "role": "ADMIN", "roles": ["ADMIN"],
+                "registerNumber": f"ADMIN{i:03d}", "created_at": now
+            }
+        for i in range(users):
+            yield {
+                "name": f"Student {i}", "email": f"bench-user-{i}@rec.edu.in",
+                "password": password, "role": "USER", "roles": ["USER"],
+                "registerNumber": f"2{i:08d}", "created_at": now - timedelta(days=rng.randint(0, days))
+            }
+
+    user_ids = timed("users", lambda: _insert(db["users"], user_docs(), batch_size))
+    admin_ids, student_ids = user_ids[:admins], user_ids[admins:]
+
+    states = [(t, s) for t, s, _ in ITEM_STATES]
+    weights = [w for _, _, w in ITEM_STATES]
+
+    item_types = []
+
+    def item_docs():
+        for i in range(items):
+            item_type, status = rng.choices(states, weights)[0]
+            item_types.append(item_type)
+            reported = now - timedelta(minutes=rng.randint(0, days * 24 * 60))
+            doc = {
+                "type": item_type, "status": status,
+                "category": rng.choices(CATEGORIES, CATEGORY_WEIGHTS)[0],
+                "description": _description(rng),
+                "location": rng.choice(LOCATIONS),
+                "dateTime": reported,
+                "user_id": str(rng.choice(student_ids or admin_ids)),
+                "imageUrl": None,
+                "Lost_ID": f"LOST-{reported:%Y%m%d}-{i:06d}" if item_type == "LOST" else None,
+                "Found_ID": f"FND-{reported:%Y%m%d}-{i:06d}" if item_type == "FOUND" else None
+            }
+            if item_type == "FOUND" and status != "PENDING":
+                doc["storage_location"] = rng.choice(RACKS)
+                doc["verified_by"] = str(rng.choice(admin_ids))
+                doc["verified_at"] = reported + timedelta(hours=rng.randint(1, 48))
+            if status in ("RETURNED", "RESOLVED"):
+                doc["handed_over_at"] = reported + timedelta(hours=rng.randint(2, 24 * 14))
+            yield doc
+
+    item_ids = timed("items", lambda: _insert(db["items"], item_docs(), batch_size))
+    found_ids = [str(i) for i, t in zip(item_ids, item_types) if t == "FOUND"] or [str(i) for i in item_ids]
+
+    def claim_docs():
+        for i in range(claims):
+            submitted = now - timedelta(minutes=rng.randint(0, days * 24 * 60))
+            status = rng.choices(["PENDING", "APPROVED", "REJECTED"], [30, 45, 25])[0]
+            doc = {
+                "item_id": rng.choice(found_ids),
+                "claimant_id": str(rng.choice(student_ids or admin_ids)),
+                "verificationDetails": _description(rng),
+                "proofImageUrl": None,
+                "status": status,
+                "submissionDate": submitted,
+                "Claim_ID": f"CLM-{submitted:%Y%m%d}-{i:06d}"
+            }
+            if status != "PENDING":
+                hours = round(rng.uniform(0.5, 120), 2)
+                decided = submitted + timedelta(hours=hours)
+                prefix = "verified" if status == "APPROVED" else "rejected"
+                doc.update({"decided_at": decided, f"{prefix}_at": decided, "processing_hours": hours})
+            yield doc
+
+    timed("claims", lambda: _insert(db["claims"], claim_docs(), batch_size))
+
+    def notification_docs():
+        for _ in range(notifications):
+            yield {
+                "user_id": str(rng.choice(student_ids or admin_ids)),
+                "title": "Campus update",
+                "message": _description(rng),
+                "type": rng.choice(["SYSTEM", "CLAIM_APPROVED", "MATCH_FOUND", "CLAIM_MESSAGE"]),
+                "read": rng.random() < 0.6,
+                "created_at": now - timedelta(minutes=rng.randint(0, days * 24 * 60))
+            }
+
+    timed("notifications", lambda: _insert(db["notifications"], notification_docs(), batch_size))
+
+    def audit_docs():
+        for _ in range(audit_logs):
+            admin_id = rng.choice(admin_ids)
+            yield {
+                "admin_id": str(admin_id), "admin_name": "Bench Admin",
+                "action": rng.choice(AUDIT_ACTIONS), "target_type": "ITEM",
+                "target_id": rng.choice(found_ids), "details": {},
+                "timestamp": now - timedelta(minutes=rng.randint(0, days * 24 * 60))
+            }
+
+    timed("audit_logs", lambda: _insert(db["audit_logs"], audit_docs(), batch_size))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic LostLink dataset")
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017")
+    parser.add_argument("--database", default="lostlink_bench")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--claims", type=int, default=None, help="Defaults to 20%% of items")
+    parser.add_argument("--notifications", type=int, default=None, help="Defaults to 2x users")
+    parser.add_argument("--audit-logs", type=int, default=None, help="Defaults to 50%% of items")
+    parser.add_argument("--days", type=int, default=180, help="History span in days")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--keep", action="store_true", help="Append instead of dropping the database first")
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongodb_url)
+    if not args.keep:
+        client.drop_database(args.database)
+    db = client[args.database]
+
+    print(f"Generating dataset in {args.database}...")
+    timings = generate(
+        db,
+        items=args.items,
+        users=args.users,
+        claims=args.claims if args.claims is not None else args.items // 5,
+        notifications=args.notifications if args.notifications is not None else args.users * 2,
+        audit_logs=args.audit_logs if args.audit_logs is not None else args.items // 2,
+        days=args.days,
+        seed=args.seed,
+        batch_size=args.batch_size
+    )
+    print(f"Done in {round(sum(timings.values()), 2)}s. Admin login: {ADMIN_EMAIL} / {PASSWORD}")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
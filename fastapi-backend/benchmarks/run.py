@@ -0,0 +1,163 @@
+"""
+Drive the key API endpoints against a running server and report latency,
+throughput and MongoDB operations per request.
+
+    uvicorn main:app --port 8080 --workers 2   # with DATABASE_NAME=lostlink_bench
+    python -m benchmarks.run --base-url http://localhost:8080 --json bench.json
+    python -m benchmarks.run --compare bench.json   # exit 1 on p95 regressions
+
+MongoDB operation counts come from serverStatus opcounters, so they are only
+meaningful against a dedicated mongod that nothing else is using.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from pymongo import MongoClient
+from benchmarks.dataset import ADMIN_EMAIL, USER_EMAIL, PASSWORD
+
+# name -> (role, path)
+ENDPOINTS = {
+    "items_feed": ("user", "/api/items/feed"),
+    "admin_matches": ("admin", "/api/admin/items/matches"),
+    "admin_claims_prioritized": ("admin", "/api/admin/claims/prioritized"),
+    "analytics_trends": ("admin", "/api/admin/analytics/trends?days=30"),
+    "analytics_bottlenecks": ("admin", "/api/admin/analytics/bottlenecks"),
+    "analytics_category_performance": ("admin", "/api/admin/analytics/category-performance"),
+}
+OPCOUNTERS = ("query", "getmore", "command", "insert", "update", "delete")
+
+
+def login(base_url, email, password):
+    response = requests.post(f"{base_url}/api/auth/login", json={"email": email, "password": password}, timeout=30)
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def mongo_ops(admin_db):
+    if admin_db is None:
+        return None
+    counters = admin_db.command("serverStatus")["opcounters"]
+    return sum(counters.get(name, 0) for name in OPCOUNTERS)
+
+
+def bench_endpoint(base_url, token, path, total, concurrency, warmup, admin_db):
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    url = f"{base_url}{path}"
+
+    for _ in range(warmup):
+        session.get(url, timeout=120)
+
+    def call(_):
+        started = time.perf_counter()
+        response = session.get(url, timeout=120)
+        elapsed = (time.perf_counter() - started) * 1000
+        return elapsed, response.status_code, len(response.content)
+
+    ops_before = mongo_ops(admin_db)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(call, range(total)))
+    wall = time.perf_counter() - started
+    ops_after = mongo_ops(admin_db)
+
+    latencies = [r[0] for r in results if r[1] < 400]
+    errors = sum(1 for r in results if r[1] >= 400)
+    report = {
+        "requests": total,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "mean_ms": round(statistics.fmean(latencies), 1) if latencies else 0.0,
+        "throughput_rps": round(total / wall, 1) if wall else 0.0,
+        "avg_response_kb": round(statistics.fmean(r[2] for r in results) / 1024, 1) if results else 0.0,
+    }
+    if ops_before is not None:
+        # Subtract the serverStatus command issued for the "after" sample
+        report["db_ops_per_request"] = round((ops_after - ops_before - 1) / total, 1)
+    return report
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("p95_ms"):
+            continue
+        change = (current["p95_ms"] - previous["p95_ms"]) / previous["p95_ms"] * 100
+        current["p95_change_pct"] = round(change, 1)
+        if change > threshold:
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms (+{round(change, 1)}%)")
+    return regressions
+
+
+def print_table(results):
+    columns = ["p50_ms", "p95_ms", "p99_ms", "throughput_rps", "db_ops_per_request", "errors", "p95_change_pct"]
+    print(f"{'endpoint':<32}" + "".join(f"{c:>20}" for c in columns))
+    for name, report in results.items():
+        print(f"{name:<32}" + "".join(f"{str(report.get(c, '-')):>20}" for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LostLink API endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--mongodb-url", default="mongodb://localhost:27017",
+                        help="Used only to read opcounters; pass '' to skip query counting")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", nargs="*", choices=list(ENDPOINTS), help="Subset of endpoints to run")
+    parser.add_argument("--json", dest="json_path", help="Write results to this file")
+    parser.add_argument("--compare", help="Baseline results file to compare p95 latency against")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Allowed p95 regression in percent")
+    args = parser.parse_args()
+
+    tokens = {
+        "admin": login(args.base_url, ADMIN_EMAIL, PASSWORD),
+        "user": login(args.base_url, USER_EMAIL, PASSWORD),
+    }
+    client = MongoClient(args.mongodb_url) if args.mongodb_url else None
+    admin_db = client.admin if client else None
+
+    results = {}
+    for name in args.only or ENDPOINTS:
+        role, path = ENDPOINTS[name]
+        print(f"Running {name} ({args.requests} requests, concurrency {args.concurrency})...")
+        results[name] = bench_endpoint(
+            args.base_url, tokens[role], path, args.requests, args.concurrency, args.warmup, admin_db
+        )
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            regressions = compare(results, json.load(fh), args.threshold)
+
+    print_table(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    if client:
+        client.close()
+
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"- {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure application cold start: how long a fresh interpreter takes to
+import `main`, and which modules dominate that time.
+
+    python -m benchmarks.startup                 # 5 cold starts + import profile
+    python -m benchmarks.startup --runs 10 --top 30 --json startup.json
+    python -m benchmarks.startup --compare startup.json --threshold 15
+
+Every run is a separate `python -X importtime -c "import main"` process, so
+nothing is shared between samples beyond the OS file cache.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cold_start(env):
+    """Runs one interpreter importing main; returns (wall seconds, {module: (self_us, cumulative_us)})"""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if proc.returncode != 0:
+        sys.exit(f"import main failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return elapsed, modules
+
+
+def package_totals(modules):
+    """Sums self time per top-level package (fastapi, pydantic, app, ...)"""
+    totals = {}
+    for name, (self_us, _) in modules.items():
+        root = name.split(".")[0]
+        totals[root] = totals.get(root, 0) + self_us
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LostLink API cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20, help="Modules/packages to list by import time")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--compare", help="Previous --json output; exit 1 if median import time regresses")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Allowed regression in percent")
+    args = parser.parse_args()
+
+    # Keep the run independent of a developer's .env log settings
+    env = {**os.environ, "LOG_LEVEL": "WARNING"}
+    cold_start(env)  # warm the bytecode and file cache so runs are comparable
+
+    samples, modules = [], {}
+    for _ in range(args.runs):
+        elapsed, modules = cold_start(env)
+        samples.append(elapsed)
+
+    median_ms = statistics.median(samples) * 1000
+    import_ms = modules.get("main", (0, 0))[1] / 1000
+    print(f"cold start (process, {args.runs} runs): median {median_ms:.0f}ms, "
+          f"min {min(samples) * 1000:.0f}ms, max {max(samples) * 1000:.0f}ms")
+    print(f"import main: {import_ms:.0f}ms across {len(modules)} modules\n")
+
+    print(f"{'package':<28}{'self ms':>10}")
+    for root, self_us in sorted(package_totals(modules).items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"{root:<28}{self_us / 1000:>10.1f}")
+
+    print(f"\n{'module':<48}{'cumulative ms':>14}")
+    app_modules = {name: times for name, times in modules.items() if name == "main" or name.startswith("app.")}
+    for name, (_, cumulative_us) in sorted(app_modules.items(), key=lambda kv: kv[1][1], reverse=True)[:args.top]:
+        print(f"{name:<48}{cumulative_us / 1000:>14.1f}")
+
+    results = {
+        "cold_start_median_ms": round(median_ms, 1),
+        "import_main_ms": round(import_ms, 1),
+        "modules": len(modules),
+        "packages_ms": {root: round(us / 1000, 1) for root, us in package_totals(modules).items()},
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        change = (median_ms - baseline["cold_start_median_ms"]) / baseline["cold_start_median_ms"] * 100
+        print(f"\ncold start vs baseline: {baseline['cold_start_median_ms']:.0f}ms -> {median_ms:.0f}ms ({change:+.1f}%)")
+        if change > args.threshold:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
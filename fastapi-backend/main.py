@@ -1,19 +1,38 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import os
+from typing import Optional
 
 load_dotenv()
 
 from app.core.database import db
+from app.core.config import settings
+from app.core.errors import register_exception_handlers
+from app.core.instrumentation import instrumentation_middleware
+from app.core.logging_config import setup_logging, shutdown_logging
+from app.core.metrics import REGISTRY
+from app.core.scheduler import scheduler
+from app.core.jobs import register_jobs
+
+setup_logging()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Restart the queue listener a previous lifespan's shutdown stopped
+    setup_logging()
     db.connect()
+    await db.ensure_indexes()
+    if settings.SCHEDULER_ENABLED:
+        register_jobs(scheduler)
+        scheduler.start(db.db)
     yield
+    await scheduler.stop()
     db.close()
+    shutdown_logging()
 
 app = FastAPI(title="REC LostLink API", version="1.0.0", lifespan=lifespan)
 
@@ -38,30 +57,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from fastapi.responses import JSONResponse
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    import traceback
-    print(f"GLOBAL ERROR: {str(exc)}")
-    traceback.print_exc()
-    return JSONResponse(
-        status_code=500,
-        content={"detail": f"Internal Server Error: {str(exc)}\n\n{traceback.format_exc()}"}
-    )
+# Request ids, per-request query counts (Server-Timing header + query budget warnings) and metrics
+app.middleware("http")(instrumentation_middleware)
+
+register_exception_handlers(app)
 
 
-from app.api import auth, items, claims, admin, notifications
+from app.api import auth, items, claims, admin, notifications, sync
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(items.router, prefix="/api/items", tags=["items"])
 app.include_router(claims.router, prefix="/api/claims", tags=["claims"])
 app.include_router(admin.router, prefix="/api/admin", tags=["admin"])
 app.include_router(notifications.router, prefix="/api/notifications", tags=["notifications"])
+app.include_router(sync.router, prefix="/api/sync", tags=["sync"])
 
 # Mount static files
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 os.makedirs(static_dir, exist_ok=True)
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: Optional[str] = Header(None)):
+    """Prometheus text-format metrics for this worker process"""
+    if settings.METRICS_TOKEN and authorization != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=401, detail="Not authorized")
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to REC LostLink API"}
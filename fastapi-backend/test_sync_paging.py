@@ -0,0 +1,72 @@
+"""
+Delta sync regression test: a snapshot of old documents must page to the end.
+
+Runs against a disposable local mongod (never a shared or production
+cluster), like the benchmarks:
+
+    SYNC_TEST_MONGODB_URL=mongodb://localhost:27017 python -m pytest test_sync_paging.py
+    python test_sync_paging.py
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import ServerSelectionTimeoutError
+from app.core.config import settings
+from app.core.sync import fetch_changes
+
+MONGODB_URL = os.getenv("SYNC_TEST_MONGODB_URL", "mongodb://localhost:27017")
+DATABASE_NAME = "lostlink_sync_test"
+
+
+async def _page_through_old_snapshot():
+    client = AsyncIOMotorClient(MONGODB_URL, serverSelectionTimeoutMS=2000)
+    try:
+        await client.admin.command("ping")
+    except ServerSelectionTimeoutError:
+        client.close()
+        return None
+
+    db = client[DATABASE_NAME]
+    await client.drop_database(DATABASE_NAME)
+    page_size = settings.SYNC_PAGE_SIZE
+    settings.SYNC_PAGE_SIZE = 3
+    try:
+        # Older than the tombstone retention, as after the updated_at backfill
+        old = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS * 2)
+        await db["items"].insert_many([
+            {"type": "FOUND", "status": "AVAILABLE", "category": "Bag", "user_id": "reporter",
+             "dateTime": old, "updated_at": old + timedelta(minutes=i)}
+            for i in range(7)
+        ])
+
+        token, seen, responses = None, set(), []
+        for _ in range(10):
+            response = await fetch_changes(db, "student", token)
+            responses.append(response)
+            seen |= {str(item["_id"]) for item in response["items"]}
+            token = response["token"]
+            if not response["has_more"]:
+                break
+        return responses, seen
+    finally:
+        settings.SYNC_PAGE_SIZE = page_size
+        await client.drop_database(DATABASE_NAME)
+        client.close()
+
+
+def test_snapshot_of_old_documents_pages_to_the_end():
+    result = asyncio.run(_page_through_old_snapshot())
+    if result is None:
+        import pytest
+        pytest.skip(f"No mongod reachable at {MONGODB_URL}")
+    responses, seen = result
+
+    assert [r["has_more"] for r in responses] == [True, True, False]
+    assert not any(r["reset"] for r in responses)
+    assert len(seen) == 7
+
+
+if __name__ == "__main__":
+    test_snapshot_of_old_documents_pages_to_the_end()
+    print("Snapshot paging OK")
@@ -0,0 +1,31 @@
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+load_dotenv()
+
+from app.core.item_tiering import tier_items
+from app.core.config import settings
+
+# Moves finished items (resolved, returned, archived, disposed) that have been
+# idle for a while from items into items_archive. The API's scheduler runs the
+# same job daily; use this for a first large backfill or by hand.
+async def main():
+    parser = argparse.ArgumentParser(description="Move long-finished items into items_archive")
+    parser.add_argument("--older-than-days", type=int, default=settings.TIERING_AFTER_DAYS)
+    parser.add_argument("--batch-size", type=int, default=settings.TIERING_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=1000000)
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(os.getenv("MONGODB_URL", settings.MONGODB_URL))
+    db = client[os.getenv("DATABASE_NAME", settings.DATABASE_NAME)]
+
+    print(f"Moving items finished more than {args.older_than_days} days ago to items_archive...")
+    result = await tier_items(db, args.older_than_days, args.batch_size, args.max_batches)
+    print(f"Moved {result['moved']} items in {result['batches']} batches (cutoff {result['cutoff'].isoformat()})")
+    client.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 import React, { createContext, useState, useEffect } from 'react';
 import AsyncStorage from '@react-native-async-storage/async-storage';
-import api from '../services/api';
+import api, { logoutSession } from '../services/api';
+import { clearSyncCache } from '../services/syncService';
 
 export const AuthContext = createContext();
 
@@ -14,13 +15,14 @@ export const AuthProvider = ({ children }) => {
         setIsLoading(true);
         try {
             const response = await api.post('/api/auth/login', { email, password });
-            const { token, id, email: userEmail, roles, name, registerNumber } = response.data;
+            const { token, refreshToken, id, email: userEmail, roles, name, registerNumber } = response.data;
 
             const userInfoData = { id, email: userEmail, roles, name, registerNumber };
             setUserInfo(userInfoData);
             setUserToken(token);
 
             await AsyncStorage.setItem('userToken', token);
+            await AsyncStorage.setItem('refreshToken', refreshToken);
             await AsyncStorage.setItem('userInfo', JSON.stringify(userInfoData));
         } catch (error) {
             console.log('Login error', error);
@@ -32,10 +34,13 @@ export const AuthProvider = ({ children }) => {
 
     const logout = async () => {
         setIsLoading(true);
+        await logoutSession();
         setUserToken(null);
         setUserInfo(null);
         await AsyncStorage.removeItem('userToken');
+        await AsyncStorage.removeItem('refreshToken');
         await AsyncStorage.removeItem('userInfo');
+        await clearSyncCache();
         setIsLoading(false);
     };
 
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { View, Text, FlatList, StyleSheet, ActivityIndicator, TouchableOpacity, Image, RefreshControl } from 'react-native';
 import api, { FILE_BASE_URL } from '../../services/api';
+import { getFeedItems } from '../../services/syncService';
 import { COLORS } from '../../constants/theme';
 
 const FoundItemsScreen = ({ navigation }) => {
@@ -10,8 +11,7 @@ const FoundItemsScreen = ({ navigation }) => {
 
     const fetchItems = async () => {
         try {
-            const response = await api.get('/api/items/feed');
-            setItems(response.data);
+            setItems(await getFeedItems());
         } catch (error) {
             console.log('Error fetching feed', error);
         } finally {
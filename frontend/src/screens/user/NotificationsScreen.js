@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { View, Text, StyleSheet, FlatList, TouchableOpacity, SafeAreaView, ActivityIndicator, RefreshControl } from 'react-native';
 import { COLORS } from '../../constants/theme';
 import api from '../../services/api';
+import { getNotifications } from '../../services/syncService';
 
 const NotificationsScreen = ({ navigation }) => {
     const [notifications, setNotifications] = useState([]);
@@ -14,11 +15,11 @@ const NotificationsScreen = ({ navigation }) => {
 
     const fetchNotifications = async () => {
         try {
-            const res = await api.get('/api/notifications/me');
-            setNotifications(res.data);
+            const notifications = await getNotifications();
+            setNotifications(notifications);
 
             // Mark all as read when opening the screen
-            const unreadIds = res.data.filter(n => !n.read).map(n => n._id);
+            const unreadIds = notifications.filter(n => !n.read).map(n => n._id);
             if (unreadIds.length > 0) {
                 await Promise.all(unreadIds.map(id => api.put(`/api/notifications/${id}/read`)));
             }
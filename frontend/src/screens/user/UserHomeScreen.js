@@ -3,6 +3,7 @@ import { View, Text, TouchableOpacity, StyleSheet, ScrollView, Image, SafeAreaVi
 import { AuthContext } from '../../context/AuthContext';
 import { COLORS } from '../../constants/theme';
 import api from '../../services/api';
+import { getNotifications } from '../../services/syncService';
 
 const { width } = Dimensions.get('window');
 
@@ -22,8 +23,8 @@ const UserHomeScreen = ({ navigation }) => {
 
     const fetchNotifications = async () => {
         try {
-            const res = await api.get('/api/notifications/me');
-            const unread = res.data.filter(n => !n.read).length;
+            const notifications = await getNotifications();
+            const unread = notifications.filter(n => !n.read).length;
             setUnreadNotifications(unread);
         } catch (error) {
             console.log('Error fetching notifications:', error);
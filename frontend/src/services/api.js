@@ -48,19 +48,66 @@ api.interceptors.request.use(
   }
 );
 
+// Access tokens are short-lived; renew them with the stored refresh token.
+// Concurrent 401s share one refresh call so the refresh token is rotated once.
+let refreshPromise = null;
+
+const refreshAccessToken = () => {
+  if (!refreshPromise) {
+    refreshPromise = (async () => {
+      const refreshToken = await AsyncStorage.getItem('refreshToken');
+      if (!refreshToken) {
+        throw new Error('No refresh token');
+      }
+      const { data } = await axios.post(`${BASE_URL}/api/auth/refresh`, { refreshToken }, { timeout: 15000 });
+      await AsyncStorage.setItem('userToken', data.token);
+      await AsyncStorage.setItem('refreshToken', data.refreshToken);
+      return data.token;
+    })().finally(() => {
+      refreshPromise = null;
+    });
+  }
+  return refreshPromise;
+};
+
 api.interceptors.response.use(
   (response) => {
     return response;
   },
   async (error) => {
-    if (error.response && error.response.status === 401) {
-      console.log('Session expired, logging out...');
-      await AsyncStorage.removeItem('userToken');
-      await AsyncStorage.removeItem('userInfo');
+    const original = error.config;
+    if (error.response && error.response.status === 401 && original && !original._retried) {
+      original._retried = true;
+      try {
+        const token = await refreshAccessToken();
+        original.headers.Authorization = `Bearer ${token}`;
+        return api(original);
+      } catch (refreshError) {
+        console.log('Session expired, logging out...');
+        await AsyncStorage.removeItem('userToken');
+        await AsyncStorage.removeItem('refreshToken');
+        await AsyncStorage.removeItem('userInfo');
+        await AsyncStorage.removeItem('syncCache');
+      }
     }
     return Promise.reject(error);
   }
 );
 
+// Ends the server-side session before the caller clears its tokens. Plain axios
+// skips the 401 handling above; a failed call (offline, session already gone)
+// is ignored since the refresh session expires on its own.
+export const logoutSession = async () => {
+  const refreshToken = await AsyncStorage.getItem('refreshToken');
+  if (!refreshToken) {
+    return;
+  }
+  try {
+    await axios.post(`${BASE_URL}/api/auth/logout`, { refreshToken }, { timeout: 5000 });
+  } catch (error) {
+    console.log('Logout request failed, clearing the local session anyway', error);
+  }
+};
+
 export const FILE_BASE_URL = BASE_URL + '/';
 export default api;
@@ -0,0 +1,65 @@
+import AsyncStorage from '@react-native-async-storage/async-storage';
+import api from './api';
+
+// Local cache kept up to date with GET /api/sync: after the first snapshot only
+// items, claims and notifications that changed since the stored token are downloaded.
+const CACHE_KEY = 'syncCache';
+const FEED_STATUSES = ['PENDING', 'OPEN', 'AVAILABLE'];
+const COLLECTIONS = ['items', 'claims', 'notifications'];
+
+const emptyCache = () => ({ token: null, items: {}, claims: {}, notifications: {}, users: {} });
+
+let inFlight = null;
+
+const loadCache = async () => {
+    const raw = await AsyncStorage.getItem(CACHE_KEY);
+    return raw ? JSON.parse(raw) : emptyCache();
+};
+
+const applyChanges = (cache, data) => {
+    const next = data.reset ? emptyCache() : cache;
+    COLLECTIONS.forEach((name) => {
+        data[name].forEach((doc) => { next[name][doc._id] = doc; });
+        (data.deleted[name] || []).forEach((id) => { delete next[name][id]; });
+    });
+    Object.assign(next.users, data.users);
+    next.token = data.token;
+    return next;
+};
+
+const runSync = async () => {
+    let cache = await loadCache();
+    let hasMore = true;
+    while (hasMore) {
+        const res = await api.get('/api/sync', { params: cache.token ? { since: cache.token } : {} });
+        cache = applyChanges(cache, res.data);
+        hasMore = res.data.has_more;
+    }
+    await AsyncStorage.setItem(CACHE_KEY, JSON.stringify(cache));
+    return cache;
+};
+
+// Concurrent callers (e.g. two screens focusing at once) share one sync
+export const sync = () => {
+    if (!inFlight) {
+        inFlight = runSync().finally(() => { inFlight = null; });
+    }
+    return inFlight;
+};
+
+const byNewest = (field) => (a, b) => new Date(b[field]) - new Date(a[field]);
+
+export const getFeedItems = async () => {
+    const cache = await sync();
+    return Object.values(cache.items)
+        .filter((item) => FEED_STATUSES.includes(item.status))
+        .map((item) => ({ ...item, user: cache.users[item.user_id] }))
+        .sort(byNewest('dateTime'));
+};
+
+export const getNotifications = async () => {
+    const cache = await sync();
+    return Object.values(cache.notifications).sort(byNewest('created_at'));
+};
+
+export const clearSyncCache = () => AsyncStorage.removeItem(CACHE_KEY);